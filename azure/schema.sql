@@ -30,7 +30,8 @@ CREATE TABLE teams (
     losses INTEGER DEFAULT 0,
     points INTEGER DEFAULT 0,
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (division_id) REFERENCES divisions(division_id)
+    -- divisions is unique on (division_id, season_id), not division_id alone
+    FOREIGN KEY (division_id, season_id) REFERENCES divisions(division_id, season_id)
 );
 
 CREATE INDEX idx_teams_division_season ON teams(division_id, season_id);
@@ -88,7 +89,7 @@ CREATE TABLE bowling_stats (
     overs DECIMAL(5,1),
     wickets INTEGER DEFAULT 0,
     runs_conceded INTEGER DEFAULT 0,
-    economy DECIMAL(4,2),
+    economy DECIMAL(5,2),  -- a one-ball spell can go past 99.99
     average DECIMAL(5,2),
     strike_rate DECIMAL(5,2),
     four_wickets INTEGER DEFAULT 0,
@@ -186,7 +187,7 @@ CREATE TABLE bowling_details (
     maidens INTEGER DEFAULT 0,
     runs INTEGER DEFAULT 0,
     wickets INTEGER DEFAULT 0,
-    economy DECIMAL(4,2),
+    economy DECIMAL(5,2),  -- a one-ball spell can go past 99.99
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (scorecard_id) REFERENCES scorecards(id) ON DELETE CASCADE,
     FOREIGN KEY (player_id) REFERENCES players(player_id) ON DELETE SET NULL
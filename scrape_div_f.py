@@ -1,22 +1,45 @@
 #!/usr/bin/env python3
 """
 Quick script to scrape just Division F with scorecards
+
+    python3 scrape_div_f.py                                   # live
+    python3 scrape_div_f.py --record=cassettes/div_f.json.gz  # live, saving every page
+    python3 scrape_div_f.py --replay=cassettes/div_f.json.gz  # offline, no network or sleeps
 """
 
-from scrapers.arcl_scraper import ARCLDataScraper
+import time
+from scrapers.arcl_scraper import ARCLDataScraper, _cassette_from_flags, _flag_value
+
+cassette = _cassette_from_flags()
+replaying = cassette is not None and cassette.replaying
 
-scraper = ARCLDataScraper()
+# Replays write next to the live data rather than over it
+scraper = ARCLDataScraper(
+    cassette=cassette,
+    output_dir=_flag_value("--output-dir", "data/replay" if replaying else "data"),
+    parser=_flag_value("--parser", None)
+)
 
 # Scrape Division F (ID=8) with scorecards
 print("\n🎯 Scraping Division F with ALL scorecard data...")
 print("   This will extract ALL players from match scorecards")
-print("   Estimated time: ~3 minutes\n")
+if replaying:
+    print(f"   Replaying {len(cassette.pages)} recorded pages from {cassette.path}\n")
+else:
+    print("   Estimated time: ~3 minutes\n")
 
+start = time.perf_counter()
 scraper.scrape_division(
     division_id=8,
     season_id=66,
     division_name="Div F - Summer 2025",
     include_scorecards=True
 )
+elapsed = time.perf_counter() - start
+
+if cassette:
+    cassette.save()
+    if cassette.misses:
+        print(f"⚠️  {len(cassette.misses)} URLs were not in the cassette")
 
-print("\n✅ Complete! Check data/div_8_season_66.json for updated player data")
+print(f"\n✅ Complete in {elapsed:.2f}s! Check {scraper.output_dir}/div_8_season_66.json for updated player data")
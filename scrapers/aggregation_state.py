@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Aggregation State - Persisted running player totals for one division/season
+
+aggregate_players_from_scorecards rebuilds every total from the whole
+scorecard list. This keeps the totals between runs instead: per-player
+running sums keyed by (name, team), plus each folded match's contribution so
+an edited scorecard can be retracted and re-applied. Updating for new or
+corrected matches costs O(changed matches).
+"""
+
+import hashlib
+import json
+import os
+from .player_aggregator import (INVALID_BATTING_NAMES, INVALID_BOWLING_NAMES, is_player_name, generate_team_id,
+                                _finalize_batting_stats, _finalize_bowling_stats, _rank_players)
+from .records import as_scorecard, count, balls_value
+
+
+# Column order of the stored rows
+BATTING_FIELDS = ('innings', 'runs', 'balls', 'fours', 'sixes', 'not_outs')
+BOWLING_FIELDS = ('innings', 'balls', 'maidens', 'runs', 'wickets', 'wides', 'no_balls')
+
+
+def scorecard_hash(scorecard):
+    """Fingerprint of the parts of a scorecard that feed player stats (over its JSON form)"""
+    scorecard = as_scorecard(scorecard)
+    relevant = [scorecard.team1, scorecard.team2,
+                scorecard.team1_innings.to_dict(), scorecard.team2_innings.to_dict()]
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True).encode()).hexdigest()
+
+
+def match_contribution(scorecard):
+    """
+    One match's rows, validated and converted once
+
+    Returns:
+        dict: {'batting': [[name, team, 1, runs, balls, fours, sixes, not_out]],
+               'bowling': [[name, team, 1, balls, maidens, runs, wickets, wides, no_balls]]}
+    """
+    scorecard = as_scorecard(scorecard)
+    team1, team2 = scorecard.team1, scorecard.team2
+    team1_innings, team2_innings = scorecard.team1_innings, scorecard.team2_innings
+
+    batting = []
+    for innings, team in ((team1_innings, team1), (team2_innings, team2)):
+        for batsman in innings.batting:
+            name = batsman.name.strip()
+            if not is_player_name(name, INVALID_BATTING_NAMES):
+                continue
+            batting.append([name, team, 1, count(batsman.runs), count(batsman.balls),
+                            count(batsman.fours), count(batsman.sixes), int(batsman.not_out)])
+
+    # Each team's bowlers are listed in the other team's innings
+    bowling = []
+    for innings, team in ((team2_innings, team1), (team1_innings, team2)):
+        for bowler in innings.bowling:
+            name = bowler.name.strip()
+            if not is_player_name(name, INVALID_BOWLING_NAMES):
+                continue
+            bowling.append([name, team, 1, balls_value(bowler.balls), count(bowler.maidens),
+                            count(bowler.runs), count(bowler.wickets),
+                            count(bowler.wides), count(bowler.no_balls)])
+
+    return {'batting': batting, 'bowling': bowling}
+
+
+class AggregationState:
+    """
+    Running batting/bowling totals for a division/season
+
+    Args:
+        division_id: Division ID (for team IDs)
+        season_id: Season ID (for team IDs)
+    """
+
+    VERSION = 2
+
+    def __init__(self, division_id, season_id):
+        self.division_id = division_id
+        self.season_id = season_id
+        # (name, team) -> [innings, runs, ...] in BATTING_FIELDS / BOWLING_FIELDS order
+        self.batting = {}
+        self.bowling = {}
+        # match_id -> {'hash': ..., 'batting': rows, 'bowling': rows}
+        self.matches = {}
+
+    @classmethod
+    def load(cls, path, division_id, season_id):
+        """Load a saved state, or start an empty one if missing, unreadable or for another division"""
+        state = cls(division_id, season_id)
+        if not os.path.exists(path):
+            return state
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            if (saved.get('version') != cls.VERSION or saved.get('division_id') != division_id
+                    or saved.get('season_id') != season_id):
+                return state
+            state.matches = saved['matches']
+            state.batting = {(row[0], row[1]): row[2:] for row in saved['batting']}
+            state.bowling = {(row[0], row[1]): row[2:] for row in saved['bowling']}
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            print(f"  ⚠️  Ignoring unreadable {path}: {e}")
+            return cls(division_id, season_id)
+        return state
+
+    def save(self, path):
+        """Write the state via a temp file + rename"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'version': self.VERSION,
+                'division_id': self.division_id,
+                'season_id': self.season_id,
+                'batting': [list(key) + totals for key, totals in self.batting.items()],
+                'bowling': [list(key) + totals for key, totals in self.bowling.items()],
+                'matches': self.matches
+            }, f)
+        os.replace(tmp_path, path)
+
+    def _add(self, totals, rows, sign):
+        for row in rows:
+            key = (row[0], row[1])
+            current = totals.get(key)
+            if current is None:
+                current = totals[key] = [0] * (len(row) - 2)
+            for i, value in enumerate(row[2:]):
+                current[i] += sign * value
+            if current[0] <= 0:
+                del totals[key]  # Player only appeared in retracted matches
+
+    def fold(self, scorecard):
+        """
+        Apply a scorecard, retracting its previous version first if it changed
+
+        Returns:
+            bool: False if this exact scorecard was already folded in
+        """
+        scorecard = as_scorecard(scorecard)
+        match_id = scorecard.match_id
+        digest = scorecard_hash(scorecard)
+        previous = self.matches.get(match_id)
+        if previous and previous['hash'] == digest:
+            return False
+        if previous:
+            self.retract(match_id)
+        contribution = match_contribution(scorecard)
+        self._add(self.batting, contribution['batting'], 1)
+        self._add(self.bowling, contribution['bowling'], 1)
+        self.matches[match_id] = dict(contribution, hash=digest)
+        return True
+
+    def retract(self, match_id):
+        """Take a folded match back out of the totals"""
+        contribution = self.matches.pop(str(match_id), None)
+        if contribution is None:
+            return False
+        self._add(self.batting, contribution['batting'], -1)
+        self._add(self.bowling, contribution['bowling'], -1)
+        return True
+
+    def sync(self, scorecards, fresh=()):
+        """
+        Bring the totals in line with a division's scorecards
+
+        Only `fresh` scorecards (just fetched, possibly edited) are fingerprinted;
+        of the rest, only ones never folded are applied. Folded matches missing
+        from `scorecards` are retracted.
+
+        Args:
+            scorecards: Every scorecard the division's stats should cover
+            fresh: Scorecards fetched this run
+
+        Returns:
+            tuple: (matches folded, matches retracted)
+        """
+        folded = sum(1 for scorecard in fresh if self.fold(scorecard))
+        scorecards = [as_scorecard(scorecard) for scorecard in scorecards]
+        for scorecard in scorecards:
+            if scorecard.match_id not in self.matches:
+                folded += self.fold(scorecard)
+        current = {scorecard.match_id for scorecard in scorecards}
+        retracted = sum(1 for match_id in list(self.matches) if match_id not in current and self.retract(match_id))
+        return folded, retracted
+
+    def finalize(self, order=None):
+        """
+        Player lists in aggregate_players_from_scorecards' format
+
+        Ties in runs/wickets keep first-appearance order, walking matches in
+        `order` (schedule order), so ranks match a full recompute.
+
+        Args:
+            order: Match IDs in scorecard-file order (default: fold order)
+
+        Returns:
+            tuple: (batsmen_list, bowlers_list)
+        """
+        order = [str(match_id) for match_id in order] if order is not None else list(self.matches)
+        team_ids = {}
+
+        def accumulators(keys, totals, fields):
+            # aggregate_players_from_scorecards' per-player stats dicts, in first-seen order
+            stats = {}
+            for name, team in keys:
+                if team not in team_ids:
+                    team_ids[team] = generate_team_id(team, self.division_id, self.season_id)
+                stats[(name, team)] = dict(zip(fields, totals[(name, team)]), team_id=team_ids[team])
+            return stats
+
+        batsmen = _finalize_batting_stats(
+            accumulators(self._first_seen(order, 'batting', self.batting), self.batting, BATTING_FIELDS))
+        bowlers = _finalize_bowling_stats(
+            accumulators(self._first_seen(order, 'bowling', self.bowling), self.bowling, BOWLING_FIELDS))
+        _rank_players(batsmen, bowlers)
+        return batsmen, bowlers
+
+    def _first_seen(self, order, kind, totals):
+        """Player keys in order of first appearance across the ordered matches"""
+        seen = {}
+        for match_id in order:
+            for row in self.matches.get(match_id, {}).get(kind, []):
+                seen.setdefault((row[0], row[1]), None)
+        # Matches folded but not in `order` go last
+        for key in totals:
+            seen.setdefault(key, None)
+        return list(seen)
@@ -4,76 +4,306 @@ ARCL Data Scraper - Main Orchestrator
 Modular architecture with separate scrapers for each data type
 """
 
+import asyncio
+import functools
 import json
 import os
+import time
 from datetime import datetime
 from scrapers import TeamsScraper, BatsmenScraper, BowlersScraper, StandingsScraper, ScheduleScraper, ScorecardScraper
-from scrapers.boundary_aggregator import aggregate_boundaries, merge_boundaries_with_batsmen
-from scrapers.player_aggregator import aggregate_players_from_scorecards
+from scrapers.async_fetcher import AsyncFetcher
+from scrapers.http_cache import HTTPCache
+from scrapers.rate_limiter import get_default_limiter
+from scrapers.transport import Transport
+from scrapers.retry import FetchError, get_default_circuit_breaker
+from scrapers.cassette import Cassette
+from scrapers.journal import ScrapeJournal
+from scrapers.records import load_scorecards, scorecards_to_json
+from scrapers.schedule_diff import ScheduleDiff, diff_schedules
+from scrapers.scorecard_pipeline import ScorecardPipeline
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from scrapers.aggregation_state import AggregationState
+from scrapers.career_aggregator import write_career_stats
+from scrapers.player_index import PlayerIndex
+from scrapers.sqlite_store import SQLiteStore
+from scrapers.postgres_ingest import PostgresIngest
+from scrapers.publisher import publish_dir
+from scrapers.scorecard_shards import write_shards, shard_summary
 
 
 class ARCLDataScraper:
     """Main orchestrator for all ARCL data scraping"""
     
-    def __init__(self):
-        self.teams_scraper = TeamsScraper()
-        self.batsmen_scraper = BatsmenScraper()
-        self.bowlers_scraper = BowlersScraper()
-        self.standings_scraper = StandingsScraper()
-        self.schedule_scraper = ScheduleScraper()
-        self.scorecard_scraper = ScorecardScraper()
+    def __init__(self, max_concurrency=4, cache_dir=None, rate=None, burst=None, transport=None,
+                 cassette=None, output_dir='data', parser=None, incremental=False, refetch=None,
+                 parse_workers=0, journal=None, division_concurrency=3, refresh=False, player_index=None):
+        # One fetcher for every scraper so the per-host limit is global
+        self.fetcher = AsyncFetcher(max_per_host=max_concurrency)
+        # Optional conditional-GET cache shared by all scrapers
+        self.cache = HTTPCache(cache_dir) if cache_dir else None
+        # Process-wide token bucket - every scraper and thread draws from it
+        self.rate_limiter = get_default_limiter()
+        self.rate_limiter.configure(rate=rate, burst=burst)
+        # One pooled keep-alive session, sized so every in-flight fetch gets a connection
+        self.transport = transport or Transport(pool_maxsize=max(max_concurrency, 4))
+        # Per-endpoint breaker so a failing page type is shed across all divisions
+        self.circuit_breaker = get_default_circuit_breaker()
+        # Record pages to / replay pages from a cassette file (None = live)
+        self.cassette = cassette
+        self.output_dir = output_dir
+        # Only fetch scorecards missing from the existing file (plus any in refetch)
+        self.incremental = incremental
+        self.refetch = {str(match_id) for match_id in (refetch or [])}
+        # Fetch the schedule first and re-scrape only what its diff against the last run touches
+        self.refresh = refresh
+        # Parse scorecards in a process pool via ScorecardPipeline (0 = in fetch threads)
+        self.max_concurrency = max_concurrency
+        self.parse_workers = parse_workers
+        self._parse_pool = None
+        # One thread for division file I/O and aggregation, off the event loop. Being one thread,
+        # it is also the only one touching the player index and io_stats, so neither needs a lock.
+        self._work_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arcl-work')
+        # Divisions scraped at once - requests still share the per-host limit and token bucket
+        self.division_concurrency = max(1, division_concurrency)
+        # Checkpoint journal of completed pages/scorecards so a crashed run can resume (None = off)
+        self.journal = journal
+        # Structured fetch failures per division, e.g. {"div_8_season_66": {"batsmen": [...]}}
+        self.failures = {}
+        # Stable player_id for every player link seen, persisted across runs
+        self.player_index = player_index or PlayerIndex.load(os.path.join(output_dir, 'player_index.json'))
+        # Output file reads/writes, to show what one write per division costs
+        self.io_stats = {'reads': 0, 'writes': 0, 'bytes': 0, 'seconds': 0.0}
+        
+        shared = {
+            'fetcher': self.fetcher,
+            'cache': self.cache,
+            'rate_limiter': self.rate_limiter,
+            'transport': self.transport,
+            'cassette': self.cassette,
+            'parser': parser
+        }
+        self.teams_scraper = TeamsScraper(**shared)
+        self.batsmen_scraper = BatsmenScraper(**shared)
+        self.bowlers_scraper = BowlersScraper(**shared)
+        self.standings_scraper = StandingsScraper(**shared)
+        self.schedule_scraper = ScheduleScraper(**shared)
+        self.scorecard_scraper = ScorecardScraper(**shared)
+        self._shared = shared
+        
+        # Division document section -> scraper that fills it
+        self.section_scrapers = {
+            'teams': self.teams_scraper,
+            'batsmen': self.batsmen_scraper,
+            'bowlers': self.bowlers_scraper,
+            'standings': self.standings_scraper,
+            'schedule': self.schedule_scraper
+        }
+    
+    def _division_scrapers(self, label=None):
+        """
+        Fresh scrapers for one division
+        
+        Divisions run concurrently, so each gets its own instances (and error
+        lists, and a label on its progress lines) while still sharing the
+        fetcher, cache, limiter and transport.
+        """
+        scrapers = {section: type(scraper)(**self._shared) for section, scraper in self.section_scrapers.items()}
+        scrapers['scorecards'] = ScorecardScraper(**self._shared)
+        for scraper in scrapers.values():
+            scraper.label = label
+        return scrapers
     
     def scrape_division(self, division_id, season_id, division_name, include_scorecards=False):
         """Scrape all data for a division"""
-        print(f"\n📊 Scraping {division_name} (Div ID: {division_id}, Season: {season_id})")
-        print("=" * 60)
+        return asyncio.run(self.ascrape_division(division_id, season_id, division_name, include_scorecards))
+    
+    async def ascrape_division(self, division_id, season_id, division_name, include_scorecards=False):
+        """Scrape all data for a division, fetching its five pages in parallel"""
+        # Divisions run concurrently, so every line they print is tagged with the division
+        tag = f"[{division_name}]"
+        scrapers = self._division_scrapers(tag)
+        print(f"\n{tag} 📊 Scraping (Div ID: {division_id}, Season: {season_id})")
+        
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = os.path.join(self.output_dir, f"div_{division_id}_season_{season_id}.json")
+        
+        # Resuming: skip work the journal says is already on disk
+        if self.journal and os.path.exists(filename):
+            if self.journal.is_done('division', division_id, season_id):
+                print(f"{tag} ⏭️  Already complete in journal, skipping")
+                return await self._in_worker(self._load_division, filename)
+            if self.journal.is_done('pages', division_id, season_id):
+                # Pages were saved but scorecards failed - redo only the scorecards
+                print(f"{tag} ⏭️  Division pages already saved, resuming at scorecards")
+                data = await self._in_worker(self._load_division, filename)
+                if include_scorecards:
+                    await self.ascrape_scorecards(division_id, season_id, division_name, data['schedule'],
+                                                  data['teams'], scrapers['scorecards'], data=data)
+                    await self._in_worker(self._write_json, filename, data)
+                self._mark_division_done(division_id, season_id)
+                return data
+        
+        # The last run's document is only needed to diff its schedule or to cover a failed fetch
+        previous = await self._in_worker(self._load_division, filename) if self.refresh else None
+        diff = None
+        if self.refresh and previous and previous.get('schedule'):
+            # Refresh: one schedule request decides what else is worth fetching
+            pages = await self._fetch_sections(scrapers, division_id, season_id, ['schedule'])
+            if scrapers['schedule'].errors:
+                diff = ScheduleDiff()  # Schedule fetch failed - nothing to go on, change nothing
+            else:
+                diff = diff_schedules(previous['schedule'], pages['schedule'])
+            print(f"{tag} 🔍 Schedule diff: {diff.summary()}")
+            pages.update(await self._fetch_sections(
+                scrapers, division_id, season_id, self._sections_affected(diff, include_scorecards)))
+            for section in self.section_scrapers:
+                pages.setdefault(section, previous.get(section, []))
+        else:
+            pages = await self._fetch_sections(scrapers, division_id, season_id, list(self.section_scrapers))
         
         data = {
             "division_id": division_id,
             "season_id": season_id,
             "division_name": division_name,
             "last_updated": datetime.now().isoformat(),
-            "teams": self.teams_scraper.scrape(division_id, season_id),
-            "batsmen": self.batsmen_scraper.scrape(division_id, season_id, limit=150),  # Increased to capture all teams
-            "bowlers": self.bowlers_scraper.scrape(division_id, season_id, limit=150),  # Increased to capture all teams
-            "standings": self.standings_scraper.scrape(division_id, season_id),
-            "schedule": self.schedule_scraper.scrape(division_id, season_id)
+            "teams": pages['teams'],
+            "batsmen": pages['batsmen'],
+            "bowlers": pages['bowlers'],
+            "standings": pages['standings'],
+            "schedule": pages['schedule']
         }
         
-        # Save to JSON
-        os.makedirs('data', exist_ok=True)
-        filename = f"data/div_{division_id}_season_{season_id}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Don't let a failed fetch wipe out previously scraped data
+        failed = self._collect_failures(division_id, season_id, scrapers)
+        if failed and not self.refresh:
+            previous = await self._in_worker(self._load_division, filename)
+        if failed and previous:
+            for section in failed:
+                if previous.get(section):
+                    data[section] = previous[section]
+                    print(f"{tag} ⚠️  Kept previous {section} (fetch failed)")
         
-        print("\n" + "=" * 60)
-        print(f"✅ Saved {filename}")
-        print(f"   📋 {len(data['teams'])} teams")
-        print(f"   🏏 {len(data['batsmen'])} batsmen")
-        print(f"   ⚡ {len(data['bowlers'])} bowlers")
-        print(f"   🏆 {len(data['standings'])} standings entries")
-        print(f"   📅 {len(data['schedule'])} matches in schedule")
-        print("=" * 60)
+        # MaxRuns/MaxWickets name links carry the player_id
+        await self._in_worker(self._observe_page_players, data, division_id, season_id)
         
-        # Scrape scorecards if requested
+        # Scorecards replace the page stats in the same in-memory document
         if include_scorecards:
-            self.scrape_scorecards(division_id, season_id, division_name, data['schedule'], data['teams'])
-            
-            # Reload the data file to get updated player stats
-            if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                
-                print(f"\n🔄 Reloaded data with scorecard-based player stats:")
-                print(f"   🏏 {len(data.get('batsmen', []))} batsmen")
-                print(f"   ⚡ {len(data.get('bowlers', []))} bowlers")
+            # Refresh: stored scorecards are reused, edited results are fetched again
+            refetch = diff.affected_match_ids() if diff else ()
+            await self.ascrape_scorecards(division_id, season_id, division_name, data['schedule'], data['teams'],
+                                          scrapers['scorecards'], refetch, data=data)
+        
+        size, seconds = await self._in_worker(self._write_json, filename, data)
+        
+        print(f"{tag} ✅ Saved {filename} ({size / 1024:.1f} KB in {seconds * 1000:.1f} ms): "
+              f"📋 {len(data['teams'])} teams, 🏏 {len(data['batsmen'])} batsmen, ⚡ {len(data['bowlers'])} bowlers, "
+              f"🏆 {len(data['standings'])} standings entries, 📅 {len(data['schedule'])} matches in schedule")
+        if self.journal and not failed:
+            self.journal.mark('pages', division_id, season_id)
         
+        self._mark_division_done(division_id, season_id)
         return data
     
+    async def _fetch_sections(self, scrapers, division_id, season_id, sections):
+        """Fetch the given division pages in parallel; returns {section: data}"""
+        # Increased limit to capture all teams
+        kwargs = {'batsmen': {'limit': 150}, 'bowlers': {'limit': 150}}
+        results = await asyncio.gather(*(
+            scrapers[section].ascrape(division_id, season_id, **kwargs.get(section, {})) for section in sections))
+        return dict(zip(sections, results))
+    
+    def _sections_affected(self, diff, include_scorecards):
+        """Division pages a schedule diff makes stale (besides the schedule itself)"""
+        sections = []
+        if diff.teams_changed:
+            sections.append('teams')
+        if diff.results_changed:
+            sections.append('standings')
+            # With scorecards, player stats are re-aggregated from them instead
+            if not include_scorecards:
+                sections += ['batsmen', 'bowlers']
+        return sections
+    
+    async def _in_worker(self, func, *args):
+        """Run blocking file/CPU work on the worker thread so other divisions' fetches keep going"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._work_executor, functools.partial(func, *args))
+    
+    def _observe_page_players(self, data, division_id, season_id):
+        """Index the player links of a division's MaxRuns/MaxWickets rows"""
+        self.player_index.observe_players(data['batsmen'] + data['bowlers'], division_id, season_id)
+        self.player_index.save()
+    
+    def _load_division(self, filename):
+        """Previously saved division file, or None if missing/unreadable"""
+        if not os.path.exists(filename):
+            return None
+        start = time.perf_counter()
+        try:
+            with open(filename, 'rb') as f:
+                payload = f.read()
+            return json.loads(payload)
+        except ValueError as e:
+            print(f"  ⚠️  Ignoring unreadable {filename}: {e}")
+            return None
+        finally:
+            self.io_stats['reads'] += 1
+            self.io_stats['seconds'] += time.perf_counter() - start
+    
+    def _write_json(self, filename, data):
+        """
+        Serialize a document once and swap it into place with a temp-file rename
+        
+        Readers never see a half-written file, and a crash leaves the previous one intact.
+        
+        Returns:
+            tuple: (bytes written, seconds taken)
+        """
+        start = time.perf_counter()
+        payload = json.dumps(data, indent=2).encode()
+        tmp_path = f"{filename}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filename)
+        elapsed = time.perf_counter() - start
+        self.io_stats['writes'] += 1
+        self.io_stats['bytes'] += len(payload)
+        self.io_stats['seconds'] += elapsed
+        return len(payload), elapsed
+    
+    def io_summary(self):
+        """One-line report of output file I/O for the run"""
+        stats = self.io_stats
+        return (f"{stats['writes']} file writes ({stats['bytes'] / 1024:.1f} KB), {stats['reads']} reads "
+                f"in {stats['seconds'] * 1000:.1f} ms")
+    
+    def _mark_division_done(self, division_id, season_id):
+        """Journal a division as complete - unless something failed, so --resume retries it"""
+        if self.journal and f"div_{division_id}_season_{season_id}" not in self.failures:
+            self.journal.mark('division', division_id, season_id)
+    
     def scrape_scorecards(self, division_id, season_id, division_name, schedule, teams_list):
         """Scrape all scorecards for a division and aggregate player data"""
-        print(f"\n🎯 Scraping scorecards for {division_name}...")
+        return asyncio.run(self.ascrape_scorecards(division_id, season_id, division_name, schedule, teams_list))
+    
+    async def ascrape_scorecards(self, division_id, season_id, division_name, schedule, teams_list,
+                                 scraper=None, refetch=(), data=None):
+        """
+        Async scrape_scorecards
+        
+        Args:
+            scraper: The division's own ScorecardScraper
+            refetch: Extra match IDs to fetch again even if stored (e.g. edited results)
+            data: In-memory division document to update with the aggregated players.
+                  Without it the saved division file is read and rewritten.
+        
+        Returns:
+            tuple: (batsmen, bowlers) aggregated from the scorecards, or None if there were none
+        """
+        scraper = scraper or self.scorecard_scraper
+        refetch = self.refetch | {str(match_id) for match_id in refetch}
+        tag = f"[{division_name}]"
+        print(f"\n{tag} 🎯 Scraping scorecards...")
         
         # Extract match IDs from schedule - only completed matches
         match_ids = []
@@ -85,75 +315,270 @@ class ARCLDataScraper:
                     match_ids.append(match['match_id'])
         
         if not match_ids:
-            print(f"  ℹ️  No completed matches found for scorecard scraping")
+            print(f"{tag} ℹ️  No completed matches found for scorecard scraping")
             return
         
+        scorecard_filename = os.path.join(self.output_dir, f"scorecards_div_{division_id}_season_{season_id}.json")
+        
+        # Incremental mode: keep stored scorecards, fetch only new or invalidated matches
+        existing = {}
+        to_fetch = match_ids
+        if self.incremental or self.refresh:
+            existing = await self._in_worker(self._load_scorecards, scorecard_filename)
+        # Resuming: scorecards journaled before the crash are not fetched again
+        if self.journal:
+            existing.update(self.journal.scorecards(division_id, season_id))
+        if existing:
+            to_fetch = [match_id for match_id in match_ids
+                        if str(match_id) not in existing or str(match_id) in refetch]
+            for match_id in to_fetch:
+                # The HTTP cache treats scorecards as immutable, so drop invalidated ones
+                if str(match_id) in existing and self.cache:
+                    self.cache.invalidate(scraper._scorecard_url(match_id, division_id, season_id))
+            print(f"{tag} ♻️  {len(match_ids) - len(to_fetch)} scorecards already stored, {len(to_fetch)} to fetch")
+        
+        # Journal each scorecard as it is parsed so a crash loses at most the ones in flight
+        sink = None
+        if self.journal:
+            sink = lambda scorecard: self.journal.mark_scorecard(division_id, season_id, scorecard)
+        
         # Scrape all scorecards
-        scorecards = self.scorecard_scraper.scrape_division_scorecards(
-            division_id, season_id, match_ids
-        )
+        if not to_fetch:
+            fetched = []
+        elif self.parse_workers:
+            fetched = await self._arun_pipeline(scraper, division_id, season_id, to_fetch, sink)
+        else:
+            fetched = await scraper.ascrape_division_scorecards(division_id, season_id, to_fetch, sink)
+        self._record_failures(division_id, season_id, 'scorecards', scraper.drain_errors())
+        
+        # Saving, sharding and aggregating are file and CPU work - off the event loop
+        return await self._in_worker(self._finish_scorecards, division_id, season_id, division_name, match_ids,
+                                     existing, fetched, data)
+    
+    def _finish_scorecards(self, division_id, season_id, division_name, match_ids, existing, fetched, data):
+        """
+        Save a division's scorecards and fold them into its player stats (runs on the worker thread)
+        
+        Returns:
+            tuple: (batsmen, bowlers) aggregated from the scorecards, or None if there were none
+        """
+        tag = f"[{division_name}]"
+        scorecard_filename = os.path.join(self.output_dir, f"scorecards_div_{division_id}_season_{season_id}.json")
+        scorecards = self._merge_scorecards(match_ids, existing, fetched) if existing else fetched
         
         if not scorecards:
-            print(f"  ⚠️  No scorecards scraped")
+            print(f"{tag} ⚠️  No scorecards scraped")
             return
         
-        # Save scorecards to separate file
-        scorecard_filename = f"data/scorecards_div_{division_id}_season_{season_id}.json"
-        
-        with open(scorecard_filename, 'w') as f:
-            json.dump(scorecards, f, indent=2)
+        # Save scorecards to separate file, and one file per match for clients that show a single scorecard
+        scorecards_json = scorecards_to_json(scorecards)
+        self._write_json(scorecard_filename, scorecards_json)
         
-        print(f"✅ Saved {scorecard_filename} ({len(scorecards)} scorecards)")
+        print(f"{tag} ✅ Saved {scorecard_filename} ({len(scorecards)} scorecards)")
+        print(f"{tag} 🗂️  {shard_summary(write_shards(self.output_dir, division_id, season_id, scorecards_json))}")
         
         # Aggregate ALL player data from scorecards
-        print(f"\n🎯 Aggregating ALL player statistics from scorecards...")
-        aggregated_batsmen, aggregated_bowlers = aggregate_players_from_scorecards(scorecards, teams_list, division_id, season_id)
-        
-        # Also aggregate boundaries from scorecards
-        print(f"\n🎯 Aggregating boundary statistics...")
-        boundary_data = aggregate_boundaries(scorecards)
-        
-        # Update main division data file with aggregated player data
-        batsmen_filename = f"data/div_{division_id}_season_{season_id}.json"
-        if os.path.exists(batsmen_filename):
-            with open(batsmen_filename, 'r') as f:
-                division_data = json.load(f)
-            
-            # Replace with aggregated data from scorecards (includes ALL players)
-            division_data['batsmen'] = aggregated_batsmen
-            division_data['bowlers'] = aggregated_bowlers
-            
-            # Merge boundaries
-            updated_batsmen = merge_boundaries_with_batsmen(
-                division_data.get('batsmen', []), 
-                boundary_data
-            )
-            division_data['batsmen'] = updated_batsmen
-            
-            # Save updated data
-            with open(batsmen_filename, 'w') as f:
-                json.dump(division_data, f, indent=2)
+        # Fold only new/edited matches into the persisted running totals (a missing state folds everything)
+        # One pass covers batting, bowling and boundaries: fours/sixes are per-(name, team) batting totals
+        print(f"{tag} 🎯 Aggregating ALL player statistics from scorecards...")
+        state_path = os.path.join(self.output_dir, '.aggregation', f"div_{division_id}_season_{season_id}.json")
+        state = AggregationState.load(state_path, division_id, season_id)
+        folded, retracted = state.sync(scorecards, fresh=fetched)
+        state.save(state_path)
+        print(f"{tag} ♻️  Folded {folded} matches, retracted {retracted} ({len(state.matches)} in running totals)")
+        aggregated_batsmen, aggregated_bowlers = state.finalize([scorecard.match_id for scorecard in scorecards])
+        
+        # Scorecard name links cover every player; aggregated rows then join to an ID by (name, team, season)
+        for scorecard in scorecards:
+            self.player_index.observe_scorecard(scorecard, division_id, season_id)
+        identified = (self.player_index.annotate(aggregated_batsmen, season_id) +
+                      self.player_index.annotate(aggregated_bowlers, season_id))
+        self.player_index.save()
+        print(f"{tag} 🆔 {identified}/{len(aggregated_batsmen) + len(aggregated_bowlers)} player rows have a player_id")
+        
+        # Standalone call: update the saved division file (one read, one write)
+        division_filename = None
+        if data is None:
+            division_filename = os.path.join(self.output_dir, f"div_{division_id}_season_{season_id}.json")
+            data = self._load_division(division_filename)
+        
+        if data is not None:
+            # Replace with aggregated data from scorecards (includes ALL players, with boundaries)
+            data['batsmen'] = aggregated_batsmen
+            data['bowlers'] = aggregated_bowlers
+            if division_filename:
+                self._write_json(division_filename, data)
             
-            print(f"✅ Replaced player data with scorecard aggregations")
-            print(f"   🏏 {len(aggregated_batsmen)} batsmen (from all teams)")
-            print(f"   ⚡ {len(aggregated_bowlers)} bowlers (from all teams)")
+            print(f"{tag} ✅ Replaced player data with scorecard aggregations: "
+                  f"🏏 {len(aggregated_batsmen)} batsmen, ⚡ {len(aggregated_bowlers)} bowlers (from all teams)")
+        return aggregated_batsmen, aggregated_bowlers
+    
+    async def _arun_pipeline(self, scraper, division_id, season_id, match_ids, sink=None):
+        """Fetch in threads and parse in a process pool, with stage throughput"""
+        if self._parse_pool is None:
+            # One pool for the whole run - worker start-up is paid once
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        scraper.log(f"📊 Pipelining {len(match_ids)} scorecards for Div {division_id} "
+                    f"({self.max_concurrency} fetchers, {self.parse_workers} parsers)...")
+        pipeline = ScorecardPipeline(
+            scraper,
+            fetch_workers=self.max_concurrency,
+            parse_workers=self.parse_workers,
+            executor=self._parse_pool
+        )
+        scorecards = await pipeline.arun(division_id, season_id, match_ids, sink)
+        scraper.log(f"  ✅ Scraped {len(scorecards)}/{len(match_ids)} scorecards")
+        scraper.log(f"  {pipeline.summary()}")
+        return scorecards
+    
+    def close(self):
+        """Release the parse process pool, if one was started, the fetch threads and the worker thread"""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+        self.fetcher.shutdown()
+        self._work_executor.shutdown(wait=True)
     
-    def scrape_multiple_divisions(self, divisions, include_scorecards=False):
+    def _load_scorecards(self, filename):
+        """Existing scorecards file as Scorecard records indexed by match_id (empty if missing/corrupt)"""
+        if not os.path.exists(filename):
+            return {}
+        try:
+            return {scorecard.match_id: scorecard for scorecard in load_scorecards(filename)}
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"  ⚠️  Ignoring unreadable {filename}: {e}")
+            return {}
+    
+    def _merge_scorecards(self, match_ids, existing, fetched):
+        """Stored + newly fetched scorecards in schedule order (a failed refetch keeps the stored one)"""
+        by_id = dict(existing)
+        by_id.update((scorecard.match_id, scorecard) for scorecard in fetched)
+        ordered = [str(match_id) for match_id in match_ids]
+        scheduled = set(ordered)
+        # Matches no longer marked completed in the schedule are kept, after the rest
+        ordered += [match_id for match_id in by_id if match_id not in scheduled]
+        return [by_id[match_id] for match_id in ordered if match_id in by_id]
+    
+    def _collect_failures(self, division_id, season_id, scrapers):
+        """Drain fetch errors from a division's section scrapers; return the sections that failed"""
+        failed = []
+        for section in self.section_scrapers:
+            scraper = scrapers[section]
+            errors = scraper.drain_errors()
+            if errors:
+                failed.append(section)
+                self._record_failures(division_id, season_id, section, errors)
+        return failed
+    
+    def _record_failures(self, division_id, season_id, section, errors):
+        """Remember structured fetch failures for the end-of-run report"""
+        if not errors:
+            return
+        key = f"div_{division_id}_season_{season_id}"
+        self.failures.setdefault(key, {}).setdefault(section, []).extend(e.to_dict() for e in errors)
+    
+    def failure_summary(self):
+        """Human-readable report of everything that failed during the run"""
+        if not self.failures:
+            return "No fetch failures"
+        lines = [f"{len(self.failures)} division(s) with fetch failures:"]
+        for key, sections in self.failures.items():
+            detail = ", ".join(f"{section} ({len(errors)})" for section, errors in sections.items())
+            lines.append(f"   • {key}: {detail}")
+        open_endpoints = self.circuit_breaker.open_endpoints()
+        if open_endpoints:
+            lines.append(f"   🔌 Open circuits: {', '.join(open_endpoints)}")
+        return "\n".join(lines)
+    
+    def scrape_multiple_divisions(self, divisions, include_scorecards=False, current_season=None):
         """Scrape multiple divisions at once"""
-        results = {}
-        for div_id, season_id, name in divisions:
-            try:
-                results[f"div_{div_id}"] = self.scrape_division(
-                    div_id, season_id, name, include_scorecards
-                )
-            except Exception as e:
-                print(f"❌ Error scraping {name}: {e}")
-        return results
+        return asyncio.run(self.ascrape_multiple_divisions(divisions, include_scorecards, current_season))
+    
+    async def ascrape_multiple_divisions(self, divisions, include_scorecards=False, current_season=None):
+        """
+        Scrape several divisions concurrently under one request budget
+        
+        Up to division_concurrency divisions are in flight at once. Every
+        request they make still goes through the shared fetcher's per-host
+        limit and the process-wide token bucket, so the load on arcl.org is
+        the same as a serial run - the gaps are just filled with other
+        divisions' work.
+        
+        Args:
+            divisions: List of (division_id, season_id, name) tuples
+            include_scorecards: Also scrape and aggregate scorecards
+            current_season: Season ID to start first (the rest keep their order)
+            
+        Returns:
+            dict: Division data keyed by "div_<id>"
+        """
+        if current_season is not None:
+            divisions = sorted(divisions, key=lambda d: d[1] != current_season)
+        if self.journal:
+            print(f"\n📒 Journal {self.journal.path}: {self.journal.summary(divisions)}")
+        
+        slots = asyncio.Semaphore(self.division_concurrency)
+        
+        async def scrape_one(div_id, season_id, name):
+            async with slots:
+                try:
+                    return await self.ascrape_division(div_id, season_id, name, include_scorecards)
+                except FetchError as e:
+                    self._record_failures(div_id, season_id, 'division', [e])
+                    print(f"❌ Error scraping {name}: {e}")
+                except Exception as e:
+                    print(f"❌ Error scraping {name}: {e}")
+        
+        scraped = await asyncio.gather(*(scrape_one(*division) for division in divisions))
+        return {f"div_{div_id}": data for (div_id, _, _), data in zip(divisions, scraped) if data is not None}
+
+def _flag_value(name, default):
+    """Read a --name=value command line flag"""
+    import sys
+    for arg in sys.argv:
+        if arg.startswith(f"{name}="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def _cassette_from_flags():
+    """Build a Cassette from --record=PATH / --replay=PATH, if given"""
+    record_path = _flag_value("--record", None)
+    replay_path = _flag_value("--replay", None)
+    if record_path:
+        return Cassette(record_path, mode='record')
+    if replay_path:
+        return Cassette(replay_path, mode='replay')
+    return None
 
 
 def main():
     import sys
-    scraper = ARCLDataScraper()
+    max_concurrency = int(_flag_value("--concurrency", 4))
+    cache_dir = _flag_value("--cache-dir", None)
+    rate = _flag_value("--rate", None)
+    burst = _flag_value("--burst", None)
+    output_dir = _flag_value("--output-dir", "data")
+    # Always journal progress; --resume picks up where a crashed run stopped
+    journal = ScrapeJournal(
+        _flag_value("--journal", os.path.join(output_dir, ".scrape_journal.jsonl")),
+        resume="--resume" in sys.argv
+    )
+    scraper = ARCLDataScraper(
+        max_concurrency=max_concurrency,
+        cache_dir=cache_dir,
+        rate=float(rate) if rate else None,
+        burst=float(burst) if burst else None,
+        cassette=_cassette_from_flags(),
+        output_dir=output_dir,
+        parser=_flag_value("--parser", None),
+        incremental="--incremental" in sys.argv,
+        refresh="--refresh" in sys.argv,
+        refetch=[m for m in _flag_value("--refetch", "").split(",") if m],
+        parse_workers=int(_flag_value("--parse-workers", 0)),
+        journal=journal,
+        division_concurrency=int(_flag_value("--division-concurrency", 3))
+    )
     
     # Define all seasons and divisions
     seasons = [
@@ -167,6 +592,7 @@ def main():
     
     division_ids = [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]
     division_names = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N"]
+    current_season = 66  # Summer 2025
     
     # Check for flags
     include_scorecards = "--scorecards" in sys.argv
@@ -174,7 +600,7 @@ def main():
     if include_scorecards:
         print("\n🎯 Scorecard scraping ENABLED")
         print("   This will scrape detailed match scorecards and boundary data")
-        print("   Estimated time: ~24 minutes for all divisions\n")
+        print(f"   Fetching up to {max_concurrency} scorecards at a time\n")
     
     # Check if --all-seasons flag is provided
     if "--all-seasons" in sys.argv:
@@ -184,16 +610,53 @@ def main():
             for div_id, div_name in zip(division_ids, division_names):
                 all_combinations.append((div_id, season_id, f"Div {div_name} - {season_name}"))
         
-        scraper.scrape_multiple_divisions(all_combinations, include_scorecards)
+        divisions = all_combinations
     else:
         # Default: Just scrape current season (Summer 2025)
         divisions = []
         for div_id, div_name in zip(division_ids, division_names):
-            divisions.append((div_id, 66, f"Div {div_name} - Summer 2025"))
-        
-        scraper.scrape_multiple_divisions(divisions, include_scorecards)
+            divisions.append((div_id, current_season, f"Div {div_name} - Summer 2025"))
+    
+    # Current season first, so the data that changes week to week lands earliest
+    scraper.scrape_multiple_divisions(divisions, include_scorecards, current_season)
+    
+    scraper.close()
+    if scraper.cassette:
+        scraper.cassette.save()
+    
+    # Career totals across every season's scorecards in the output directory
+    if "--career" in sys.argv:
+        career_workers = _flag_value("--career-workers", None)
+        write_career_stats(output_dir, workers=int(career_workers) if career_workers else None,
+                           player_index=scraper.player_index)
+    
+    # Bulk-load everything into the local SQLite store for indexed queries
+    sqlite_path = _flag_value("--sqlite", None)
+    if sqlite_path:
+        store = SQLiteStore(sqlite_path)
+        store.load_dir(output_dir)
+        store.close()
+    
+    # COPY everything into PostgreSQL (DATABASE_URL) via staging tables
+    if "--postgres" in sys.argv:
+        ingest = PostgresIngest()
+        ingest.ingest_dir(output_dir)
+        ingest.close()
+    
+    # Minified copies with .gz/.br sidecars for the app to download
+    if "--publish" in sys.argv:
+        publish_dir(output_dir, _flag_value("--publish-dir", None))
     
     print("\n🎉 All scraping complete!")
+    print(f"🧾 {scraper.failure_summary()}")
+    print(f"📒 Journal: {journal.summary(divisions)}")
+    print(f"🆔 Player index: {scraper.player_index.summary()}")
+    print(f"📝 Output files: {scraper.io_summary()}")
+    print(f"⏱️  Rate limiter: {scraper.rate_limiter.summary()}")
+    print(f"🔌 Transport: {scraper.transport.summary()}")
+    
+    if scraper.cache:
+        print(f"💾 HTTP cache: {scraper.cache.summary()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Async Fetcher - Concurrent page fetching with per-host concurrency limits
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+
+def host_key(url):
+    """Normalise a URL to the host it will hit (arcl.org == www.arcl.org)"""
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+class AsyncFetcher:
+    """
+    Shared engine that keeps several blocking fetches in flight at once.
+
+    Work is run on a thread pool so the existing requests/BeautifulSoup code
+    can be reused unchanged, while an asyncio semaphore per host caps how many
+    requests hit the same server concurrently.
+    """
+
+    def __init__(self, max_per_host=4, max_workers=16):
+        self.max_per_host = max_per_host
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='arcl-fetch')
+        # asyncio semaphores belong to one event loop, so keep a set per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, url):
+        """Get the semaphore guarding the host of this URL for the running loop"""
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+        host = host_key(url)
+        if host not in per_loop:
+            per_loop[host] = asyncio.Semaphore(self.max_per_host)
+        return per_loop[host]
+
+    async def run(self, url, func, *args, **kwargs):
+        """
+        Run a blocking call that talks to `url`'s host without blocking the loop
+
+        Args:
+            url: URL (or base URL) whose host the call will contact
+            func: Blocking callable, e.g. BaseScraper.fetch_page
+            *args, **kwargs: Passed through to func
+
+        Returns:
+            Whatever func returns
+        """
+        async with self._semaphore(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self):
+        """Release the worker threads"""
+        self.executor.shutdown(wait=True)
+
+
+_default_fetcher = None
+
+
+def get_default_fetcher():
+    """Process-wide fetcher used by scrapers that are not given one explicitly"""
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = AsyncFetcher()
+    return _default_fetcher
+
+
+def set_default_fetcher(fetcher):
+    """Replace the process-wide fetcher"""
+    global _default_fetcher
+    _default_fetcher = fetcher
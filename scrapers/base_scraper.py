@@ -3,35 +3,156 @@
 Base Scraper - Foundation for all ARCL scrapers
 """
 
-import requests
-from bs4 import BeautifulSoup
 from abc import ABC, abstractmethod
 import time
+from .async_fetcher import get_default_fetcher
+from .http_cache import get_default_cache
+from .rate_limiter import get_default_limiter
+from .transport import get_default_transport
+from .retry import (FetchError, CircuitOpenError, parse_retry_after,
+                    get_default_retry_policy, get_default_circuit_breaker)
+from .cassette import get_default_cassette
+from .parsers import ParseTarget, make_soup, find_tables, check_backend, get_default_parser
 
 
 class BaseScraper(ABC):
     """Abstract base class for all ARCL scrapers"""
     
-    def __init__(self, base_url="https://arcl.org"):
+    # Part of the page this scraper reads (ParseTarget); None parses everything
+    parse_target = None
+    
+    def __init__(self, base_url="https://arcl.org", fetcher=None, cache=None, rate_limiter=None,
+                 transport=None, retry_policy=None, circuit_breaker=None, cassette=None, parser=None):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-    
-    def fetch_page(self, url, retries=3):
-        """Fetch a page with retry logic"""
-        for attempt in range(retries):
+        self.fetcher = fetcher or get_default_fetcher()
+        self.cache = cache or get_default_cache()
+        self.rate_limiter = rate_limiter or get_default_limiter()
+        self.transport = transport or get_default_transport()
+        self.session = self.transport.session
+        self.retry_policy = retry_policy or get_default_retry_policy()
+        self.circuit_breaker = circuit_breaker or get_default_circuit_breaker()
+        self.cassette = cassette or get_default_cassette()
+        # HTML parser backend: 'html.parser', 'lxml' or 'selectolax'
+        self.parser = check_backend(parser or get_default_parser())
+        # FetchErrors from fetch_page, for the orchestrator to inspect
+        self.errors = []
+        # Tag for progress lines, e.g. "[Div F - Summer 2025]" when divisions run concurrently
+        self.label = None
+    
+    def log(self, message):
+        """Print a progress line, tagged with self.label if set"""
+        print(f"{self.label} {message}" if self.label else message)
+    
+    def fetch_page(self, url, retries=None):
+        """Fetch a page with retry logic (None on failure, details in self.errors)"""
+        content = self.fetch_content(url, retries)
+        if content is None:
+            return None
+        return make_soup(content, self.parser, self.parse_target)
+    
+    def fetch_content(self, url, retries=None):
+        """fetch_raw, but recording failures in self.errors and returning None"""
+        try:
+            return self.fetch_raw(url, retries)
+        except FetchError as e:
+            self.errors.append(e)
+            self.log(f"❌ {e}")
+            return None
+    
+    def fetch_table_data(self, url, table_id_pattern=None):
+        """
+        Fetch a page and extract one table's rows without building a full soup
+        when the parser backend has a fast path
+        
+        Returns the same rows as extract_table_data(fetch_page(url), table_id_pattern).
+        """
+        table = self.fetch_table(url, table_id_pattern)
+        return table.data() if table else []
+    
+    def fetch_table(self, url, table_id_pattern=None):
+        """fetch_table_data, but returning the Table (with cell links if the parse_target asks for them)"""
+        content = self.fetch_content(url)
+        if content is None:
+            return None
+        target = ParseTarget(table_id=table_id_pattern, max_tables=1) if table_id_pattern else self.parse_target
+        tables = find_tables(content, self.parser, target)
+        return tables[0] if tables else None
+    
+    def fetch_raw(self, url, retries=None):
+        """
+        Fetch the raw body of a page, through the HTTP cache if one is configured
+        
+        Retries with exponential backoff and jitter (honouring Retry-After) and
+        fails fast while the endpoint's circuit breaker is open. If the circuit
+        opens between retries, the FetchError still carries the last real status
+        and attempt count, and says the open circuit stopped the retries. A
+        replaying cassette short-circuits all of this; a recording one keeps the
+        body.
+        
+        Raises:
+            FetchError: When the page could not be fetched
+        """
+        if self.cassette and self.cassette.replaying:
+            return self.cassette.play(url)
+        
+        attempts = retries or self.retry_policy.max_attempts
+        last_error = None
+        for attempt in range(1, attempts + 1):
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                self.circuit_breaker.before_request(url)
+            except CircuitOpenError as e:
+                if last_error is None:
+                    raise
+                # Our own failures opened the circuit mid-retry: report the last real error
+                error, status = last_error
+                raise FetchError(url, f"{error}; stopped retrying: {e.message}",
+                                 status=status, attempts=attempt - 1) from error
+            try:
+                content = self._fetch_once(url)
             except Exception as e:
-                if attempt == retries - 1:
-                    print(f"❌ Failed to fetch {url}: {e}")
-                    return None
-                time.sleep(1)
-        return None
+                response = getattr(e, 'response', None)
+                status = response.status_code if response is not None else None
+                retryable = self.retry_policy.is_retryable(status)
+                if retryable:
+                    self.circuit_breaker.record_failure(url)
+                else:
+                    # The server answered, so the endpoint itself is healthy
+                    self.circuit_breaker.record_success(url)
+                if not retryable or attempt == attempts:
+                    raise FetchError(url, str(e), status=status, attempts=attempt) from e
+                last_error = (e, status)
+                time.sleep(self.retry_policy.delay(attempt, parse_retry_after(response)))
+            else:
+                self.circuit_breaker.record_success(url)
+                if self.cassette:
+                    self.cassette.record(url, content)
+                return content
+    
+    def _fetch_once(self, url):
+        """One attempt at a page body, through the cache if configured"""
+        if self.cache:
+            return self.cache.fetch(url, lambda headers: self._get(url, headers))
+        response = self._get(url)
+        response.raise_for_status()
+        return response.content
+    
+    def drain_errors(self):
+        """Return and clear the FetchErrors collected so far"""
+        errors, self.errors = self.errors, []
+        return errors
+    
+    def _get(self, url, headers=None):
+        """Single network request, paced by the shared rate limiter"""
+        self.rate_limiter.acquire()
+        return self.transport.get(url, headers=headers)
+    
+    async def afetch_page(self, url, retries=None):
+        """Async fetch_page - bounded by the fetcher's per-host semaphore"""
+        return await self.fetcher.run(url, self.fetch_page, url, retries)
+    
+    async def ascrape(self, *args, **kwargs):
+        """Async scrape() - runs on the shared fetcher so scrapers can overlap"""
+        return await self.fetcher.run(self.base_url, self.scrape, *args, **kwargs)
     
     def extract_table_data(self, soup, table_id_pattern=None):
         """Extract data from an HTML table"""
@@ -4,24 +4,26 @@ Batsmen Scraper - Get top run scorers with ALL available stats
 """
 
 from .base_scraper import BaseScraper
+from .parsers import ParseTarget
+from .player_index import player_id_from_href
 
 
 class BatsmenScraper(BaseScraper):
     """Scraper for batsmen statistics"""
     
+    parse_target = ParseTarget(table_id='GridView', max_tables=1, links=True)
+    
     def scrape(self, division_id, season_id, limit=25):
         """Scrape top batsmen stats with ALL columns"""
         url = f"{self.base_url}/Pages/UI/MaxRuns.aspx?league_id={division_id}&season_id={season_id}"
-        print(f"  🏏 Scraping batsmen...")
-        
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+        self.log(f"  🏏 Scraping batsmen...")
         
-        table_data = self.extract_table_data(soup, 'GridView')
+        table = self.fetch_table(url)
+        table_data = table.data() if table else []
+        table_links = table.data_links() if table else []
         batsmen = []
         
-        for row in table_data[:limit]:
+        for row, links in zip(table_data[:limit], table_links):
             # Columns: Rank, Name, Team, Innings, Runs, Strike Rate
             if len(row) >= 6:
                 try:
@@ -38,8 +40,12 @@ class BatsmenScraper(BaseScraper):
                         # Calculate average
                         "average": str(round(runs / innings, 2)) if innings > 0 else "0"
                     })
+                    # Name cell links to PlayerStats.aspx?...&player_id=N
+                    player_id = player_id_from_href(links[1])
+                    if player_id:
+                        batsmen[-1]["player_id"] = player_id
                 except Exception as e:
                     continue
         
-        print(f"     ✓ Found {len(batsmen)} batsmen with full stats")
+        self.log(f"     ✓ Found {len(batsmen)} batsmen with full stats")
         return batsmen
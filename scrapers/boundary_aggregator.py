@@ -3,54 +3,61 @@ Boundary Aggregator for ARCL
 Aggregates 4s and 6s statistics from scorecards
 """
 
+from .records import as_scorecard, count
+
+
+def boundary_entry(fours=0, sixes=0, innings_count=0):
+    """One player's boundary statistics"""
+    return {
+        'fours': fours,
+        'sixes': sixes,
+        'boundaries': fours + sixes,
+        'innings_count': innings_count
+    }
+
 
 def aggregate_boundaries(scorecards):
     """
     Aggregate boundary statistics per player from all scorecards
     
+    Players are keyed by (name, team) like the aggregated batsmen, so two
+    players with the same name on different teams stay separate. When the
+    batting stats are needed too, player_aggregator.aggregate_scorecards
+    returns both from a single pass.
+    
     Args:
-        scorecards: List of scorecard dictionaries
+        scorecards: List of Scorecard records (or their dict form)
         
     Returns:
-        dict: Player boundary statistics {player_name: {team, fours, sixes, boundaries}}
+        dict: Player boundary statistics {(name, team): {fours, sixes, boundaries, innings_count}}
     """
     player_boundaries = {}
     
     for scorecard in scorecards:
+        scorecard = as_scorecard(scorecard)
         # Process both innings
-        for innings in [scorecard['team1_innings'], scorecard['team2_innings']]:
-            for batsman in innings['batting']:
-                name = batsman['name']
+        for innings, team in [(scorecard.team1_innings, scorecard.team1), (scorecard.team2_innings, scorecard.team2)]:
+            for batsman in innings.batting:
+                name = batsman.name.strip()
                 
                 # Skip if no name
                 if not name:
                     continue
                 
-                # Parse boundaries (handle empty strings)
-                try:
-                    fours = int(batsman['fours']) if batsman['fours'] else 0
-                except (ValueError, TypeError):
-                    fours = 0
-                
-                try:
-                    sixes = int(batsman['sixes']) if batsman['sixes'] else 0
-                except (ValueError, TypeError):
-                    sixes = 0
+                # Blank cells count as 0
+                fours = count(batsman.fours)
+                sixes = count(batsman.sixes)
                 
                 # Initialize player if not exists
-                if name not in player_boundaries:
-                    player_boundaries[name] = {
-                        'fours': 0,
-                        'sixes': 0,
-                        'boundaries': 0,
-                        'innings_count': 0
-                    }
+                key = (name, team)
+                if key not in player_boundaries:
+                    player_boundaries[key] = boundary_entry()
                 
                 # Aggregate
-                player_boundaries[name]['fours'] += fours
-                player_boundaries[name]['sixes'] += sixes
-                player_boundaries[name]['boundaries'] += (fours + sixes)
-                player_boundaries[name]['innings_count'] += 1
+                player_boundaries[key]['fours'] += fours
+                player_boundaries[key]['sixes'] += sixes
+                player_boundaries[key]['boundaries'] += (fours + sixes)
+                player_boundaries[key]['innings_count'] += 1
     
     return player_boundaries
 
@@ -61,17 +68,17 @@ def merge_boundaries_with_batsmen(batsmen_data, boundary_data):
     
     Args:
         batsmen_data: List of batsmen from batsmen_scraper
-        boundary_data: Dictionary of boundary stats
+        boundary_data: Dictionary of boundary stats keyed by (name, team)
         
     Returns:
         list: Batsmen data with added boundary fields
     """
     for batsman in batsmen_data:
-        name = batsman['name']
+        key = (batsman['name'].strip(), batsman.get('team', ''))
         
-        if name in boundary_data:
-            batsman['fours'] = str(boundary_data[name]['fours'])
-            batsman['sixes'] = str(boundary_data[name]['sixes'])
+        if key in boundary_data:
+            batsman['fours'] = str(boundary_data[key]['fours'])
+            batsman['sixes'] = str(boundary_data[key]['sixes'])
         else:
             batsman['fours'] = '0'
             batsman['sixes'] = '0'
@@ -91,9 +98,10 @@ def format_boundaries_output(boundary_data):
     """
     # Convert to list
     boundary_list = []
-    for name, stats in boundary_data.items():
+    for (name, team), stats in boundary_data.items():
         boundary_list.append({
             'name': name,
+            'team': team,
             'fours': stats['fours'],
             'sixes': stats['sixes'],
             'total_boundaries': stats['boundaries'],
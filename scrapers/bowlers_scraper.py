@@ -4,27 +4,32 @@ Bowlers Scraper - Get top wicket takers with ALL available stats
 """
 
 from .base_scraper import BaseScraper
+from .parsers import ParseTarget
+from .player_index import player_id_from_href
+from .records import BALLS_PER_OVER, overs_to_balls
 
 
 class BowlersScraper(BaseScraper):
     """Scraper for bowler statistics"""
     
+    parse_target = ParseTarget(table_id='GridView', max_tables=1, links=True)
+    
     def scrape(self, division_id, season_id, limit=25):
         """Scrape top bowlers stats with ALL columns"""
         url = f"{self.base_url}/Pages/UI/MaxWickets.aspx?league_id={division_id}&season_id={season_id}"
-        print(f"  ⚡ Scraping bowlers...")
-        
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+        self.log(f"  ⚡ Scraping bowlers...")
         
-        table_data = self.extract_table_data(soup, 'GridView')
+        table = self.fetch_table(url)
+        table_data = table.data() if table else []
+        table_links = table.data_links() if table else []
         bowlers = []
         
-        for row in table_data[:limit]:
+        for row, links in zip(table_data[:limit], table_links):
             # Columns: Rank, Name, Team, Innings, Overs, Maidens, Runs Given, Wickets, Average
             if len(row) >= 9:
                 try:
+                    # Overs are cricket notation ('24.4' is 148 balls)
+                    balls = overs_to_balls(row[4])
                     bowlers.append({
                         "rank": row[0],
                         "name": row[1],
@@ -35,11 +40,15 @@ class BowlersScraper(BaseScraper):
                         "runs_given": row[6],
                         "wickets": row[7],
                         "average": row[8],
-                        # Calculate economy rate
-                        "economy": str(round(float(row[6]) / float(row[4]), 2)) if float(row[4]) > 0 else "0"
+                        # Calculate economy rate (runs per six legal balls)
+                        "economy": str(round(float(row[6]) * BALLS_PER_OVER / balls, 2)) if balls > 0 else "0"
                     })
+                    # Name cell links to PlayerStats.aspx?...&player_id=N
+                    player_id = player_id_from_href(links[1])
+                    if player_id:
+                        bowlers[-1]["player_id"] = player_id
                 except Exception as e:
                     continue
         
-        print(f"     ✓ Found {len(bowlers)} bowlers with full stats")
+        self.log(f"     ✓ Found {len(bowlers)} bowlers with full stats")
         return bowlers
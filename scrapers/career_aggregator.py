@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Career Aggregator - Career, per-season and per-division player totals
+
+Map-reduce over every scorecards_div_X_season_Y.json in a data directory. The
+map step runs in a process pool. Each worker loads one file and sums its
+matches into a partial per (name, team). The partial has one row per player,
+not one per innings. The reduce step folds partials into career, per-season
+and per-division totals as they arrive. Only a few partials are in flight at
+a time, so memory grows with the number of players, not with the number of
+archived files.
+"""
+
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from .aggregation_state import BATTING_FIELDS, BOWLING_FIELDS, match_contribution
+from .records import BALLS_PER_OVER, format_overs, load_scorecards
+
+
+SCORECARD_FILE_PATTERN = re.compile(r'scorecards_div_(\d+)_season_(\d+)\.json$')
+
+
+def scorecard_files(data_dir):
+    """
+    Scorecard files in a data directory, oldest season first
+
+    Returns:
+        list: (path, division_id, season_id) tuples
+    """
+    files = []
+    for path in glob.glob(os.path.join(data_dir, 'scorecards_div_*_season_*.json')):
+        match = SCORECARD_FILE_PATTERN.search(os.path.basename(path))
+        if match:
+            files.append((path, int(match.group(1)), int(match.group(2))))
+    return sorted(files, key=lambda f: (f[2], f[1]))
+
+
+def _sum_rows(totals, rows):
+    for row in rows:
+        key = (row[0], row[1])
+        current = totals.get(key)
+        if current is None:
+            totals[key] = list(row[2:])
+        else:
+            for i, value in enumerate(row[2:]):
+                current[i] += value
+
+
+def file_partial(path, division_id, season_id):
+    """
+    Map step: one scorecard file summed per (name, team)
+
+    Returns:
+        dict: {'division_id', 'season_id', 'matches',
+               'batting': [[name, team, *BATTING_FIELDS]], 'bowling': [[name, team, *BOWLING_FIELDS]]}
+    """
+    batting = {}
+    bowling = {}
+    scorecards = load_scorecards(path)
+    for scorecard in scorecards:
+        contribution = match_contribution(scorecard)
+        _sum_rows(batting, contribution['batting'])
+        _sum_rows(bowling, contribution['bowling'])
+    return {
+        'division_id': division_id,
+        'season_id': season_id,
+        'matches': len(scorecards),
+        'batting': [list(key) + totals for key, totals in batting.items()],
+        'bowling': [list(key) + totals for key, totals in bowling.items()]
+    }
+
+
+class _Totals:
+    """
+    Summed stats for one grouping, with the teams/seasons/divisions each player appeared in
+
+    Appearances are short lists - a player has a handful of teams - which is
+    much smaller than a set per player per season.
+    """
+
+    def __init__(self, width):
+        self.width = width
+        self.totals = {}
+        self.seen = {}
+
+    def add(self, key, values, team, season_id, division_id):
+        current = self.totals.get(key)
+        if current is None:
+            current = self.totals[key] = [0] * self.width
+            self.seen[key] = ([], [], [])
+        for i, value in enumerate(values):
+            current[i] += value
+        for seen, value in zip(self.seen[key], (team, season_id, division_id)):
+            if value not in seen:
+                seen.append(value)
+
+
+class CareerStats:
+    """
+    Reduce step: career, per-season and per-division totals
+
+    Players are keyed by (name, team), as in AggregationState, so two players
+    who share a name on different teams stay apart. With a PlayerIndex, a
+    (name, team, season) that resolves to a player_id is keyed by the ID
+    instead. Only that joins a player's seasons across teams, and renamed or
+    re-spelled players keep one career.
+
+    Args:
+        player_index: Optional PlayerIndex for player_id keys
+    """
+
+    def __init__(self, player_index=None):
+        self.player_index = player_index
+        # ('player_id', id) -> the index's name for that player
+        self.names = {}
+        self.files = 0
+        self.matches = 0
+        self.seasons = set()
+        self.divisions = set()
+        self.batting = {kind: _Totals(len(BATTING_FIELDS)) for kind in ('career', 'season', 'division')}
+        self.bowling = {kind: _Totals(len(BOWLING_FIELDS)) for kind in ('career', 'season', 'division')}
+
+    def add_partial(self, partial):
+        """Fold one file's partial into every grouping"""
+        season_id = partial['season_id']
+        division_id = partial['division_id']
+        self.files += 1
+        self.matches += partial['matches']
+        self.seasons.add(season_id)
+        self.divisions.add(division_id)
+        for groups, rows in ((self.batting, partial['batting']), (self.bowling, partial['bowling'])):
+            for row in rows:
+                name, team, values = row[0], row[1], row[2:]
+                key = self._player_key(name, team, season_id)
+                groups['career'].add(key, values, team, season_id, division_id)
+                groups['season'].add((key, season_id), values, team, season_id, division_id)
+                groups['division'].add((key, division_id), values, team, season_id, division_id)
+
+    def _player_key(self, name, team, season_id):
+        player_id = self.player_index.lookup(name, team, season_id) if self.player_index else None
+        if player_id is None:
+            return ('name', name, team)
+        key = ('player_id', player_id)
+        if key not in self.names:
+            self.names[key] = self.player_index.players.get(player_id, {}).get('name', name)
+        return key
+
+    def to_dict(self):
+        """JSON-ready totals, each list ranked by runs/wickets (ties by name)"""
+        return {
+            'last_updated': datetime.now().isoformat(),
+            'files': self.files,
+            'matches': self.matches,
+            'seasons': sorted(self.seasons),
+            'divisions': sorted(self.divisions),
+            'batting': _ranked(_batting_rows(self.batting['career'], self.names), 'runs'),
+            'bowling': _ranked(_bowling_rows(self.bowling['career'], self.names), 'wickets'),
+            'batting_by_season': _ranked(_batting_rows(self.batting['season'], self.names, 'season_id'), 'runs',
+                                         'season_id'),
+            'bowling_by_season': _ranked(_bowling_rows(self.bowling['season'], self.names, 'season_id'), 'wickets',
+                                         'season_id'),
+            'batting_by_division': _ranked(_batting_rows(self.batting['division'], self.names, 'division_id'),
+                                           'runs', 'division_id'),
+            'bowling_by_division': _ranked(_bowling_rows(self.bowling['division'], self.names, 'division_id'),
+                                           'wickets', 'division_id')
+        }
+
+
+def _identity(key, group_field, seen, names):
+    player = key if group_field is None else key[0]
+    teams, seasons, divisions = seen
+    row = {'rank': '0', 'name': names.get(player, player[1])}
+    if player[0] == 'player_id':
+        row['player_id'] = player[1]
+    if group_field is not None:
+        row[group_field] = key[1]
+    row['teams'] = sorted(teams)
+    row['seasons'] = sorted(seasons)
+    row['divisions'] = sorted(divisions)
+    return row
+
+
+def _batting_rows(totals, names, group_field=None):
+    rows = []
+    for key, (innings, runs, balls, fours, sixes, not_outs) in totals.totals.items():
+        dismissals = innings - not_outs
+        row = _identity(key, group_field, totals.seen[key], names)
+        row.update({
+            'innings': str(innings),
+            'runs': str(runs),
+            'balls': str(balls),
+            'strike_rate': str(round((runs / balls) * 100, 2) if balls > 0 else 0),
+            'fours': str(fours),
+            'sixes': str(sixes),
+            'not_outs': str(not_outs),
+            'average': str(round(runs / dismissals, 2) if dismissals > 0 else runs)
+        })
+        rows.append(row)
+    return rows
+
+
+def _bowling_rows(totals, names, group_field=None):
+    rows = []
+    for key, (innings, balls, maidens, runs, wickets, wides, no_balls) in totals.totals.items():
+        row = _identity(key, group_field, totals.seen[key], names)
+        row.update({
+            'innings': str(innings),
+            'overs': format_overs(balls),
+            'maidens': str(maidens),
+            'runs_given': str(runs),
+            'wickets': str(wickets),
+            'wides': str(wides),
+            'no_balls': str(no_balls),
+            'average': str(round(runs / wickets, 2) if wickets > 0 else 0),
+            'economy': str(round(runs * BALLS_PER_OVER / balls, 2) if balls > 0 else 0)
+        })
+        rows.append(row)
+    return rows
+
+
+def _ranked(rows, field, group_field=None):
+    """Sort by field descending (within each group), ties by name, and number the ranks"""
+    rows.sort(key=lambda r: (r[group_field] if group_field else 0, -int(r[field]), r['name']))
+    rank, group = 0, object()
+    for row in rows:
+        if group_field and row[group_field] != group:
+            rank, group = 0, row[group_field]
+        rank += 1
+        row['rank'] = str(rank)
+    return rows
+
+
+def aggregate_careers(data_dir='data', workers=None, in_flight=None, player_index=None):
+    """
+    Career stats from every scorecard file in data_dir
+
+    Args:
+        data_dir: Directory with scorecards_div_X_season_Y.json files
+        workers: Map processes (default: CPU count; 1 maps in this process)
+        in_flight: Max partials mapped but not yet reduced (default: 2 per worker)
+        player_index: Optional PlayerIndex - players are keyed by player_id where it resolves
+
+    Returns:
+        CareerStats
+    """
+    files = scorecard_files(data_dir)
+    stats = CareerStats(player_index)
+    workers = workers or os.cpu_count() or 1
+    print(f"\n🎯 Aggregating careers from {len(files)} scorecard files ({workers} workers)...")
+
+    if workers == 1 or len(files) <= 1:
+        for path, division_id, season_id in files:
+            stats.add_partial(file_partial(path, division_id, season_id))
+    else:
+        in_flight = in_flight or workers * 2
+        pending = set()
+        remaining = iter(files)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                # Keep a bounded window of files mapping; reduce each partial as it lands
+                for path, division_id, season_id in remaining:
+                    pending.add(pool.submit(file_partial, path, division_id, season_id))
+                    if len(pending) >= in_flight:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stats.add_partial(future.result())
+
+    print(f"  ✅ {len(stats.batting['career'].totals)} batsmen and {len(stats.bowling['career'].totals)} bowlers "
+          f"across {len(stats.seasons)} seasons, {stats.matches} matches")
+    return stats
+
+
+def write_career_stats(data_dir='data', output_path=None, workers=None, player_index=None):
+    """Aggregate careers and write them to data_dir/career_stats.json (or output_path)"""
+    stats = aggregate_careers(data_dir, workers, player_index=player_index)
+    output_path = output_path or os.path.join(data_dir, 'career_stats.json')
+    with open(output_path, 'w') as f:
+        json.dump(stats.to_dict(), f, indent=2)
+    print(f"✅ Saved {output_path}")
+    return stats
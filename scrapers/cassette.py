@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Cassette - Record fetched pages to a compressed file and replay them offline
+"""
+
+import gzip
+import json
+import os
+import threading
+from .retry import FetchError
+
+
+class Cassette:
+    """
+    URL -> page body store for offline runs.
+
+    In 'record' mode every page fetched through BaseScraper.fetch_raw is kept
+    and written to a gzip-compressed JSON file by save(). In 'replay' mode
+    fetch_raw serves pages from the file with no network, rate limiting or
+    retries, so a full scrape runs in parse/aggregate time alone.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, mode='replay'):
+        """
+        Args:
+            path: Cassette file, e.g. cassettes/div_8_season_66.json.gz
+            mode: 'record' or 'replay'
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.pages = {}
+        self.misses = []
+        if mode == 'replay' or os.path.exists(path):
+            self.load()
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def play(self, url):
+        """
+        Return the recorded body for a URL
+
+        Raises:
+            FetchError: When the URL was never recorded
+        """
+        body = self.pages.get(url)
+        if body is None:
+            with self._lock:
+                self.misses.append(url)
+            raise FetchError(url, "not recorded in cassette")
+        return body
+
+    def record(self, url, body):
+        """Keep a fetched body (record mode only)"""
+        if self.mode == 'record':
+            with self._lock:
+                self.pages[url] = body
+
+    def load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            payload = json.load(f)
+        # Bodies are stored as latin-1 text, which round-trips arbitrary bytes
+        self.pages = {url: body.encode('latin-1') for url, body in payload['pages'].items()}
+
+    def save(self):
+        """Write the recorded pages (no-op in replay mode)"""
+        if self.mode != 'record':
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            pages = {url: body.decode('latin-1') for url, body in sorted(self.pages.items())}
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'pages': pages}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        print(f"📼 Recorded {len(pages)} pages to {self.path} ({os.path.getsize(self.path) / 1024:.0f} KB)")
+
+
+_default_cassette = None
+
+
+def get_default_cassette():
+    """Process-wide cassette (None = live network)"""
+    return _default_cassette
+
+
+def set_default_cassette(cassette):
+    """Record or replay every scraper through one cassette (None to go live)"""
+    global _default_cassette
+    _default_cassette = cassette
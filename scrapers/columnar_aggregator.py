@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Columnar Aggregator - Vectorized player aggregation over flattened scorecards
+
+Same output as aggregate_players_from_scorecards, computed differently: every
+batting and bowling row is flattened once into NumPy columns (player/team
+index, runs, balls, 4s, 6s, dismissal flag, legal balls bowled, runs conceded,
+wickets). Every column is an integer, so totals and rates are exact.
+Cells are already numbers on the Scorecard records; name validation, dismissal
+text and team IDs are each checked once per distinct value, and totals are
+grouped reductions (np.bincount).
+Falls back to the row-at-a-time aggregator without NumPy.
+"""
+
+from .player_aggregator import (INVALID_BATTING_NAMES, INVALID_BOWLING_NAMES, is_player_name,
+                                generate_team_id, aggregate_players_from_scorecards)
+from .records import BALLS_PER_OVER, as_scorecard, count, balls_value, format_overs
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+class _Rows:
+    """
+    Row values for one table kind, with (name, team) keys interned
+
+    Names are validated once per distinct name - a season has a few thousand
+    players but hundreds of thousands of rows.
+    """
+
+    def __init__(self, invalid_names, fields):
+        """
+        Args:
+            invalid_names: Name filter for summary rows/headers
+            fields: Column names, in the order add() is given values
+        """
+        self.invalid_names = invalid_names
+        self.fields = fields
+        self.keys = {}           # (name, team) -> group index, in first-seen order
+        self.valid = {}          # name -> passes the summary-row/header filter
+        self.group = []
+        self.values = []
+
+    def add(self, name, team, values):
+        valid = self.valid.get(name)
+        if valid is None:
+            valid = self.valid[name] = is_player_name(name, self.invalid_names)
+        if not valid:
+            return
+        key = (name, team)
+        index = self.keys.get(key)
+        if index is None:
+            index = self.keys[key] = len(self.keys)
+        self.group.append(index)
+        self.values.append(values)
+
+    def matrix(self):
+        """Values as an int64 array, one column per field"""
+        return np.array(self.values, dtype=np.int64).reshape(len(self.values), len(self.fields))
+
+    def column(self, matrix, field):
+        return matrix[:, self.fields.index(field)]
+
+
+def flatten_scorecards(scorecards):
+    """
+    Flatten scorecards into batting and bowling row columns
+
+    Returns:
+        tuple: (batting _Rows, bowling _Rows)
+    """
+    batting = _Rows(INVALID_BATTING_NAMES, ('runs', 'balls', 'fours', 'sixes', 'not_out'))
+    bowling = _Rows(INVALID_BOWLING_NAMES, ('balls', 'maidens', 'runs', 'wickets'))
+    not_outs = {}  # how_out text -> not-out flag
+
+    for scorecard in scorecards:
+        scorecard = as_scorecard(scorecard)
+        team1, team2 = scorecard.team1, scorecard.team2
+
+        for innings, team in ((scorecard.team1_innings, team1), (scorecard.team2_innings, team2)):
+            for batsman in innings.batting:
+                not_out = not_outs.get(batsman.how_out)
+                if not_out is None:
+                    not_out = not_outs[batsman.how_out] = int(batsman.not_out)
+                batting.add(batsman.name.strip(), team, (count(batsman.runs), count(batsman.balls),
+                                                         count(batsman.fours), count(batsman.sixes), not_out))
+        # Each team's bowlers are listed in the other team's innings
+        for innings, team in ((scorecard.team2_innings, team1), (scorecard.team1_innings, team2)):
+            for bowler in innings.bowling:
+                bowling.add(bowler.name.strip(), team, (balls_value(bowler.balls), count(bowler.maidens),
+                                                        count(bowler.runs), count(bowler.wickets)))
+
+    return batting, bowling
+
+
+def _grouped_sum(group, values, size):
+    """Integer per-group totals (bincount sums weights as float64 - exact below 2**53)"""
+    return np.bincount(group, weights=values, minlength=size).astype(np.int64)
+
+
+def _team_ids(keys, division_id, season_id):
+    ids = {}
+    for _, team in keys:
+        if team not in ids:
+            ids[team] = generate_team_id(team, division_id, season_id)
+    return ids
+
+
+def _ranked(players, sort_values):
+    """Stable sort by sort_values descending, then number the ranks"""
+    order = np.argsort(-sort_values, kind='stable')
+    ranked = [players[i] for i in order.tolist()]
+    for i, player in enumerate(ranked, 1):
+        player['rank'] = str(i)
+    return ranked
+
+
+def _batting_list(rows, division_id, season_id):
+    size = len(rows.keys)
+    group = np.array(rows.group, dtype=np.int64)
+    matrix = rows.matrix()
+
+    innings = np.bincount(group, minlength=size)
+    runs = _grouped_sum(group, rows.column(matrix, 'runs'), size)
+    balls = _grouped_sum(group, rows.column(matrix, 'balls'), size)
+    fours = _grouped_sum(group, rows.column(matrix, 'fours'), size)
+    sixes = _grouped_sum(group, rows.column(matrix, 'sixes'), size)
+    not_outs = _grouped_sum(group, rows.column(matrix, 'not_out'), size)
+
+    dismissals = innings - not_outs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        average = runs / dismissals
+        strike_rate = (runs / balls) * 100
+
+    team_ids = _team_ids(rows.keys, division_id, season_id)
+    columns = zip(rows.keys, innings.tolist(), runs.tolist(), fours.tolist(), sixes.tolist(),
+                  dismissals.tolist(), balls.tolist(), average.tolist(), strike_rate.tolist())
+    batsmen = [{
+        'rank': '0',
+        'name': name,
+        'team': team,
+        'team_id': team_ids[team],
+        'innings': str(n),
+        'runs': str(r),
+        'strike_rate': str(round(sr, 2) if b > 0 else 0),
+        'fours': str(f),
+        'sixes': str(s),
+        'average': str(round(avg, 2) if d > 0 else r)
+    } for (name, team), n, r, f, s, d, b, avg, sr in columns]
+    return _ranked(batsmen, runs)
+
+
+def _bowling_list(rows, division_id, season_id):
+    size = len(rows.keys)
+    group = np.array(rows.group, dtype=np.int64)
+    matrix = rows.matrix()
+
+    innings = np.bincount(group, minlength=size)
+    balls = _grouped_sum(group, rows.column(matrix, 'balls'), size)
+    maidens = _grouped_sum(group, rows.column(matrix, 'maidens'), size)
+    runs = _grouped_sum(group, rows.column(matrix, 'runs'), size)
+    wickets = _grouped_sum(group, rows.column(matrix, 'wickets'), size)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        average = runs / wickets
+        economy = runs * BALLS_PER_OVER / balls
+
+    team_ids = _team_ids(rows.keys, division_id, season_id)
+    columns = zip(rows.keys, innings.tolist(), balls.tolist(), maidens.tolist(), runs.tolist(),
+                  wickets.tolist(), average.tolist(), economy.tolist())
+    bowlers = [{
+        'rank': '0',
+        'name': name,
+        'team': team,
+        'team_id': team_ids[team],
+        'innings': str(n),
+        'overs': format_overs(b),
+        'maidens': str(m),
+        'runs_given': str(r),
+        'wickets': str(w),
+        'average': str(round(avg, 2) if w > 0 else 0),
+        'economy': str(round(eco, 2) if b > 0 else 0)
+    } for (name, team), n, b, m, r, w, avg, eco in columns]
+    return _ranked(bowlers, wickets)
+
+
+def aggregate_players_columnar(scorecards, teams_list, division_id, season_id):
+    """
+    Drop-in replacement for aggregate_players_from_scorecards
+
+    Args:
+        scorecards: List of Scorecard records (or their dict form)
+        teams_list: List of team names (unused, kept for the same signature)
+        division_id: Division ID for team ID generation
+        season_id: Season ID for team ID generation
+
+    Returns:
+        tuple: (batsmen_list, bowlers_list) identical to the row-at-a-time aggregator
+    """
+    if not HAS_NUMPY:
+        return aggregate_players_from_scorecards(scorecards, teams_list, division_id, season_id)
+
+    print("\n🎯 Aggregating player statistics from scorecards (columnar)...")
+    batting, bowling = flatten_scorecards(scorecards)
+    batsmen_list = _batting_list(batting, division_id, season_id)
+    bowlers_list = _bowling_list(bowling, division_id, season_id)
+    print(f"  ✅ Aggregated {len(batsmen_list)} batsmen and {len(bowlers_list)} bowlers")
+    return batsmen_list, bowlers_list
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache - Persistent on-disk response cache with conditional GET revalidation
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+# URL substring -> seconds a cached page stays fresh (None = never expires)
+DEFAULT_TTLS = {
+    'MatchScorecard.aspx': None,  # Completed match scorecards don't change
+}
+
+
+class CacheEntry:
+    """A stored response body with its validators"""
+
+    def __init__(self, url, body, etag=None, last_modified=None, stored_at=None):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    def validators(self):
+        """Headers for a conditional GET against this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    On-disk cache keyed by URL.
+
+    Fresh entries (per the URL-pattern TTLs) are served without touching the
+    network. Stale entries are revalidated with If-None-Match/If-Modified-Since
+    and a 304 reuses the stored body.
+    """
+
+    def __init__(self, cache_dir='.cache/http', ttls=None, default_ttl=0):
+        """
+        Args:
+            cache_dir: Directory holding cached responses
+            ttls: Dict of URL substring -> freshness in seconds (None = forever)
+            default_ttl: Freshness for URLs matching no pattern (0 = always revalidate)
+        """
+        self.cache_dir = cache_dir
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'bytes_saved': 0,
+            'bytes_downloaded': 0
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def fetch(self, url, get):
+        """
+        Return the body for `url`, going to the network only when needed
+
+        Args:
+            url: URL being fetched
+            get: Callable taking extra request headers and returning a requests.Response
+
+        Returns:
+            bytes: Response body
+        """
+        entry = self.load(url)
+        if entry and self._is_fresh(url, entry):
+            self._count('hits', bytes_saved=len(entry.body))
+            return entry.body
+
+        response = get(entry.validators() if entry else {})
+
+        if response.status_code == 304 and entry:
+            entry.stored_at = time.time()
+            self._save(entry)
+            self._count('revalidated', bytes_saved=len(entry.body))
+            return entry.body
+
+        response.raise_for_status()
+        self._save(CacheEntry(
+            url,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        ))
+        self._count('misses', bytes_downloaded=len(response.content))
+        return response.content
+
+    def ttl_for(self, url):
+        """Freshness lifetime in seconds for a URL (None = never expires)"""
+        for pattern, ttl in self.ttls.items():
+            if pattern in url:
+                return ttl
+        return self.default_ttl
+
+    def load(self, url):
+        """Read the cached entry for a URL, or None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(url, body, meta.get('etag'), meta.get('last_modified'), meta.get('stored_at'))
+
+    def invalidate(self, url):
+        """Drop a URL from the cache so the next fetch goes to the network"""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def summary(self):
+        """One-line report of cache effectiveness"""
+        s = self.stats
+        total = s['hits'] + s['revalidated'] + s['misses']
+        return (f"{total} requests: {s['hits']} hits, {s['revalidated']} revalidated, "
+                f"{s['misses']} misses | {s['bytes_saved'] / 1024:.0f} KB saved, "
+                f"{s['bytes_downloaded'] / 1024:.0f} KB downloaded")
+
+    def _is_fresh(self, url, entry):
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return True
+        return time.time() - entry.stored_at < ttl
+
+    def _count(self, outcome, bytes_saved=0, bytes_downloaded=0):
+        with self._lock:
+            self.stats[outcome] += 1
+            self.stats['bytes_saved'] += bytes_saved
+            self.stats['bytes_downloaded'] += bytes_downloaded
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def _save(self, entry):
+        meta_path, body_path = self._paths(entry.url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        # Body first, then metadata, each via an atomic rename
+        _atomic_write(body_path, entry.body)
+        _atomic_write(meta_path, json.dumps({
+            'url': entry.url,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'stored_at': entry.stored_at
+        }).encode())
+
+
+def _atomic_write(path, data):
+    """Write bytes to path via a temp file + rename so readers never see partial data"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """Process-wide cache used by scrapers that are not given one (None = disabled)"""
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """Enable (or with None, disable) the process-wide cache"""
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Scrape Journal - Append-only checkpoint log so long runs can resume after a crash
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from .records import Scorecard, as_scorecard
+
+
+class ScrapeJournal:
+    """
+    Records completed units of work as JSON lines:
+
+        {"unit": "pages", "division_id": 8, "season_id": 66}
+        {"unit": "scorecard", "division_id": 8, "season_id": 66, "match_id": "27120", "scorecard": {...}}
+        {"unit": "division", "division_id": 8, "season_id": 66}
+
+    "pages" means the division file (teams, batsmen, bowlers, standings,
+    schedule) was written. Each scorecard is journaled with its data as soon
+    as it is parsed, so a resumed run never refetches it. "division" means the
+    whole division, scorecards included, is finished. Every line is flushed
+    and fsynced, and a torn last line from a crash is ignored on load.
+    """
+
+    def __init__(self, path, resume=False):
+        """
+        Args:
+            path: Journal file
+            resume: Keep and replay an existing journal (False starts a fresh one)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._done = set()
+        self._scorecards = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if resume:
+            self._load()
+        else:
+            open(path, 'w').close()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                key = (entry['division_id'], entry['season_id'])
+                if entry['unit'] == 'scorecard':
+                    self._scorecards.setdefault(key, {})[str(entry['match_id'])] = Scorecard.from_dict(entry['scorecard'])
+                else:
+                    self._done.add((entry['unit'],) + key)
+
+    def _append(self, entry):
+        entry['at'] = datetime.now().isoformat()
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def is_done(self, unit, division_id, season_id):
+        """Whether a 'pages' or 'division' unit has completed"""
+        return (unit, division_id, season_id) in self._done
+
+    def mark(self, unit, division_id, season_id):
+        """Record a completed 'pages' or 'division' unit"""
+        self._done.add((unit, division_id, season_id))
+        self._append({'unit': unit, 'division_id': division_id, 'season_id': season_id})
+
+    def scorecards(self, division_id, season_id):
+        """Journaled Scorecard records for a division, by match_id"""
+        return dict(self._scorecards.get((division_id, season_id), {}))
+
+    def mark_scorecard(self, division_id, season_id, scorecard):
+        """Record a fetched and parsed scorecard"""
+        scorecard = as_scorecard(scorecard)
+        self._scorecards.setdefault((division_id, season_id), {})[scorecard.match_id] = scorecard
+        self._append({'unit': 'scorecard', 'division_id': division_id, 'season_id': season_id,
+                      'match_id': scorecard.match_id, 'scorecard': scorecard.to_dict()})
+
+    def summary(self, divisions):
+        """
+        What is left of a planned run
+
+        Args:
+            divisions: List of (division_id, season_id, name) tuples
+
+        Returns:
+            str: Human-readable progress report
+        """
+        done = [d for d in divisions if self.is_done('division', d[0], d[1])]
+        partial = [d for d in divisions if d not in done
+                   and (self.is_done('pages', d[0], d[1]) or self._scorecards.get((d[0], d[1])))]
+        remaining = len(divisions) - len(done)
+        lines = [f"{len(done)}/{len(divisions)} divisions complete, {remaining} remaining"]
+        for div_id, season_id, name in partial:
+            stored = len(self._scorecards.get((div_id, season_id), {}))
+            pages = "pages done" if self.is_done('pages', div_id, season_id) else "pages pending"
+            lines.append(f"   • {name}: {pages}, {stored} scorecards journaled")
+        return "\n".join(lines)
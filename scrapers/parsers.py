@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Parsers - Selectable HTML parser backends with a fast path for table extraction
+"""
+
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+
+def available_backends():
+    """Backends whose libraries are installed"""
+    installed = {'html.parser': True, 'lxml': HAS_LXML, 'selectolax': SelectolaxParser is not None}
+    return [name for name in BACKENDS if installed[name]]
+
+
+def check_backend(backend):
+    """Validate a backend name, raising if it is unknown or not installed"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}', expected one of {', '.join(BACKENDS)}")
+    if backend not in available_backends():
+        raise ImportError(f"Parser backend '{backend}' is not installed (pip install {backend})")
+    return backend
+
+
+class Table:
+    """
+    Backend-neutral view of an HTML table.
+
+    Holds exactly what the scrapers read: the header cell texts, each row's
+    cells as (tag, stripped text) pairs, and the table's raw text. When asked
+    for, also the href of the first link in each cell (None if it has none),
+    row for row alongside the cells.
+    """
+
+    __slots__ = ('headers', 'rows', 'text', 'links')
+
+    def __init__(self, headers, rows, text, links=None):
+        self.headers = headers
+        self.rows = rows
+        self.text = text
+        self.links = links
+
+    def data(self):
+        """Body rows (first row skipped) as lists of td/th texts - extract_table_data's output"""
+        return [[text for _, text in row] for row in self.rows[1:] if row]
+
+    def body_cells(self):
+        """Body rows (first row skipped) as lists of td texts only"""
+        return [[text for tag, text in row if tag == 'td'] for row in self.rows[1:]]
+
+    def data_links(self):
+        """Cell hrefs lined up with data() (all None if links weren't captured)"""
+        links = self.links or [[None] * len(row) for row in self.rows]
+        return [row_links for row, row_links in zip(self.rows[1:], links[1:]) if row]
+
+    def body_cell_links(self):
+        """Cell hrefs lined up with body_cells()"""
+        links = self.links or [[None] * len(row) for row in self.rows]
+        return [[href for (tag, _), href in zip(row, row_links) if tag == 'td']
+                for row, row_links in zip(self.rows[1:], links[1:])]
+
+    @classmethod
+    def from_soup(cls, table, links=False):
+        """Build from a BeautifulSoup <table> tag"""
+        rows = [row.find_all(['td', 'th']) for row in table.find_all('tr')]
+        return cls(
+            [th.get_text(strip=True) for th in table.find_all('th')],
+            [[(cell.name, cell.get_text(strip=True)) for cell in row] for row in rows],
+            table.get_text(),
+            [[_soup_href(cell) for cell in row] for row in rows] if links else None
+        )
+
+    @classmethod
+    def from_node(cls, table, links=False):
+        """Build from a selectolax <table> node"""
+        rows = [row.css('td, th') for row in table.css('tr')]
+        return cls(
+            [th.text(deep=True, strip=True) for th in table.css('th')],
+            [[(cell.tag, cell.text(deep=True, strip=True)) for cell in row] for row in rows],
+            table.text(deep=True),
+            [[_node_href(cell) for cell in row] for row in rows] if links else None
+        )
+
+
+def _soup_href(cell):
+    link = cell.find('a', href=True)
+    return link['href'] if link else None
+
+
+def _node_href(cell):
+    link = cell.css_first('a[href]')
+    return link.attributes.get('href') if link is not None else None
+
+
+# Table tags, plus the script/style/comment blocks whose text is not markup (group 1 is None for those)
+_TABLE_TAG = re.compile(rb'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<(/?)table\b[^>]*>',
+                        re.IGNORECASE | re.DOTALL)
+_TAG_ID = re.compile(rb'\bid\s*=\s*["\']?([^"\'\s>]*)', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w-]+)', re.IGNORECASE)
+
+
+class ParseTarget:
+    """
+    The part of a page a scraper actually reads.
+
+    ARCL pages carry a large __VIEWSTATE blob, menus and scripts around the
+    one or two GridView tables we need. A scraper declares its target and
+    only that part of the page is parsed.
+    """
+
+    __slots__ = ('table_id', 'max_tables', 'tags', 'links')
+
+    def __init__(self, table_id=None, max_tables=None, tags=None, links=False):
+        """
+        Args:
+            table_id: Only tables whose id contains this substring
+            max_tables: Only the first N (matching) tables
+            tags: Tag name(s) to keep when the target isn't a table, e.g. 'a'
+            links: Also capture each table cell's link (Table.links)
+        """
+        self.table_id = table_id
+        self.max_tables = max_tables
+        self.tags = tags
+        self.links = links
+
+    def narrow(self, content):
+        """Pre-slice raw bytes down to the target tables (unchanged if none found)"""
+        if self.tags or not isinstance(content, bytes):
+            return content
+        return slice_tables(content, self.table_id, self.max_tables) or content
+
+    def strainer(self):
+        """SoupStrainer for tag targets, or None"""
+        return SoupStrainer(self.tags) if self.tags else None
+
+
+def slice_tables(content, table_id=None, max_tables=None):
+    """
+    Cut the raw HTML of the wanted tables out of a page
+
+    Tables are matched at any nesting depth (GridViews often sit inside layout
+    tables) and kept whole, nested tables included. '<table' inside scripts,
+    styles and comments is not markup and is skipped, as a parser would. The
+    page's charset declaration is carried over so the slice decodes like the
+    full page.
+
+    Returns:
+        bytes: The concatenated tables, or b'' if none matched
+    """
+    pieces = []
+    depth = 0
+    capture_start = None
+    capture_depth = None
+    first_table = None
+
+    for match in _TABLE_TAG.finditer(content):
+        if match.group(1) is None:
+            continue
+        if first_table is None:
+            first_table = match.start()
+        if match.group(1):
+            depth = max(depth - 1, 0)
+            if capture_start is not None and depth == capture_depth:
+                pieces.append(content[capture_start:match.end()])
+                capture_start = None
+                if max_tables and len(pieces) >= max_tables:
+                    break
+            continue
+
+        if capture_start is None and (depth == 0 or table_id) and _id_matches(match.group(0), table_id):
+            capture_start = match.start()
+            capture_depth = depth
+        depth += 1
+
+    if not pieces:
+        return b''
+    charset = _META_CHARSET.search(content, 0, first_table)
+    prefix = b'<meta charset="' + charset.group(1) + b'">' if charset else b''
+    return prefix + b''.join(pieces)
+
+
+def _id_matches(tag, table_id):
+    if table_id is None:
+        return True
+    found = _TAG_ID.search(tag)
+    return bool(found) and table_id.encode() in found.group(1)
+
+
+def make_soup(content, backend='html.parser', target=None, partial=True):
+    """
+    Build a BeautifulSoup tree for scrapers that walk the page
+
+    selectolax has no BeautifulSoup builder, so it gets lxml when available.
+    With a target (and partial=True) only the targeted elements are built.
+    """
+    builder = 'lxml' if backend == 'lxml' or (backend == 'selectolax' and HAS_LXML) else 'html.parser'
+    if target is None or not partial:
+        return BeautifulSoup(content, builder)
+    return BeautifulSoup(target.narrow(content), builder, parse_only=target.strainer())
+
+
+def find_tables(content, backend='html.parser', target=None, partial=True):
+    """
+    Extract tables from a raw page
+
+    Args:
+        content: Page body (bytes or str)
+        backend: One of BACKENDS
+        target: ParseTarget choosing which tables (None = all)
+        partial: Pre-slice the raw bytes to the target before parsing
+            (BeautifulSoup backends only - lexbor parses the whole page
+            faster than the slice can be cut, and only materialises the
+            nodes we select anyway)
+
+    Returns:
+        list: Table objects in document order
+    """
+    table_id = target.table_id if target else None
+    limit = target.max_tables if target else None
+    links = target.links if target else False
+
+    if backend == 'selectolax':
+        tree = SelectolaxParser(content)
+        selector = f'table[id*="{table_id}"]' if table_id else 'table'
+        if limit == 1:
+            node = tree.css_first(selector)
+            return [Table.from_node(node, links)] if node is not None else []
+        return [Table.from_node(node, links) for node in tree.css(selector)[:limit]]
+
+    if target and partial:
+        content = target.narrow(content)
+    soup = make_soup(content, backend)
+    attrs = {'id': lambda x: x and table_id in x} if table_id else {}
+    return [Table.from_soup(table, links) for table in soup.find_all('table', attrs, limit=limit)]
+
+
+_default_backend = 'html.parser'
+
+
+def get_default_parser():
+    """Backend used by scrapers that are not given one"""
+    return _default_backend
+
+
+def set_default_parser(backend):
+    """Switch every scraper's default backend"""
+    global _default_backend
+    _default_backend = check_backend(backend)
@@ -5,6 +5,26 @@ This extracts ALL players who participated in matches, not just top 25
 
 import hashlib
 from collections import defaultdict
+from .records import BALLS_PER_OVER, as_scorecard, count, balls_value, format_overs
+from .boundary_aggregator import boundary_entry
+
+
+# Summary rows and column headers that show up in the batting/bowling tables
+INVALID_BATTING_NAMES = ['overs', 'extras', 'byes', 'total', 'did not bat', 'yet to bat', 'fall of wicket', 'fow',
+                         'rate', 'strike', 'average', 'balls', 'runs', 'wickets', 'economy', 'maiden']
+INVALID_BOWLING_NAMES = ['overs', 'extras', 'byes', 'total', 'did not bat', 'yet to bat',
+                         'rate', 'strike', 'average', 'balls', 'runs', 'wickets', 'economy', 'maiden']
+
+
+def is_player_name(name, invalid_names):
+    """Whether a stripped row name is a real player (not a summary row or header)"""
+    if not name:
+        return False
+    name_lower = name.lower()
+    if any(invalid in name_lower for invalid in invalid_names):
+        return False
+    # Also skip if name is very short (likely a column header)
+    return len(name) > 2
 
 
 def generate_team_id(team_name, division_id, season_id):
@@ -19,7 +39,7 @@ def aggregate_players_from_scorecards(scorecards, teams_list, division_id, seaso
     Aggregate all player statistics from scorecards
     
     Args:
-        scorecards: List of scorecard dictionaries
+        scorecards: List of Scorecard records (or their dict form)
         teams_list: List of team names to match players to teams
         division_id: Division ID for team ID generation
         season_id: Season ID for team ID generation
@@ -27,6 +47,26 @@ def aggregate_players_from_scorecards(scorecards, teams_list, division_id, seaso
     Returns:
         tuple: (batsmen_list, bowlers_list) with aggregated stats
     """
+    batsmen_list, bowlers_list, _ = aggregate_scorecards(scorecards, division_id, season_id)
+    return batsmen_list, bowlers_list
+
+
+def aggregate_scorecards(scorecards, division_id, season_id):
+    """
+    Batting, bowling and boundary statistics in one pass over the scorecards
+    
+    Boundaries come from the same per-(name, team) batting totals, so a name
+    shared by players on two teams is never merged.
+    
+    Args:
+        scorecards: List of Scorecard records (or their dict form)
+        division_id: Division ID for team ID generation
+        season_id: Season ID for team ID generation
+        
+    Returns:
+        tuple: (batsmen_list, bowlers_list, boundary_data), boundary_data keyed
+               by (name, team) in aggregate_boundaries' format
+    """
     print("\n🎯 Aggregating player statistics from scorecards...")
     
     # Track player stats by team
@@ -45,7 +85,7 @@ def aggregate_players_from_scorecards(scorecards, teams_list, division_id, seaso
         'name': '',
         'team': '',
         'innings': 0,
-        'overs': 0.0,
+        'balls': 0,
         'maidens': 0,
         'runs': 0,
         'wickets': 0,
@@ -55,61 +95,46 @@ def aggregate_players_from_scorecards(scorecards, teams_list, division_id, seaso
     
     # Process each scorecard
     for scorecard in scorecards:
-        match_info = scorecard.get('match_info', {})
-        team1 = match_info.get('team1', '')
-        team2 = match_info.get('team2', '')
+        scorecard = as_scorecard(scorecard)
+        team1 = scorecard.team1
+        team2 = scorecard.team2
         
         # Process team 1 batting
-        for batsman in scorecard.get('team1_innings', {}).get('batting', []):
+        for batsman in scorecard.team1_innings.batting:
             _aggregate_batting(batsman, team1, batting_stats, division_id, season_id)
         
         # Process team 2 batting
-        for batsman in scorecard.get('team2_innings', {}).get('batting', []):
+        for batsman in scorecard.team2_innings.batting:
             _aggregate_batting(batsman, team2, batting_stats, division_id, season_id)
         
         # Process team 1 bowling (they bowled to team 2)
-        for bowler in scorecard.get('team2_innings', {}).get('bowling', []):
+        for bowler in scorecard.team2_innings.bowling:
             _aggregate_bowling(bowler, team1, bowling_stats, division_id, season_id)
         
         # Process team 2 bowling (they bowled to team 1)
-        for bowler in scorecard.get('team1_innings', {}).get('bowling', []):
+        for bowler in scorecard.team1_innings.bowling:
             _aggregate_bowling(bowler, team2, bowling_stats, division_id, season_id)
     
+    boundary_data = {key: boundary_entry(stats['fours'], stats['sixes'], stats['innings'])
+                     for key, stats in batting_stats.items()}
+    
     # Convert to lists and calculate averages
     batsmen_list = _finalize_batting_stats(batting_stats)
     bowlers_list = _finalize_bowling_stats(bowling_stats)
     
     print(f"  ✅ Aggregated {len(batsmen_list)} batsmen and {len(bowlers_list)} bowlers")
     
-    # Sort by performance
-    batsmen_list.sort(key=lambda x: int(x.get('runs', 0)), reverse=True)
-    bowlers_list.sort(key=lambda x: int(x.get('wickets', 0)), reverse=True)
-    
-    # Add rankings
-    for i, batsman in enumerate(batsmen_list, 1):
-        batsman['rank'] = str(i)
-    
-    for i, bowler in enumerate(bowlers_list, 1):
-        bowler['rank'] = str(i)
+    _rank_players(batsmen_list, bowlers_list)
     
-    return batsmen_list, bowlers_list
+    return batsmen_list, bowlers_list, boundary_data
 
 
 def _aggregate_batting(batsman, team, batting_stats, division_id, season_id):
-    """Add batting performance to aggregated stats"""
-    name = batsman.get('name', '').strip()
-    if not name:
-        return
+    """Add a BattingEntry to aggregated stats"""
+    name = batsman.name.strip()
     
     # Skip invalid/summary rows and column headers
-    name_lower = name.lower()
-    invalid_names = ['overs', 'extras', 'total', 'did not bat', 'yet to bat', 'fall of wicket', 'fow', 
-                     'rate', 'strike', 'average', 'balls', 'runs', 'wickets', 'economy', 'maiden']
-    if any(invalid in name_lower for invalid in invalid_names):
-        return
-    
-    # Also skip if name is very short (likely a column header)
-    if len(name) <= 2:
+    if not is_player_name(name, INVALID_BATTING_NAMES):
         return
     
     team_id = generate_team_id(team, division_id, season_id)
@@ -121,47 +146,22 @@ def _aggregate_batting(batsman, team, batting_stats, division_id, season_id):
     stats['team_id'] = team_id
     stats['innings'] += 1
     
-    try:
-        stats['runs'] += int(batsman.get('runs', 0))
-    except:
-        pass
-    
-    try:
-        stats['balls'] += int(batsman.get('balls', 0))
-    except:
-        pass
-    
-    try:
-        stats['fours'] += int(batsman.get('fours', 0))
-    except:
-        pass
+    # Blank or non-numeric cells count as 0
+    stats['runs'] += count(batsman.runs)
+    stats['balls'] += count(batsman.balls)
+    stats['fours'] += count(batsman.fours)
+    stats['sixes'] += count(batsman.sixes)
     
-    try:
-        stats['sixes'] += int(batsman.get('sixes', 0))
-    except:
-        pass
-    
-    # Check if not out
-    how_out = batsman.get('how_out', '').lower()
-    if 'not out' in how_out or 'n.o' in how_out:
+    if batsman.not_out:
         stats['not_outs'] += 1
 
 
 def _aggregate_bowling(bowler, team, bowling_stats, division_id, season_id):
-    """Add bowling performance to aggregated stats"""
-    name = bowler.get('name', '').strip()
-    if not name:
-        return
+    """Add a BowlingEntry to aggregated stats"""
+    name = bowler.name.strip()
     
     # Skip invalid/summary rows and column headers
-    name_lower = name.lower()
-    invalid_names = ['overs', 'extras', 'total', 'did not bat', 'yet to bat',
-                     'rate', 'strike', 'average', 'balls', 'runs', 'wickets', 'economy', 'maiden']
-    if any(invalid in name_lower for invalid in invalid_names):
-        return
-    
-    # Also skip if name is very short (likely a column header)
-    if len(name) <= 2:
+    if not is_player_name(name, INVALID_BOWLING_NAMES):
         return
     
     team_id = generate_team_id(team, division_id, season_id)
@@ -173,35 +173,25 @@ def _aggregate_bowling(bowler, team, bowling_stats, division_id, season_id):
     stats['team_id'] = team_id
     stats['innings'] += 1
     
-    try:
-        stats['overs'] += float(bowler.get('overs', 0))
-    except:
-        pass
-    
-    try:
-        stats['maidens'] += int(bowler.get('maidens', 0))
-    except:
-        pass
-    
-    try:
-        stats['runs'] += int(bowler.get('runs', 0))
-    except:
-        pass
-    
-    try:
-        stats['wickets'] += int(bowler.get('wickets', 0))
-    except:
-        pass
+    # Blank or non-numeric cells count as 0
+    stats['balls'] += balls_value(bowler.balls)
+    stats['maidens'] += count(bowler.maidens)
+    stats['runs'] += count(bowler.runs)
+    stats['wickets'] += count(bowler.wickets)
+    stats['wides'] += count(bowler.wides)
+    stats['no_balls'] += count(bowler.no_balls)
+
+
+def _rank_players(batsmen, bowlers):
+    """Sort by runs/wickets (stable, so ties keep first-appearance order) and number the ranks"""
+    batsmen.sort(key=lambda x: int(x.get('runs', 0)), reverse=True)
+    bowlers.sort(key=lambda x: int(x.get('wickets', 0)), reverse=True)
     
-    try:
-        stats['wides'] += int(bowler.get('wides', 0))
-    except:
-        pass
+    for i, batsman in enumerate(batsmen, 1):
+        batsman['rank'] = str(i)
     
-    try:
-        stats['no_balls'] += int(bowler.get('no_balls', 0))
-    except:
-        pass
+    for i, bowler in enumerate(bowlers, 1):
+        bowler['rank'] = str(i)
 
 
 def _finalize_batting_stats(batting_stats):
@@ -242,15 +232,15 @@ def _finalize_bowling_stats(bowling_stats):
     bowlers = []
     
     for (name, team), stats in bowling_stats.items():
-        overs = stats['overs']
+        balls = stats['balls']
         runs = stats['runs']
         wickets = stats['wickets']
         
         # Calculate average
         average = round(runs / wickets, 2) if wickets > 0 else 0
         
-        # Calculate economy
-        economy = round(runs / overs, 2) if overs > 0 else 0
+        # Calculate economy (runs per six legal balls - 3.5 overs is 23 balls, not 3.5 overs)
+        economy = round(runs * BALLS_PER_OVER / balls, 2) if balls > 0 else 0
         
         bowlers.append({
             'rank': '0',  # Will be set later
@@ -258,7 +248,7 @@ def _finalize_bowling_stats(bowling_stats):
             'team': team,
             'team_id': stats['team_id'],
             'innings': str(stats['innings']),
-            'overs': str(overs),
+            'overs': format_overs(balls),
             'maidens': str(stats['maidens']),
             'runs_given': str(runs),
             'wickets': str(wickets),
@@ -4,6 +4,10 @@ Player Detail Scraper - Get match-by-match player performance
 """
 
 from .base_scraper import BaseScraper
+from .player_index import player_id_from_href
+from .records import BALLS_PER_OVER, overs_to_balls
+import html
+import re
 import statistics
 
 
@@ -53,16 +57,19 @@ class PlayerDetailScraper(BaseScraper):
                 cells = row.find_all('td')
                 if len(cells) >= 9:
                     try:
+                        # Overs cell is cricket notation: '3.4' is 22 legal balls, not 3.4 overs
+                        balls = overs_to_balls(cells[3].get_text(strip=True) or '0')
+                        runs = int(cells[5].get_text(strip=True) or 0)
                         bowling_matches.append({
                             "date": cells[0].get_text(strip=True),
                             "team": cells[1].get_text(strip=True),
                             "opposition": cells[2].get_text(strip=True),
-                            "overs": float(cells[3].get_text(strip=True) or 0),
+                            "balls": balls,
                             "maidens": int(cells[4].get_text(strip=True) or 0),
-                            "runs": int(cells[5].get_text(strip=True) or 0),
+                            "runs": runs,
                             "wickets": int(cells[6].get_text(strip=True) or 0),
                             "average": float(cells[7].get_text(strip=True) or 0),
-                            "economy": float(cells[8].get_text(strip=True) or 0)
+                            "economy": round(runs * BALLS_PER_OVER / balls, 2) if balls > 0 else 0
                         })
                     except (ValueError, IndexError):
                         continue
@@ -130,12 +137,6 @@ class PlayerDetailScraper(BaseScraper):
     
     def extract_player_id(self, stats_row_html):
         """Extract player ID from stats page HTML row"""
-        # This will be used to extract player IDs from batting/bowling stats pages
-        try:
-            if 'player_id=' in stats_row_html:
-                start = stats_row_html.find('player_id=') + len('player_id=')
-                end = stats_row_html.find('&', start) if '&' in stats_row_html[start:] else stats_row_html.find('"', start)
-                return stats_row_html[start:end]
-        except:
-            pass
-        return None
+        # Stats/scorecard scrapers read IDs from parsed links; this handles a raw row
+        match = re.search(r'href="([^"]*player_id=[^"]*)"', stats_row_html or '')
+        return player_id_from_href(html.unescape(match.group(1))) if match else None
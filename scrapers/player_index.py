@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Player Index - Stable ARCL player IDs with name, alias and team/season lookup
+
+MaxRuns, MaxWickets, PlayerStats and scorecard pages link player names to
+PlayerStats.aspx?...&player_id=N. The index records every (player_id, name,
+team, division, season) seen, so later joins are a dict lookup:
+
+    (normalized name, team, season) -> (normalized name, team) -> unique normalized name
+
+Names are normalized once (case, spacing, dots, captain/keeper markers).
+Spellings other than the first one seen are kept as aliases. A name shared by
+two player IDs is never resolved by name alone.
+"""
+
+import json
+import os
+import re
+from urllib.parse import urlparse, parse_qs
+from .player_aggregator import INVALID_BATTING_NAMES, INVALID_BOWLING_NAMES, is_player_name
+
+
+# Captain / wicket-keeper / not-out markers that pages append to names
+_NAME_MARKERS = re.compile(r'\((?:c|wk|c\s*&\s*wk|capt)\)|[*†]', re.IGNORECASE)
+
+
+def player_id_from_href(href):
+    """'PlayerStats.aspx?team_id=1&player_id=42&...' -> '42' (None if not a player link)"""
+    if not href or 'player_id=' not in href:
+        return None
+    values = parse_qs(urlparse(href).query).get('player_id')
+    return values[0] if values and values[0] else None
+
+
+def normalize_name(name):
+    """'  Raj  Kumar R. (c)' -> 'raj kumar r'"""
+    name = _NAME_MARKERS.sub(' ', name or '')
+    return ' '.join(name.replace('.', ' ').casefold().split())
+
+
+class PlayerIndex:
+    """
+    Persistent player identity index
+
+    Args:
+        path: JSON file the index is loaded from / saved to (optional)
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = path
+        # player_id -> {'name', 'aliases': [...], 'history': [[team, division_id, season_id]]}
+        self.players = {}
+        # Manually added spellings: normalized alias -> player_id
+        self.aliases = {}
+        self._by_name = {}        # normalized name -> [player_id, ...]
+        self._by_team = {}        # (normalized name, team) -> player_id
+        self._by_season = {}      # (normalized name, team, season_id) -> player_id
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved index, or start an empty one if missing or unreadable"""
+        index = cls(path)
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            if saved.get('version') != cls.VERSION:
+                return index
+            for player_id, player in saved['players'].items():
+                index.players[player_id] = player
+                for name in [player['name']] + player['aliases']:
+                    index._link_name(player_id, name)
+                for team, _, season_id in player['history']:
+                    for name in [player['name']] + player['aliases']:
+                        index._link_team(player_id, name, team, season_id)
+            index.aliases = saved.get('aliases', {})
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"  ⚠️  Ignoring unreadable {path}: {e}")
+            return cls(path)
+        return index
+
+    def save(self, path=None):
+        """Write the index via a temp file + rename"""
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'players': self.players, 'aliases': self.aliases}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _link_name(self, player_id, name):
+        ids = self._by_name.setdefault(normalize_name(name), [])
+        if player_id not in ids:
+            ids.append(player_id)
+
+    def _link_team(self, player_id, name, team, season_id):
+        key = normalize_name(name)
+        self._by_team[(key, team)] = player_id
+        self._by_season[(key, team, season_id)] = player_id
+
+    def observe(self, player_id, name, team=None, division_id=None, season_id=None):
+        """
+        Record a player link seen on a page
+
+        Returns:
+            bool: True if this told the index something new
+        """
+        player_id = str(player_id)
+        name = name.strip()
+        player = self.players.get(player_id)
+        changed = False
+        if player is None:
+            player = self.players[player_id] = {'name': name, 'aliases': [], 'history': []}
+            changed = True
+        elif name != player['name'] and name not in player['aliases']:
+            player['aliases'].append(name)
+            changed = True
+        self._link_name(player_id, name)
+        if team:
+            appearance = [team, division_id, season_id]
+            if appearance not in player['history']:
+                player['history'].append(appearance)
+                changed = True
+            self._link_team(player_id, name, team, season_id)
+        return changed
+
+    def add_alias(self, player_id, alias):
+        """Map another spelling to a player (e.g. a nickname used on scorecards)"""
+        self.aliases[normalize_name(alias)] = str(player_id)
+
+    def lookup(self, name, team=None, season_id=None):
+        """
+        player_id for a name, most specific match first
+
+        Returns:
+            str: The player ID, or None if unknown or ambiguous
+        """
+        key = normalize_name(name)
+        if team is not None:
+            player_id = self._by_season.get((key, team, season_id)) or self._by_team.get((key, team))
+            if player_id:
+                return player_id
+        if key in self.aliases:
+            return self.aliases[key]
+        ids = self._by_name.get(key)
+        return ids[0] if ids and len(ids) == 1 else None
+
+    def annotate(self, players, season_id=None):
+        """
+        Set 'player_id' on player dicts (batsmen/bowlers lists) that resolve
+
+        Returns:
+            int: Rows that have a player_id afterwards
+        """
+        resolved = 0
+        for player in players:
+            player_id = player.get('player_id') or self.lookup(player['name'], player.get('team'), season_id)
+            if player_id:
+                player['player_id'] = player_id
+                resolved += 1
+        return resolved
+
+    def observe_players(self, players, division_id, season_id):
+        """Record the player links on scraped batsmen/bowlers rows"""
+        return sum(1 for player in players if player.get('player_id')
+                   and self.observe(player['player_id'], player['name'], player.get('team'), division_id, season_id))
+
+    def observe_scorecard(self, scorecard, division_id, season_id):
+        """Record the player links on a Scorecard's batting and bowling rows (summary rows skipped)"""
+        changed = 0
+        # Each team's bowlers are listed in the other team's innings
+        for entries, team, invalid_names in ((scorecard.team1_innings.batting, scorecard.team1, INVALID_BATTING_NAMES),
+                                             (scorecard.team2_innings.batting, scorecard.team2, INVALID_BATTING_NAMES),
+                                             (scorecard.team2_innings.bowling, scorecard.team1, INVALID_BOWLING_NAMES),
+                                             (scorecard.team1_innings.bowling, scorecard.team2, INVALID_BOWLING_NAMES)):
+            for entry in entries:
+                if entry.player_id and is_player_name(entry.name, invalid_names):
+                    changed += self.observe(entry.player_id, entry.name, team, division_id, season_id)
+        return changed
+
+    def summary(self):
+        aliased = sum(1 for player in self.players.values() if player['aliases'])
+        return f"{len(self.players)} players ({aliased} with aliases, {len(self.aliases)} manual aliases)"
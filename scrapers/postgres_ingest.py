@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Postgres Ingest - Bulk load scraper output into the azure/schema.sql PostgreSQL database
+
+Each file is loaded in one transaction:
+
+    1. COPY its rows (scrapers/schema_rows.py) into temp staging tables
+    2. Merge every staging table with one set-based INSERT ... SELECT ...
+       ON CONFLICT on the natural key. Scorecard detail rows are replaced per
+       innings with one DELETE ... USING and one INSERT ... SELECT.
+    3. Recount fifties/hundreds and four/five-wicket hauls for the file's players
+
+There is no per-row round trip, so a season of scorecards is a few dozen
+statements. Every file is recorded in scrape_jobs (committed separately, so a
+failed file is still recorded) with rows staged/inserted/updated per table and
+the read, COPY and merge times.
+
+Needs psycopg 3 (pip install "psycopg[binary]"). The connection string
+comes from DATABASE_URL, as in azure/README.md:
+
+    DATABASE_URL=postgresql://localhost/arcl python3 -m scrapers.postgres_ingest [data_dir]
+"""
+
+import json
+import os
+import sys
+import time
+import uuid
+from .records import load_scorecards
+from .schema_rows import SCHEMA_PATH, COLUMNS, KEYS, conflict_clause, data_files, division_rows, scorecard_rows
+
+try:
+    import psycopg
+    from psycopg import sql
+    HAS_PSYCOPG = True
+except ImportError:
+    psycopg = None
+    HAS_PSYCOPG = False
+
+
+# Merge order - parents before the rows whose foreign keys point at them
+DIVISION_TABLES = ('divisions', 'teams', 'players', 'batting_stats', 'bowling_stats', 'matches')
+SCORECARD_TABLES = ('divisions', 'teams', 'matches', 'players', 'scorecards', 'innings_details', 'bowling_details')
+
+# Rows from scorecards that only fill gaps left by a missing division file
+STUB_TABLES = {'scorecards': ('divisions', 'teams', 'matches')}
+
+DETAIL_TABLES = ('innings_details', 'bowling_details')
+
+
+def _staging_sql(table):
+    """Temp table with the target's column types, dropped at commit"""
+    if table in DETAIL_TABLES:
+        # Detail rows are staged with their scorecard's natural key instead of scorecard_id
+        columns = ', '.join(f"{'s' if column in KEYS['scorecards'] else 'd'}.{column}" for column in COLUMNS[table])
+        source = f"{table} d, scorecards s"
+    else:
+        columns = ', '.join(COLUMNS[table])
+        source = table
+    return f"CREATE TEMP TABLE stage_{table} ON COMMIT DROP AS SELECT {columns} FROM {source} WITH NO DATA"
+
+
+def _merge_sql(table, stub=False):
+    """Set-based upsert of a staging table, returning (inserted, updated)"""
+    columns = ', '.join(COLUMNS[table])
+    keys = ', '.join(KEYS[table])
+    return f"""
+        WITH merged AS (
+            INSERT INTO {table} ({columns})
+            SELECT DISTINCT ON ({keys}) {columns} FROM stage_{table} ORDER BY {keys}
+            {conflict_clause(table, stub)}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted) FROM merged
+    """
+
+
+def _replace_details_sql(table):
+    """Delete the staged innings' detail rows, then insert the staged ones; returns the DELETE and INSERT"""
+    columns = COLUMNS[table][3:]
+    delete = f"""
+        DELETE FROM {table} d USING scorecards s, stage_scorecards st
+        WHERE d.scorecard_id = s.id
+          AND s.match_id = st.match_id AND s.team_id = st.team_id AND s.innings = st.innings
+    """
+    insert = f"""
+        INSERT INTO {table} (scorecard_id, {', '.join(columns)})
+        SELECT s.id, {', '.join('st.' + column for column in columns)}
+        FROM stage_{table} st JOIN scorecards s USING (match_id, team_id, innings)
+    """
+    return delete, insert
+
+
+RECOUNT_MILESTONES_SQL = ("""
+    UPDATE batting_stats b SET
+        fifties = (SELECT COUNT(*) FROM innings_details d
+                   WHERE d.player_id = b.player_id AND d.runs >= 50 AND d.runs < 100),
+        hundreds = (SELECT COUNT(*) FROM innings_details d WHERE d.player_id = b.player_id AND d.runs >= 100)
+    WHERE b.season_id = %s AND b.player_id IN (SELECT player_id FROM stage_players)
+""", """
+    UPDATE bowling_stats b SET
+        four_wickets = (SELECT COUNT(*) FROM bowling_details d WHERE d.player_id = b.player_id AND d.wickets = 4),
+        five_wickets = (SELECT COUNT(*) FROM bowling_details d WHERE d.player_id = b.player_id AND d.wickets >= 5)
+    WHERE b.season_id = %s AND b.player_id IN (SELECT player_id FROM stage_players)
+""")
+
+
+class PostgresIngest:
+    """
+    COPY + staging-table ingest into the azure/schema.sql tables
+
+    Args:
+        dsn: PostgreSQL connection string (default: DATABASE_URL)
+        schema: Schema to load into (default: the connection's search_path)
+        create_schema: Run azure/schema.sql first if its tables don't exist yet
+    """
+
+    def __init__(self, dsn=None, schema=None, create_schema=True):
+        if not HAS_PSYCOPG:
+            raise ImportError('PostgreSQL ingest needs psycopg 3 (pip install "psycopg[binary]")')
+        dsn = dsn or os.environ.get('DATABASE_URL')
+        if not dsn:
+            raise ValueError("No PostgreSQL connection string (pass dsn or set DATABASE_URL)")
+        # Autocommit: scrape_jobs rows commit on their own; each file runs in an explicit transaction
+        self.conn = psycopg.connect(dsn, autocommit=True)
+        if schema:
+            self.conn.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema)))
+            self.conn.execute(sql.SQL("SET search_path TO {}").format(sql.Identifier(schema)))
+        if create_schema and self.conn.execute("SELECT to_regclass('scrape_jobs')").fetchone()[0] is None:
+            with open(SCHEMA_PATH, 'r') as f:
+                self.conn.execute(f.read())
+        # Groups the scrape_jobs rows of one ingest run
+        self.run_id = uuid.uuid4().hex
+
+    def close(self):
+        self.conn.close()
+
+    def ingest_dir(self, data_dir='data'):
+        """
+        Ingest every division file, then every scorecard file, in data_dir
+
+        Returns:
+            list: One job summary dict per file (as stored in scrape_jobs.metadata)
+        """
+        files = data_files(data_dir)
+        print(f"\n🐘 Ingesting {len(files)} files into PostgreSQL (run {self.run_id[:8]})...")
+        start = time.perf_counter()
+        jobs = []
+        for kind, path, division_id, season_id in files:
+            job = self.ingest_file(kind, path, division_id, season_id)
+            jobs.append(job)
+            if job['status'] == 'completed':
+                print(f"  ✓ {os.path.basename(path)}: {job['staged']} rows staged, {job['inserted']} inserted, "
+                      f"{job['updated']} updated ({sum(job['seconds'].values()) * 1000:.0f} ms)")
+            else:
+                print(f"  ❌ {os.path.basename(path)}: {job['error']}")
+        failed = sum(1 for job in jobs if job['status'] == 'failed')
+        print(f"{'✅' if not failed else '⚠️ '} Ingested {len(jobs) - failed}/{len(jobs)} files "
+              f"in {time.perf_counter() - start:.2f}s")
+        return jobs
+
+    def ingest_file(self, kind, path, division_id, season_id):
+        """
+        Ingest one division or scorecard file in one transaction, recording it in scrape_jobs
+
+        Args:
+            kind: 'division' or 'scorecards' (see schema_rows.data_files)
+
+        Returns:
+            dict: Job summary - status, per-table counts, phase seconds
+        """
+        job = {'run_id': self.run_id, 'file': os.path.basename(path), 'status': 'running', 'tables': {},
+               'seconds': {}}
+        job_id = self.conn.execute("""
+            INSERT INTO scrape_jobs (job_type, division_id, season_id, status, metadata)
+            VALUES (%s, %s, %s, 'running', %s::jsonb) RETURNING id
+        """, ('full' if kind == 'division' else 'scorecards', division_id, season_id, json.dumps(job))).fetchone()[0]
+
+        try:
+            phase = time.perf_counter()
+            if kind == 'division':
+                with open(path, 'r') as f:
+                    rows = division_rows(json.load(f))
+                tables = DIVISION_TABLES
+            else:
+                rows = scorecard_rows(load_scorecards(path), division_id, season_id)
+                tables = SCORECARD_TABLES
+            job['seconds']['read'] = time.perf_counter() - phase
+
+            with self.conn.transaction():
+                with self.conn.cursor() as cur:
+                    phase = time.perf_counter()
+                    for table in tables:
+                        cur.execute(_staging_sql(table))
+                        with cur.copy(f"COPY stage_{table} ({', '.join(COLUMNS[table])}) FROM STDIN") as copy:
+                            for row in rows[table]:
+                                copy.write_row(row)
+                    job['seconds']['copy'] = time.perf_counter() - phase
+
+                    phase = time.perf_counter()
+                    stubs = STUB_TABLES.get(kind, ())
+                    for table in tables:
+                        if table in DETAIL_TABLES:
+                            delete, insert = _replace_details_sql(table)
+                            cur.execute(delete)
+                            replaced = cur.rowcount
+                            cur.execute(insert)
+                            inserted, updated = cur.rowcount, 0
+                            job['tables'][table] = {'staged': len(rows[table]), 'inserted': inserted,
+                                                    'updated': updated, 'replaced': replaced}
+                        else:
+                            inserted, updated = cur.execute(_merge_sql(table, table in stubs)).fetchone()
+                            job['tables'][table] = {'staged': len(rows[table]), 'inserted': inserted,
+                                                    'updated': updated}
+                    if kind == 'scorecards':
+                        for recount in RECOUNT_MILESTONES_SQL:
+                            cur.execute(recount, (season_id,))
+                    job['seconds']['merge'] = time.perf_counter() - phase
+            job['status'] = 'completed'
+        except Exception as e:
+            # The transaction rolled back - nothing from this file was merged
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            job['tables'] = {}
+
+        job['staged'] = sum(counts['staged'] for counts in job['tables'].values())
+        job['inserted'] = sum(counts['inserted'] for counts in job['tables'].values())
+        job['updated'] = sum(counts['updated'] for counts in job['tables'].values())
+        self.conn.execute("""
+            UPDATE scrape_jobs SET status = %s, completed_at = CURRENT_TIMESTAMP, records_processed = %s,
+                records_inserted = %s, records_updated = %s, error_message = %s, metadata = %s::jsonb
+            WHERE id = %s
+        """, (job['status'], job['staged'], job['inserted'], job['updated'], job.get('error'), json.dumps(job),
+              job_id))
+        return job
+
+
+def main():
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    ingest = PostgresIngest()
+    jobs = ingest.ingest_dir(data_dir)
+    ingest.close()
+    sys.exit(1 if any(job['status'] == 'failed' for job in jobs) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Publisher - Minified, precompressed copies of the data files the app downloads
+
+The scraper keeps writing indented JSON, because it diffs well in git. This
+stage re-serializes each division, scorecard and career file minified, with
+orjson when it is installed, into data/publish/. Next to each file it writes
+precompressed sidecars:
+
+    data/publish/scorecards_div_8_season_66.json
+    data/publish/scorecards_div_8_season_66.json.gz   (gzip -9, mtime 0, so reruns are byte-identical)
+    data/publish/scorecards_div_8_season_66.json.br   (brotli -q 11, if brotli is installed)
+
+The document shape is unchanged, including string-valued numbers, so the
+app's decoders read the published files as they are. Files whose minified
+bytes are unchanged are not rewritten. Every file is reported with its size
+before/after, its compressed sizes, and the serialization time of
+json.dumps(indent=2) vs. the compact serializer.
+
+    python3 -m scrapers.publisher [data_dir] [publish_dir]
+"""
+
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    brotli = None
+    HAS_BROTLI = False
+
+
+# Files the app downloads, relative to the data directory
+PUBLISH_PATTERNS = ('div_*_season_*.json', 'scorecards_div_*_season_*.json', 'career_stats.json')
+
+
+def dumps_compact(data):
+    """Minified UTF-8 JSON bytes - orjson if installed, else the stdlib with no whitespace"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def compress_sidecars(payload):
+    """{'.gz': bytes, '.br': bytes} - .br only with brotli installed"""
+    sidecars = {'.gz': gzip.compress(payload, compresslevel=9, mtime=0)}
+    if HAS_BROTLI:
+        sidecars['.br'] = brotli.compress(payload, quality=11)
+    return sidecars
+
+
+def _best_time(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _atomic_write(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _unchanged(path, payload, suffixes):
+    """Published file already has these bytes and all its sidecars"""
+    if not all(os.path.exists(path + suffix) for suffix in suffixes):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
+
+def publish_file(path, publish_dir):
+    """
+    Publish one data file minified, with compressed sidecars
+
+    Returns:
+        dict: name, source/minified/.gz/.br bytes, pretty/compact serialization
+              seconds, and whether anything was written
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    data = json.loads(source)
+
+    pretty_seconds = _best_time(lambda: json.dumps(data, indent=2))
+    compact_seconds = _best_time(lambda: dumps_compact(data))
+    payload = dumps_compact(data)
+
+    name = os.path.basename(path)
+    target = os.path.join(publish_dir, name)
+    sidecars = compress_sidecars(payload)
+    written = not _unchanged(target, payload, sidecars)
+    if written:
+        for suffix, compressed in sidecars.items():
+            _atomic_write(target + suffix, compressed)
+        # The plain file goes last: it is what _unchanged compares against
+        _atomic_write(target, payload)
+
+    return {
+        'name': name,
+        'source': len(source),
+        'minified': len(payload),
+        'gz': len(sidecars['.gz']),
+        'br': len(sidecars['.br']) if '.br' in sidecars else None,
+        'pretty_seconds': pretty_seconds,
+        'compact_seconds': compact_seconds,
+        'written': written
+    }
+
+
+def _kb(size):
+    return f"{size / 1024:.1f}" if size is not None else "-"
+
+
+def publish_dir(data_dir='data', publish_dir=None):
+    """
+    Publish every app-facing file in data_dir to publish_dir (default data_dir/publish)
+
+    Returns:
+        list: publish_file report per file
+    """
+    publish_dir = publish_dir or os.path.join(data_dir, 'publish')
+    os.makedirs(publish_dir, exist_ok=True)
+    paths = sorted({path for pattern in PUBLISH_PATTERNS for path in glob.glob(os.path.join(data_dir, pattern))})
+
+    print(f"\n📦 Publishing {len(paths)} files to {publish_dir} "
+          f"({'orjson' if HAS_ORJSON else 'json'}, gzip{', brotli' if HAS_BROTLI else ''})...")
+    if not HAS_BROTLI:
+        print("  ℹ️  brotli not installed - skipping .br sidecars (pip install brotli)")
+
+    reports = []
+    print(f"  {'file':<34} {'KB':>7} {'min KB':>7} {'gz KB':>6} {'br KB':>6} {'dump ms':>8} {'fast ms':>8}")
+    for path in paths:
+        report = publish_file(path, publish_dir)
+        reports.append(report)
+        print(f"  {report['name']:<34} {_kb(report['source']):>7} {_kb(report['minified']):>7} "
+              f"{_kb(report['gz']):>6} {_kb(report['br']):>6} {report['pretty_seconds'] * 1000:>8.2f} "
+              f"{report['compact_seconds'] * 1000:>8.2f}{'' if report['written'] else '  (unchanged)'}")
+
+    if reports:
+        print(f"✅ {publish_summary(reports)}")
+    return reports
+
+
+def publish_summary(reports):
+    """One-line size and serialization-time reduction over all published files"""
+    source = sum(report['source'] for report in reports)
+    minified = sum(report['minified'] for report in reports)
+    gz = sum(report['gz'] for report in reports)
+    pretty = sum(report['pretty_seconds'] for report in reports)
+    compact = sum(report['compact_seconds'] for report in reports)
+    written = sum(1 for report in reports if report['written'])
+    parts = [f"{len(reports)} files ({written} written): {_kb(source)} KB -> {_kb(minified)} KB minified "
+             f"({100 * (1 - minified / source):.0f}% smaller), {_kb(gz)} KB gzip ({100 * (1 - gz / source):.0f}%)"]
+    if all(report['br'] is not None for report in reports):
+        br = sum(report['br'] for report in reports)
+        parts.append(f"{_kb(br)} KB brotli ({100 * (1 - br / source):.0f}%)")
+    parts.append(f"serialize {pretty * 1000:.1f} ms -> {compact * 1000:.1f} ms ({pretty / compact:.1f}x faster)")
+    return ", ".join(parts)
+
+
+def main():
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    publish_dir(data_dir, sys.argv[2] if len(sys.argv) > 2 else None)
+
+
+if __name__ == "__main__":
+    main()
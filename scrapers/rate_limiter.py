@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Process-wide token bucket shared by every scraper
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each request
+    takes one token; when the bucket is empty the caller reserves the next
+    token and sleeps exactly until it is due, so concurrent callers are paced
+    at the configured rate in arrival order.
+    """
+
+    def __init__(self, rate=2.0, burst=4):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Requests allowed back-to-back after an idle period
+        """
+        self._lock = threading.Lock()
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self.stats = {'acquired': 0, 'waited': 0, 'wait_seconds': 0.0}
+
+    def configure(self, rate=None, burst=None):
+        """Change the rate and/or burst size in place"""
+        with self._lock:
+            self._refill()
+            if rate is not None:
+                self.rate = float(rate)
+            if burst is not None:
+                self.burst = float(burst)
+                self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.stats['acquired'] += 1
+            if wait:
+                self.stats['waited'] += 1
+                self.stats['wait_seconds'] += wait
+        if wait:
+            time.sleep(wait)
+
+    def summary(self):
+        """One-line report of limiter activity"""
+        s = self.stats
+        return (f"{s['acquired']} requests at {self.rate:g}/s (burst {self.burst:g}), "
+                f"{s['waited']} throttled for {s['wait_seconds']:.1f}s total")
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_default_limiter():
+    """The process-wide limiter every scraper draws from unless given another"""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = TokenBucket()
+        return _default_limiter
+
+
+def set_default_limiter(limiter):
+    """Replace the process-wide limiter"""
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Records - Compact typed scorecard records
+
+Scorecard rows used to live as dicts of strings ("17", "", "3.50") that every
+aggregator re-parsed with int()/float(). These __slots__ records convert each
+cell once at parse time: counts are ints (None for a blank cell), and overs are
+an int count of legal balls - "3.50" is 3 overs and 5 balls, 23 balls, not 3.5
+overs. to_dict()/from_dict() round-trip the scorecards JSON format (economy is
+derived from balls, so only that field can differ from an old file).
+"""
+
+import json
+import re
+
+
+BALLS_PER_OVER = 6
+
+# Cricket notation: overs.balls, as '3.5' or the scorecard's '3.50'
+_OVERS_NOTATION = re.compile(r'(\d+)(?:\.([0-5])0?)?')
+
+
+def parse_count(text):
+    """'17' -> 17, '' -> None; anything that wouldn't render back identically stays text"""
+    if not text:
+        return None
+    if text.isascii() and text.isdigit():
+        value = int(text)
+        if str(value) == text:
+            return value
+    return text
+
+
+def overs_to_balls(text):
+    """
+    Legal balls in an overs value
+
+    '3.50' and '3.5' are 23 balls. Text that isn't cricket notation ('1.83')
+    is read as decimal overs; anything unreadable is 0.
+    """
+    match = _OVERS_NOTATION.fullmatch(text.strip())
+    if match:
+        return int(match.group(1)) * BALLS_PER_OVER + int(match.group(2) or 0)
+    try:
+        return round(float(text) * BALLS_PER_OVER)
+    except ValueError:
+        return 0
+
+
+def format_overs(balls):
+    """23 -> '3.5' (cricket notation for aggregated totals)"""
+    return f"{balls // BALLS_PER_OVER}.{balls % BALLS_PER_OVER}"
+
+
+def parse_overs(text):
+    """'3.50' -> 23 balls, '' -> None; anything that wouldn't render back identically stays text"""
+    if not text:
+        return None
+    balls = overs_to_balls(text)
+    return balls if render_overs(balls) == text else text
+
+
+def render_count(value):
+    return '' if value is None else str(value)
+
+
+def render_overs(value):
+    """Balls back to the scorecard's '3.50' form"""
+    if value is None:
+        return ''
+    return f"{format_overs(value)}0" if type(value) is int else value
+
+
+def count(value):
+    """A count cell as an int for aggregation (0 when blank or not a number)"""
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def balls_value(value):
+    """An overs cell as legal balls for aggregation (0 when blank or not a number)"""
+    if type(value) is int:
+        return value
+    return overs_to_balls(value) if value else 0
+
+
+class _Record:
+    """Equality and repr over __slots__"""
+
+    __slots__ = ()
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class BattingEntry(_Record):
+    """One row of a batting table"""
+
+    __slots__ = ('name', 'runs', 'balls', 'fours', 'sixes', 'how_out', 'bowler', 'player_id')
+
+    def __init__(self, name, runs=None, balls=None, fours=None, sixes=None, how_out='', bowler='', player_id=None):
+        self.name = name
+        self.runs = runs
+        self.balls = balls
+        self.fours = fours
+        self.sixes = sixes
+        self.how_out = how_out
+        self.bowler = bowler
+        self.player_id = player_id
+
+    @property
+    def not_out(self):
+        how_out = self.how_out.lower()
+        return 'not out' in how_out or 'n.o' in how_out
+
+    @classmethod
+    def from_cells(cls, name, runs, balls, fours, sixes, how_out='', bowler='', player_id=None):
+        """Build from the raw cell texts"""
+        return cls(name, parse_count(runs), parse_count(balls), parse_count(fours), parse_count(sixes),
+                   how_out, bowler, player_id)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls.from_cells(data.get('name', ''), data.get('runs', ''), data.get('balls', ''),
+                              data.get('fours', ''), data.get('sixes', ''), data.get('how_out', ''),
+                              data.get('bowler', ''), data.get('player_id'))
+
+    def to_dict(self):
+        data = {
+            'name': self.name,
+            'runs': render_count(self.runs),
+            'balls': render_count(self.balls),
+            'fours': render_count(self.fours),
+            'sixes': render_count(self.sixes),
+            'how_out': self.how_out,
+            'bowler': self.bowler
+        }
+        if self.player_id:
+            data['player_id'] = self.player_id
+        return data
+
+
+class BowlingEntry(_Record):
+    """One row of a bowling table"""
+
+    # balls: legal balls bowled (the overs cell), kept as text if not cricket notation
+    __slots__ = ('name', 'balls', 'maidens', 'runs', 'wickets', 'wides', 'no_balls', 'player_id')
+
+    def __init__(self, name, balls=None, maidens=None, runs=None, wickets=None, wides=None, no_balls=None,
+                 player_id=None):
+        self.name = name
+        self.balls = balls
+        self.maidens = maidens
+        self.runs = runs
+        self.wickets = wickets
+        self.wides = wides
+        self.no_balls = no_balls
+        self.player_id = player_id
+
+    @property
+    def economy(self):
+        """Runs per six legal balls ("0.00" when unknown)"""
+        balls = balls_value(self.balls)
+        if balls <= 0 or type(self.runs) is not int:
+            return "0.00"
+        return f"{self.runs * BALLS_PER_OVER / balls:.2f}"
+
+    @classmethod
+    def from_cells(cls, name, overs, maidens, runs, wickets, wides, no_balls, player_id=None):
+        """Build from the raw cell texts"""
+        return cls(name, parse_overs(overs), parse_count(maidens), parse_count(runs), parse_count(wickets),
+                   parse_count(wides), parse_count(no_balls), player_id)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls.from_cells(data.get('name', ''), data.get('overs', ''), data.get('maidens', ''),
+                              data.get('runs', ''), data.get('wickets', ''), data.get('wides', ''),
+                              data.get('no_balls', ''), data.get('player_id'))
+
+    def to_dict(self):
+        data = {
+            'name': self.name,
+            'overs': render_overs(self.balls),
+            'maidens': render_count(self.maidens),
+            'runs': render_count(self.runs),
+            'wickets': render_count(self.wickets),
+            'wides': render_count(self.wides),
+            'no_balls': render_count(self.no_balls),
+            'economy': self.economy
+        }
+        if self.player_id:
+            data['player_id'] = self.player_id
+        return data
+
+
+class Innings(_Record):
+    """One team's batting card and the bowling against it"""
+
+    __slots__ = ('batting', 'bowling')
+
+    def __init__(self, batting=None, bowling=None):
+        self.batting = batting or []
+        self.bowling = bowling or []
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls([BattingEntry.from_dict(row) for row in data.get('batting', [])],
+                   [BowlingEntry.from_dict(row) for row in data.get('bowling', [])])
+
+    def to_dict(self):
+        return {
+            'batting': [entry.to_dict() for entry in self.batting],
+            'bowling': [entry.to_dict() for entry in self.bowling]
+        }
+
+
+class Scorecard(_Record):
+    """A parsed MatchScorecard page"""
+
+    __slots__ = ('match_id', 'league_id', 'season_id', 'match_info', 'team1_innings', 'team2_innings')
+
+    def __init__(self, match_id, league_id, season_id, match_info=None, team1_innings=None, team2_innings=None):
+        self.match_id = str(match_id)
+        self.league_id = league_id
+        self.season_id = season_id
+        self.match_info = match_info or {}
+        self.team1_innings = team1_innings or Innings()
+        self.team2_innings = team2_innings or Innings()
+
+    @property
+    def team1(self):
+        return self.match_info.get('team1', '')
+
+    @property
+    def team2(self):
+        return self.match_info.get('team2', '')
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['match_id'], data.get('league_id'), data.get('season_id'), dict(data.get('match_info', {})),
+                   Innings.from_dict(data.get('team1_innings', {})), Innings.from_dict(data.get('team2_innings', {})))
+
+    def to_dict(self):
+        return {
+            'match_id': self.match_id,
+            'league_id': self.league_id,
+            'season_id': self.season_id,
+            'match_info': self.match_info,
+            'team1_innings': self.team1_innings.to_dict(),
+            'team2_innings': self.team2_innings.to_dict()
+        }
+
+
+def as_scorecard(scorecard):
+    """Accept a Scorecard or its dict form"""
+    return scorecard if isinstance(scorecard, Scorecard) else Scorecard.from_dict(scorecard)
+
+
+def load_scorecards(path):
+    """Read a scorecards_div_X_season_Y.json file into Scorecard records"""
+    with open(path, 'r') as f:
+        return [Scorecard.from_dict(data) for data in json.load(f)]
+
+
+def scorecards_to_json(scorecards):
+    """Scorecards (records or dicts) in their JSON-ready dict form"""
+    return [scorecard.to_dict() if isinstance(scorecard, Scorecard) else scorecard for scorecard in scorecards]
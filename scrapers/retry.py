@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Retry - Exponential backoff with jitter, Retry-After support and per-endpoint circuit breakers
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+def endpoint_key(url):
+    """Group URLs by page, e.g. .../MatchScorecard.aspx?match_id=1 -> MatchScorecard.aspx"""
+    return urlparse(url).path.rstrip('/').rsplit('/', 1)[-1] or urlparse(url).netloc
+
+
+class FetchError(Exception):
+    """Structured description of a fetch that ultimately failed"""
+
+    def __init__(self, url, message, status=None, attempts=0):
+        super().__init__(message)
+        self.url = url
+        self.endpoint = endpoint_key(url)
+        self.message = message
+        self.status = status
+        self.attempts = attempts
+
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'endpoint': self.endpoint,
+            'status': self.status,
+            'attempts': self.attempts,
+            'error': self.message
+        }
+
+    def __str__(self):
+        status = f" (HTTP {self.status})" if self.status else ""
+        return f"Failed to fetch {self.url}{status} after {self.attempts} attempt(s): {self.message}"
+
+
+class CircuitOpenError(FetchError):
+    """Raised without touching the network while an endpoint's circuit is open"""
+
+    def __init__(self, url, retry_in):
+        super().__init__(url, f"circuit open for {endpoint_key(url)}, retry in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+    def __str__(self):
+        return f"Skipped {self.url}: {self.message}"
+
+
+class RetryPolicy:
+    """Decides whether and how long to wait before retrying a failed request"""
+
+    RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+    def __init__(self, max_attempts=4, base_delay=1.0, max_delay=30.0):
+        """
+        Args:
+            max_attempts: Total tries per request, including the first
+            base_delay: Backoff ceiling for the first retry (doubles each attempt)
+            max_delay: Upper bound for any single wait, including Retry-After
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_retryable(self, status):
+        """Network errors (status None) and overload/server statuses are retried"""
+        return status is None or status in self.RETRY_STATUSES
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Seconds to wait after `attempt` failed (1-based)
+
+        Uses "full jitter" - a random wait up to the exponential ceiling - so
+        concurrent workers don't retry in lockstep. A server Retry-After wins
+        when it asks for longer.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        wait = random.uniform(0, ceiling)
+        if retry_after is not None:
+            wait = max(wait, min(retry_after, self.max_delay))
+        return wait
+
+
+def parse_retry_after(response):
+    """Read a Retry-After header (seconds or HTTP date) from a response, or None"""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After `failure_threshold` consecutive failures an endpoint's circuit opens
+    and requests to it fail fast for `reset_timeout` seconds. Then a single
+    trial request is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened_at = {}
+        self._trial_in_flight = set()
+
+    def before_request(self, url):
+        """Raise CircuitOpenError if requests to this endpoint should be shed"""
+        key = endpoint_key(url)
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - opened_at)
+            if remaining > 0 or key in self._trial_in_flight:
+                raise CircuitOpenError(url, max(remaining, 0))
+            self._trial_in_flight.add(key)
+
+    def record_success(self, url):
+        key = endpoint_key(url)
+        with self._lock:
+            self._failures[key] = 0
+            self._opened_at.pop(key, None)
+            self._trial_in_flight.discard(key)
+
+    def record_failure(self, url):
+        key = endpoint_key(url)
+        with self._lock:
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if key in self._trial_in_flight or self._failures[key] >= self.failure_threshold:
+                if key not in self._opened_at or key in self._trial_in_flight:
+                    print(f"🔌 Circuit opened for {key} after {self._failures[key]} consecutive failures")
+                self._opened_at[key] = time.monotonic()
+                self._trial_in_flight.discard(key)
+
+    def open_endpoints(self):
+        """Endpoints whose circuit is currently open"""
+        with self._lock:
+            return sorted(self._opened_at)
+
+
+_default_policy = RetryPolicy()
+_default_breaker = CircuitBreaker()
+
+
+def get_default_retry_policy():
+    """The process-wide retry policy"""
+    return _default_policy
+
+
+def set_default_retry_policy(policy):
+    global _default_policy
+    _default_policy = policy
+
+
+def get_default_circuit_breaker():
+    """The process-wide circuit breaker shared by every scraper"""
+    return _default_breaker
+
+
+def set_default_circuit_breaker(breaker):
+    global _default_breaker
+    _default_breaker = breaker
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Schedule Diff - What changed in a division's schedule since the last run
+
+The schedule page is one request and says which matches finished, what their
+results were and when the rest are played. Diffing it against the schedule
+saved in the previous division file tells a refresh exactly which scorecards,
+standings and player stats need re-scraping.
+"""
+
+from collections import defaultdict
+
+
+# Fields that make up a completed match's result (standings depend on these)
+RESULT_FIELDS = ('winner', 'runner_up', 'loser_points', 'winner_points')
+# Fields that place a fixture in time and space
+SLOT_FIELDS = ('date', 'time', 'ground')
+
+
+def fixture_keys(schedule):
+    """
+    Key every match by (team pair, match type, occurrence)
+
+    Upcoming matches have no match_id, so a fixture is identified by who
+    plays whom, and which of their meetings it is, in schedule order.
+    """
+    seen = defaultdict(int)
+    keyed = {}
+    for match in schedule:
+        pair = tuple(sorted((match.get('team1', ''), match.get('team2', ''))))
+        base = pair + (match.get('match_type', ''),)
+        keyed[base + (seen[base],)] = match
+        seen[base] += 1
+    return keyed
+
+
+def _teams(schedule):
+    return {team for match in schedule for team in (match.get('team1'), match.get('team2')) if team}
+
+
+class ScheduleDiff:
+    """Changes between two schedules of the same division"""
+
+    def __init__(self, newly_completed=None, changed_results=None, removed_results=None,
+                 rescheduled=None, added=None, teams_changed=False):
+        """
+        Args:
+            newly_completed: Matches completed since the previous schedule
+            changed_results: Completed matches whose result was edited
+            removed_results: Completed matches no longer on the schedule
+            rescheduled: (previous, current) pairs of fixtures that moved
+            added: Fixtures that were not on the previous schedule
+            teams_changed: The set of teams on the schedule changed
+        """
+        self.newly_completed = newly_completed or []
+        self.changed_results = changed_results or []
+        self.removed_results = removed_results or []
+        self.rescheduled = rescheduled or []
+        self.added = added or []
+        self.teams_changed = teams_changed
+
+    @property
+    def results_changed(self):
+        """Whether standings and player stats are affected"""
+        return bool(self.newly_completed or self.changed_results or self.removed_results)
+
+    def affected_match_ids(self):
+        """Match IDs whose scorecards need (re-)fetching"""
+        return [m['match_id'] for m in self.newly_completed + self.changed_results if m.get('match_id')]
+
+    def is_empty(self):
+        return not (self.results_changed or self.rescheduled or self.added or self.teams_changed)
+
+    def summary(self):
+        """One-line description of the diff"""
+        if self.is_empty():
+            return "no changes"
+        parts = [f"{len(self.newly_completed)} newly completed",
+                 f"{len(self.changed_results)} changed results",
+                 f"{len(self.rescheduled)} rescheduled"]
+        if self.removed_results:
+            parts.append(f"{len(self.removed_results)} results removed")
+        if self.added:
+            parts.append(f"{len(self.added)} new fixtures")
+        if self.teams_changed:
+            parts.append("teams changed")
+        return ", ".join(parts)
+
+
+def diff_schedules(previous, current):
+    """
+    Compare the previous run's schedule to the one just scraped
+
+    Args:
+        previous: Schedule list from the saved division file
+        current: Schedule list from ScheduleScraper.scrape
+
+    Returns:
+        ScheduleDiff
+    """
+    old_results = {str(m['match_id']): m for m in previous if m.get('status') == 'completed' and m.get('match_id')}
+    new_results = {str(m['match_id']): m for m in current if m.get('status') == 'completed' and m.get('match_id')}
+
+    newly_completed = [m for match_id, m in new_results.items() if match_id not in old_results]
+    changed_results = [m for match_id, m in new_results.items() if match_id in old_results
+                       and any(m.get(f) != old_results[match_id].get(f) for f in RESULT_FIELDS)]
+    removed_results = [m for match_id, m in old_results.items() if match_id not in new_results]
+
+    old_fixtures = fixture_keys(previous)
+    rescheduled = []
+    added = []
+    for key, match in fixture_keys(current).items():
+        if match.get('status') == 'completed':
+            continue
+        before = old_fixtures.get(key)
+        if before is None:
+            added.append(match)
+        elif any(match.get(f) != before.get(f) for f in SLOT_FIELDS):
+            rescheduled.append((before, match))
+
+    return ScheduleDiff(newly_completed, changed_results, removed_results, rescheduled, added,
+                        teams_changed=_teams(previous) != _teams(current))
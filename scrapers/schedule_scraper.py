@@ -4,16 +4,19 @@ Schedule Scraper - Get all matches with dates, results, scores, and umpire assig
 """
 
 from .base_scraper import BaseScraper
+from .parsers import ParseTarget
 from datetime import datetime
 
 
 class ScheduleScraper(BaseScraper):
     """Scraper for match schedule information"""
     
+    parse_target = ParseTarget(table_id='GridView', max_tables=1)
+    
     def scrape(self, division_id, season_id):
         """Scrape match schedule for a division"""
         url = f"{self.base_url}/Pages/UI/LeagueSchedule.aspx?league_id={division_id}&season_id={season_id}"
-        print(f"  📅 Scraping schedule...")
+        self.log(f"  📅 Scraping schedule...")
         
         soup = self.fetch_page(url)
         if not soup:
@@ -99,16 +102,16 @@ class ScheduleScraper(BaseScraper):
                     
                     matches.append(match)
                 except Exception as e:
-                    print(f"     ⚠️  Error parsing row: {e}")
+                    self.log(f"     ⚠️  Error parsing row: {e}")
                     continue
         
-        print(f"     ✓ Found {len(matches)} matches")
+        self.log(f"     ✓ Found {len(matches)} matches")
         
         # Separate upcoming and completed matches
         completed = [m for m in matches if m["status"] == "completed"]
         upcoming = [m for m in matches if m["status"] == "upcoming"]
         
-        print(f"       • {len(completed)} completed, {len(upcoming)} upcoming")
+        self.log(f"       • {len(completed)} completed, {len(upcoming)} upcoming")
         
         return matches
     
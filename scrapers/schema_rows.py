@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Schema Rows - Scraper output as row tuples for the azure/schema.sql tables
+
+Shared by the SQLite store and the PostgreSQL ingest, so both databases load
+exactly the same rows. Every team a file mentions becomes a teams row, and
+every match a scorecard file mentions becomes a matches row. That way the
+schema's foreign keys hold even when a team name only appears in a schedule
+or a scorecard.
+
+A `players` row has one team_id, so players are team-scoped: player_id is a
+hash of the normalized name and team_id, like generate_team_id.
+"""
+
+import glob
+import hashlib
+import os
+import re
+from .career_aggregator import SCORECARD_FILE_PATTERN
+from .player_aggregator import INVALID_BATTING_NAMES, INVALID_BOWLING_NAMES, generate_team_id, is_player_name
+from .player_index import normalize_name
+from .records import BALLS_PER_OVER, as_scorecard, count, format_overs, overs_to_balls
+
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'azure', 'schema.sql')
+
+DIVISION_FILE_PATTERN = re.compile(r'^div_(\d+)_season_(\d+)\.json$')
+
+# Column order of each table's row tuples. Detail rows are keyed by their
+# scorecard's natural key (match_id, team_id, innings); each store swaps that
+# for scorecards.id.
+COLUMNS = {
+    'divisions': ('division_id', 'season_id', 'name', 'last_updated'),
+    'teams': ('team_id', 'name', 'division_id', 'season_id', 'rank', 'wins', 'losses', 'points'),
+    'players': ('player_id', 'name', 'team_id'),
+    'batting_stats': ('player_id', 'season_id', 'rank', 'innings', 'runs', 'average', 'strike_rate', 'fours',
+                      'sixes'),
+    'bowling_stats': ('player_id', 'season_id', 'rank', 'overs', 'wickets', 'runs_conceded', 'economy', 'average',
+                      'strike_rate'),
+    'matches': ('match_id', 'division_id', 'season_id', 'team1_id', 'team2_id', 'team1_name', 'team2_name', 'date',
+                'ground', 'status', 'winner_id', 'winner_points', 'loser_points'),
+    'scorecards': ('match_id', 'team_id', 'innings', 'total_runs', 'total_wickets', 'overs', 'extras'),
+    'innings_details': ('match_id', 'team_id', 'innings', 'player_id', 'player_name', 'batting_position', 'runs',
+                        'balls', 'fours', 'sixes', 'strike_rate', 'dismissal'),
+    'bowling_details': ('match_id', 'team_id', 'innings', 'player_id', 'player_name', 'overs', 'maidens', 'runs',
+                        'wickets', 'economy'),
+}
+
+# Natural key of each upserted table
+KEYS = {
+    'divisions': ('division_id', 'season_id'),
+    'teams': ('team_id',),
+    'players': ('player_id',),
+    'batting_stats': ('player_id', 'season_id'),
+    'bowling_stats': ('player_id', 'season_id'),
+    'matches': ('match_id',),
+    'scorecards': ('match_id', 'team_id', 'innings'),
+}
+
+# how_out values that count as a wicket ('not out', 'retired hurt', 'did not bat' don't)
+DISMISSALS = frozenset({'caught', 'bowled', 'runout', 'run out', 'stumped', 'hitout', 'hit wicket', 'lbw'})
+
+
+def data_files(data_dir):
+    """
+    Loadable files in a data directory: division files first, so scorecards find their teams and matches
+
+    Returns:
+        list: (kind, path, division_id, season_id) tuples, kind 'division' or 'scorecards'
+    """
+    files = []
+    for kind, pattern, name_pattern in (('division', 'div_*_season_*.json', DIVISION_FILE_PATTERN),
+                                        ('scorecards', 'scorecards_div_*_season_*.json', SCORECARD_FILE_PATTERN)):
+        for path in sorted(glob.glob(os.path.join(data_dir, pattern))):
+            match = name_pattern.search(os.path.basename(path))
+            if match:
+                files.append((kind, path, int(match.group(1)), int(match.group(2))))
+    return files
+
+
+def generate_player_id(name, team_id):
+    """Deterministic team-scoped player ID from normalized name + team_id"""
+    unique_str = f"{normalize_name(name)}_{team_id}"
+    return hashlib.sha256(unique_str.encode()).hexdigest()[:12]
+
+
+def _int(value):
+    """'42' / 42 -> 42; blank or non-numeric -> None"""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _strike_rate(runs, balls):
+    return round(runs * 100 / balls, 2) if balls else None
+
+
+def division_rows(data):
+    """
+    Rows from one div_X_season_Y.json document
+
+    Returns:
+        dict: table -> list of row tuples (COLUMNS order) for divisions, teams,
+              players, batting_stats, bowling_stats and matches
+    """
+    division_id = data['division_id']
+    season_id = data['season_id']
+
+    def team_id(team):
+        return generate_team_id(team, division_id, season_id)
+
+    standings = {row['team']: row for row in data.get('standings', [])}
+    schedule = [match for match in data.get('schedule', []) if match.get('match_id')]
+    team_names = (list(data.get('teams', [])) + list(standings) +
+                  [row['team'] for row in data.get('batsmen', []) + data.get('bowlers', [])] +
+                  [match[side] for match in schedule for side in ('team1', 'team2')])
+    teams = {}
+    for name in team_names:
+        if team_id(name) not in teams:
+            standing = standings.get(name, {})
+            teams[team_id(name)] = (team_id(name), name, division_id, season_id, _int(standing.get('rank')),
+                                    _int(standing.get('wins')) or 0, _int(standing.get('losses')) or 0,
+                                    _int(standing.get('points')) or 0)
+
+    players = {}
+    batting = {}
+    for row in data.get('batsmen', []):
+        player_id = generate_player_id(row['name'], team_id(row['team']))
+        players[player_id] = (player_id, row['name'], team_id(row['team']))
+        batting[player_id] = (player_id, season_id, _int(row.get('rank')), _int(row.get('innings')) or 0,
+                              _int(row.get('runs')) or 0, _float(row.get('average')), _float(row.get('strike_rate')),
+                              _int(row.get('fours')) or 0, _int(row.get('sixes')) or 0)
+    bowling = {}
+    for row in data.get('bowlers', []):
+        player_id = generate_player_id(row['name'], team_id(row['team']))
+        players[player_id] = (player_id, row['name'], team_id(row['team']))
+        wickets = _int(row.get('wickets')) or 0
+        balls = overs_to_balls(row.get('overs', ''))
+        bowling[player_id] = (player_id, season_id, _int(row.get('rank')), format_overs(balls), wickets,
+                              _int(row.get('runs_given')) or 0, _float(row.get('economy')),
+                              _float(row.get('average')), round(balls / wickets, 2) if wickets else None)
+
+    matches = {}
+    for match in schedule:
+        winner = match.get('winner')
+        # Only a named side is a winner_id ('No Result' etc. isn't a team)
+        winner_id = team_id(winner) if winner in (match['team1'], match['team2']) else None
+        matches[str(match['match_id'])] = (
+            str(match['match_id']), division_id, season_id, team_id(match['team1']), team_id(match['team2']),
+            match['team1'], match['team2'], (match.get('date_parsed') or '')[:10] or None, match.get('ground'),
+            match.get('status') or 'upcoming', winner_id, _int(match.get('winner_points')) or 0,
+            _int(match.get('loser_points')) or 0)
+
+    return {
+        'divisions': [(division_id, season_id, data.get('division_name', ''), data.get('last_updated'))],
+        'teams': list(teams.values()),
+        'players': list(players.values()),
+        'batting_stats': list(batting.values()),
+        'bowling_stats': list(bowling.values()),
+        'matches': list(matches.values())
+    }
+
+
+def scorecard_rows(scorecards, division_id, season_id):
+    """
+    Rows from one division's scorecards
+
+    Innings totals come from the 'Overs' summary row (total runs, overs
+    faced), falling back to the bowling figures. Extras are the total less
+    the runs off the bat. The division, teams and matches are stub rows: a
+    store inserts them only if they are missing.
+
+    Returns:
+        dict: table -> list of row tuples (COLUMNS order) for divisions, teams,
+              matches, players, scorecards, innings_details and bowling_details
+    """
+    def team_id(team):
+        return generate_team_id(team, division_id, season_id)
+
+    teams = {}
+    matches = {}
+    players = {}
+    innings_rows = []
+    batting_rows = []
+    bowling_rows = []
+    for scorecard in map(as_scorecard, scorecards):
+        match_id = str(scorecard.match_id)
+        for team in (scorecard.team1, scorecard.team2):
+            teams.setdefault(team_id(team), (team_id(team), team, division_id, season_id, None, 0, 0, 0))
+        matches.setdefault(match_id, (match_id, division_id, season_id, team_id(scorecard.team1),
+                                      team_id(scorecard.team2), scorecard.team1, scorecard.team2, None, None,
+                                      'completed', None, 0, 0))
+        for number, innings, batting_team, bowling_team in (
+                (1, scorecard.team1_innings, scorecard.team1, scorecard.team2),
+                (2, scorecard.team2_innings, scorecard.team2, scorecard.team1)):
+            if not innings.batting and not innings.bowling:
+                continue
+            key = (match_id, team_id(batting_team), number)
+            batting = []
+            total_runs = total_balls = None
+            for entry in innings.batting:
+                if not is_player_name(entry.name, INVALID_BATTING_NAMES):
+                    # The 'Overs' summary row carries the innings total and overs faced
+                    if entry.name.strip().lower() == 'overs' and isinstance(entry.runs, int):
+                        total_runs, total_balls = entry.runs, overs_to_balls(entry.how_out)
+                    continue
+                name = entry.name.strip()
+                player_id = generate_player_id(name, key[1])
+                players[player_id] = (player_id, name, key[1])
+                runs = count(entry.runs)
+                balls = entry.balls if isinstance(entry.balls, int) else None
+                batting.append(key + (player_id, name, len(batting) + 1, runs, balls, count(entry.fours),
+                                      count(entry.sixes), _strike_rate(runs, balls), entry.how_out))
+            bowling = []
+            for entry in innings.bowling:
+                if not is_player_name(entry.name, INVALID_BOWLING_NAMES):
+                    continue
+                name = entry.name.strip()
+                player_id = generate_player_id(name, team_id(bowling_team))
+                players[player_id] = (player_id, name, team_id(bowling_team))
+                balls = count(entry.balls)
+                runs = count(entry.runs)
+                bowling.append(key + (player_id, name, format_overs(balls), count(entry.maidens), runs,
+                                      count(entry.wickets), round(runs * BALLS_PER_OVER / balls, 2) if balls else None))
+            if total_runs is None:
+                total_runs = sum(row[7] for row in bowling)
+                total_balls = sum(count(entry.balls) for entry in innings.bowling
+                                  if is_player_name(entry.name, INVALID_BOWLING_NAMES))
+            bat_runs = sum(row[6] for row in batting)
+            wickets = sum(1 for row in batting if row[11].strip().lower() in DISMISSALS)
+            innings_rows.append(key + (total_runs, wickets, format_overs(total_balls), max(total_runs - bat_runs, 0)))
+            batting_rows += batting
+            bowling_rows += bowling
+
+    return {
+        'divisions': [(division_id, season_id, '', None)],
+        'teams': list(teams.values()),
+        'matches': list(matches.values()),
+        'players': list(players.values()),
+        'scorecards': innings_rows,
+        'innings_details': batting_rows,
+        'bowling_details': bowling_rows
+    }
+
+
+def conflict_clause(table, stub=False):
+    """
+    ON CONFLICT clause upserting a table on its natural key (same in SQLite and PostgreSQL)
+
+    Args:
+        stub: Rows only fill gaps (division/teams/matches from scorecards) - keep existing rows as they are
+    """
+    keys = KEYS[table]
+    if stub:
+        return f"ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+    updates = [f"{column} = excluded.{column}" for column in COLUMNS[table] if column not in keys]
+    if 'last_updated' not in COLUMNS[table]:
+        updates.append("last_updated = CURRENT_TIMESTAMP")
+    return f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {', '.join(updates)}"
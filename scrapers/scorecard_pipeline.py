@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Scorecard Pipeline - Staged fetch -> parse -> aggregate with bounded queues
+
+Fetching is I/O bound and parsing is CPU bound, so instead of alternating
+them inside scrape_scorecard, each runs as its own stage:
+
+    fetchers (threads, per-host limit)  ->  raw pages queue  ->
+    parsers (process pool, all cores)   ->  scorecards queue ->
+    consumer (collects results, calls the sink)
+
+The queues are bounded, so a slow stage applies backpressure to the one in
+front of it instead of letting raw pages pile up in memory. If any stage
+raises (a failing sink, a broken process pool), the other stages are
+cancelled and arun() re-raises instead of waiting on a full queue.
+
+Aggregation is not a stage: the orchestrator folds the finished scorecards
+into AggregationState, which also has to retract edited matches and merge
+scorecards stored by earlier runs.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .scorecard_scraper import parse_scorecard_page
+
+
+_DONE = object()
+
+
+class StageStats:
+    """Item count, busy time and queue high-water mark for one stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_queue = 0
+
+    def throughput(self, elapsed):
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+class ScorecardPipeline:
+    """
+    Streams a division's scorecards through fetch, parse and consume stages.
+
+    Args:
+        scraper: ScorecardScraper used for URLs, fetching and parser choice
+        fetch_workers: Concurrent fetch tasks (the fetcher's per-host limit still applies)
+        parse_workers: Parser processes (default: CPU count)
+        queue_size: Capacity of each inter-stage queue
+        executor: Existing process pool to reuse across divisions
+    """
+
+    def __init__(self, scraper, fetch_workers=4, parse_workers=None, queue_size=16, executor=None):
+        self.scraper = scraper
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.stats = {}
+        self.elapsed = 0.0
+
+    def run(self, division_id, season_id, match_ids, sink=None):
+        """Synchronous wrapper around arun()"""
+        return asyncio.run(self.arun(division_id, season_id, match_ids, sink))
+
+    async def arun(self, division_id, season_id, match_ids, sink=None):
+        """
+        Fetch, parse and consume all scorecards for a division
+
+        Args:
+            division_id: Division ID
+            season_id: Season ID
+            match_ids: Match IDs to scrape
+            sink: Optional callable given each scorecard as it is parsed
+
+        Returns:
+            list: Parsed scorecards in match_ids order
+        """
+        fetch_stats, parse_stats, consume_stats = (
+            StageStats('fetch'), StageStats('parse'), StageStats('consume'))
+        self.stats = {s.name: s for s in (fetch_stats, parse_stats, consume_stats)}
+
+        todo = asyncio.Queue()
+        for match_id in match_ids:
+            todo.put_nowait(match_id)
+        raw_pages = asyncio.Queue(maxsize=self.queue_size)
+        scorecards = asyncio.Queue(maxsize=self.queue_size)
+        results = {}
+        executor = self._executor or ProcessPoolExecutor(max_workers=self.parse_workers)
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        async def fetch():
+            while not todo.empty():
+                match_id = todo.get_nowait()
+                url = self.scraper._scorecard_url(match_id, division_id, season_id)
+                began = time.perf_counter()
+                content = await self.scraper.fetcher.run(url, self.scraper.fetch_content, url)
+                fetch_stats.busy_seconds += time.perf_counter() - began
+                if content is None:
+                    fetch_stats.failed += 1
+                    continue
+                fetch_stats.items += 1
+                await raw_pages.put((match_id, content))
+                fetch_stats.max_queue = max(fetch_stats.max_queue, raw_pages.qsize())
+
+        async def parse():
+            while True:
+                item = await raw_pages.get()
+                if item is _DONE:
+                    return
+                match_id, content = item
+                began = time.perf_counter()
+                scorecard = await loop.run_in_executor(
+                    executor, parse_scorecard_page,
+                    content, match_id, division_id, season_id, self.scraper.parser)
+                parse_stats.busy_seconds += time.perf_counter() - began
+                if scorecard is None:
+                    parse_stats.failed += 1
+                    continue
+                parse_stats.items += 1
+                await scorecards.put(scorecard)
+                parse_stats.max_queue = max(parse_stats.max_queue, scorecards.qsize())
+
+        async def consume():
+            while True:
+                scorecard = await scorecards.get()
+                if scorecard is _DONE:
+                    return
+                began = time.perf_counter()
+                results[scorecard.match_id] = scorecard
+                if sink:
+                    sink(scorecard)
+                consume_stats.busy_seconds += time.perf_counter() - began
+                consume_stats.items += 1
+                self.scraper.log(f"  [{consume_stats.items}/{len(match_ids)}] Match {scorecard.match_id}... ✅")
+
+        async def drain():
+            # Shut the stages down in order once the fetchers have run out of work
+            await asyncio.gather(*fetchers)
+            for _ in parsers:
+                await raw_pages.put(_DONE)
+            await asyncio.gather(*parsers)
+            await scorecards.put(_DONE)
+            await consumer
+
+        consumer = asyncio.ensure_future(consume())
+        parsers = [asyncio.ensure_future(parse()) for _ in range(self.parse_workers)]
+        fetchers = [asyncio.ensure_future(fetch()) for _ in range(self.fetch_workers)]
+        tasks = [asyncio.ensure_future(drain()), consumer] + parsers + fetchers
+        try:
+            # A stage that dies would leave the others blocked on a full queue - stop them all and re-raise
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._owns_executor:
+                executor.shutdown()
+
+        self.elapsed = time.perf_counter() - start
+        return [results[str(match_id)] for match_id in match_ids if str(match_id) in results]
+
+    def summary(self):
+        """Per-stage throughput report for the last run"""
+        lines = [f"Pipeline finished in {self.elapsed:.2f}s"]
+        for s in self.stats.values():
+            failed = f", {s.failed} failed" if s.failed else ""
+            lines.append(f"   {s.name:<8} {s.items:>4} items{failed} | {s.throughput(self.elapsed):6.1f}/s overall "
+                         f"| {s.busy_seconds:6.2f}s busy | max queue {s.max_queue}")
+        return "\n".join(lines)
@@ -4,16 +4,26 @@ Scrapes match scorecards to get detailed batting/bowling performance
 """
 
 from .base_scraper import BaseScraper
-import time
+from .parsers import ParseTarget, find_tables
+from .player_index import player_id_from_href
+from .records import BattingEntry, BowlingEntry, Innings, Scorecard
+import asyncio
 
 
 class ScorecardScraper(BaseScraper):
     """Scrapes individual match scorecards"""
     
+    # Match info plus two innings of batting and bowling
+    parse_target = ParseTarget(max_tables=5, links=True)
+    
     def scrape(self):
         """Required by BaseScraper - not used for scorecards"""
         pass
     
+    def _scorecard_url(self, match_id, league_id, season_id):
+        """Build the MatchScorecard URL for a match"""
+        return f'{self.base_url}/Pages/UI/MatchScorecard.aspx?match_id={match_id}&league_id={league_id}&season_id={season_id}'
+    
     def scrape_scorecard(self, match_id, league_id, season_id):
         """
         Scrape detailed scorecard for a specific match
@@ -24,58 +34,22 @@ class ScorecardScraper(BaseScraper):
             season_id: Season ID
             
         Returns:
-            dict: Scorecard data with batting and bowling details
+            Scorecard: Scorecard record with batting and bowling details
         """
-        url = f'https://www.arcl.org/Pages/UI/MatchScorecard.aspx?match_id={match_id}&league_id={league_id}&season_id={season_id}'
+        url = self._scorecard_url(match_id, league_id, season_id)
         
-        try:
-            soup = self.fetch_page(url)
-            if not soup:
-                return None
-            
-            # Find all tables
-            tables = soup.find_all('table')
-            if len(tables) < 3:
-                print(f"  ⚠️  Insufficient tables for match {match_id}")
-                return None
-            
-            # Parse match info (usually in first table or headers)
-            match_info = self._parse_match_info(soup)
-            
-            # Parse innings data
-            # Table 2 = Team 1 batting
-            # Table 3 = Team 1 bowling
-            # Table 4 = Team 2 batting (if exists)
-            # Table 5 = Team 2 bowling (if exists)
-            
-            team1_batting = self._parse_batting_table(tables[1]) if len(tables) > 1 else []
-            team1_bowling = self._parse_bowling_table(tables[2]) if len(tables) > 2 else []
-            team2_batting = self._parse_batting_table(tables[3]) if len(tables) > 3 else []
-            team2_bowling = self._parse_bowling_table(tables[4]) if len(tables) > 4 else []
-            
-            scorecard = {
-                'match_id': str(match_id),
-                'league_id': league_id,
-                'season_id': season_id,
-                'match_info': match_info,
-                'team1_innings': {
-                    'batting': team1_batting,
-                    'bowling': team1_bowling
-                },
-                'team2_innings': {
-                    'batting': team2_batting,
-                    'bowling': team2_bowling
-                }
-            }
-            
-            return scorecard
-            
-        except Exception as e:
-            print(f"  ❌ Error scraping match {match_id}: {str(e)}")
+        content = self.fetch_content(url)
+        if content is None:
             return None
+        return self.parse_scorecard(content, match_id, league_id, season_id)
+    
+    def parse_scorecard(self, content, match_id, league_id, season_id):
+        """Parse a raw MatchScorecard page with this scraper's parser backend"""
+        return parse_scorecard_page(content, match_id, league_id, season_id, self.parser)
     
-    def _parse_match_info(self, soup):
-        """Extract match information from page"""
+    @staticmethod
+    def _parse_match_info(tables):
+        """Extract match information from the page's tables"""
         info = {
             'team1': '',
             'team2': '',
@@ -87,9 +61,8 @@ class ScorecardScraper(BaseScraper):
         
         try:
             # Get the first table which contains match info
-            tables = soup.find_all('table')
             if len(tables) > 0:
-                table_text = tables[0].get_text()
+                table_text = tables[0].text
                 lines = [line.strip() for line in table_text.split('\n') if line.strip()]
                 
                 # Parse key-value pairs
@@ -126,7 +99,8 @@ class ScorecardScraper(BaseScraper):
         
         return info
     
-    def _parse_batting_table(self, table):
+    @staticmethod
+    def _parse_batting_table(table):
         """
         Parse batting performance table
         
@@ -135,7 +109,7 @@ class ScorecardScraper(BaseScraper):
         batsmen = []
         
         try:
-            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            headers = table.headers
             
             # Find column indices
             col_indices = {}
@@ -156,26 +130,26 @@ class ScorecardScraper(BaseScraper):
                     col_indices['bowler'] = i
             
             # Parse rows
-            rows = table.find_all('tr')[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all('td')
+            rows = table.body_cells()  # Skip header
+            for cells, links in zip(rows, table.body_cell_links()):
                 if len(cells) < 4:  # Need at least a few columns
                     continue
                 
                 try:
-                    batsman = {
-                        'name': cells[col_indices.get('batter', 0)].get_text(strip=True),
-                        'runs': cells[col_indices.get('runs', 6)].get_text(strip=True),
-                        'balls': cells[col_indices.get('balls', 7)].get_text(strip=True),
-                        'fours': cells[col_indices.get('fours', 5)].get_text(strip=True),
-                        'sixes': cells[col_indices.get('sixes', 4)].get_text(strip=True),
-                        'how_out': cells[col_indices.get('how_out', 1)].get_text(strip=True) if 'how_out' in col_indices else '',
-                        'bowler': cells[col_indices.get('bowler', 3)].get_text(strip=True) if 'bowler' in col_indices else ''
-                    }
+                    batsman = BattingEntry.from_cells(
+                        name=cells[col_indices.get('batter', 0)],
+                        runs=cells[col_indices.get('runs', 6)],
+                        balls=cells[col_indices.get('balls', 7)],
+                        fours=cells[col_indices.get('fours', 5)],
+                        sixes=cells[col_indices.get('sixes', 4)],
+                        how_out=cells[col_indices.get('how_out', 1)] if 'how_out' in col_indices else '',
+                        bowler=cells[col_indices.get('bowler', 3)] if 'bowler' in col_indices else '',
+                        player_id=player_id_from_href(links[col_indices.get('batter', 0)])
+                    )
                     
                     # Skip if name is empty or is a total/extras row
-                    name_lower = batsman['name'].lower()
-                    if batsman['name'] and 'extra' not in name_lower and 'total' not in name_lower:
+                    name_lower = batsman.name.lower()
+                    if batsman.name and 'extra' not in name_lower and 'total' not in name_lower:
                         batsmen.append(batsman)
                         
                 except Exception as e:
@@ -187,7 +161,8 @@ class ScorecardScraper(BaseScraper):
         
         return batsmen
     
-    def _parse_bowling_table(self, table):
+    @staticmethod
+    def _parse_bowling_table(table):
         """
         Parse bowling performance table
         
@@ -196,7 +171,7 @@ class ScorecardScraper(BaseScraper):
         bowlers = []
         
         try:
-            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            headers = table.headers
             
             # Find column indices
             col_indices = {}
@@ -217,35 +192,25 @@ class ScorecardScraper(BaseScraper):
                     col_indices['no_balls'] = i
             
             # Parse rows
-            rows = table.find_all('tr')[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all('td')
+            rows = table.body_cells()  # Skip header
+            for cells, links in zip(rows, table.body_cell_links()):
                 if len(cells) < 4:
                     continue
                 
                 try:
-                    bowler = {
-                        'name': cells[col_indices.get('bowler', 0)].get_text(strip=True),
-                        'overs': cells[col_indices.get('overs', 1)].get_text(strip=True),
-                        'maidens': cells[col_indices.get('maidens', 2)].get_text(strip=True) if 'maidens' in col_indices else '0',
-                        'runs': cells[col_indices.get('runs', 5)].get_text(strip=True),
-                        'wickets': cells[col_indices.get('wickets', 6)].get_text(strip=True),
-                        'wides': cells[col_indices.get('wides', 4)].get_text(strip=True) if 'wides' in col_indices else '0',
-                        'no_balls': cells[col_indices.get('no_balls', 3)].get_text(strip=True) if 'no_balls' in col_indices else '0'
-                    }
-                    
-                    # Calculate economy if we have overs and runs
-                    try:
-                        overs = float(bowler['overs'])
-                        runs = int(bowler['runs'])
-                        if overs > 0:
-                            bowler['economy'] = f"{runs / overs:.2f}"
-                        else:
-                            bowler['economy'] = "0.00"
-                    except:
-                        bowler['economy'] = "0.00"
+                    # Economy is derived from overs and runs (BowlingEntry.economy)
+                    bowler = BowlingEntry.from_cells(
+                        name=cells[col_indices.get('bowler', 0)],
+                        overs=cells[col_indices.get('overs', 1)],
+                        maidens=cells[col_indices.get('maidens', 2)] if 'maidens' in col_indices else '0',
+                        runs=cells[col_indices.get('runs', 5)],
+                        wickets=cells[col_indices.get('wickets', 6)],
+                        wides=cells[col_indices.get('wides', 4)] if 'wides' in col_indices else '0',
+                        no_balls=cells[col_indices.get('no_balls', 3)] if 'no_balls' in col_indices else '0',
+                        player_id=player_id_from_href(links[col_indices.get('bowler', 0)])
+                    )
                     
-                    if bowler['name']:
+                    if bowler.name:
                         bowlers.append(bowler)
                         
                 except Exception as e:
@@ -257,36 +222,107 @@ class ScorecardScraper(BaseScraper):
         
         return bowlers
     
-    def scrape_division_scorecards(self, division_id, season_id, match_ids):
+    async def ascrape_scorecard(self, match_id, league_id, season_id):
+        """Async scrape_scorecard - bounded by the fetcher's per-host semaphore"""
+        url = self._scorecard_url(match_id, league_id, season_id)
+        return await self.fetcher.run(url, self.scrape_scorecard, match_id, league_id, season_id)
+    
+    async def ascrape_division_scorecards(self, division_id, season_id, match_ids, sink=None):
         """
-        Scrape all scorecards for a division
+        Scrape all scorecards for a division with several requests in flight
         
         Args:
             division_id: Division ID
             season_id: Season ID
             match_ids: List of match IDs to scrape
+            sink: Optional callable given each scorecard as soon as it is parsed
             
         Returns:
-            list: List of scorecard dictionaries
+            list: List of Scorecard records, in match_ids order
         """
-        print(f"\n📊 Scraping {len(match_ids)} scorecards for Div {division_id}...")
+        self.log(f"📊 Scraping {len(match_ids)} scorecards for Div {division_id}...")
         
-        scorecards = []
-        for i, match_id in enumerate(match_ids, 1):
-            print(f"  [{i}/{len(match_ids)}] Match {match_id}...", end=' ')
-            
-            scorecard = self.scrape_scorecard(match_id, division_id, season_id)
-            if scorecard:
-                scorecards.append(scorecard)
-                print("✅")
-            else:
-                print("❌")
-            
-            # Rate limiting
-            if i % 10 == 0:
-                time.sleep(2)  # Longer pause every 10 requests
-            else:
-                time.sleep(0.5)  # Short pause between requests
+        total = len(match_ids)
+        done = 0
+        
+        async def fetch_one(match_id):
+            nonlocal done
+            scorecard = await self.ascrape_scorecard(match_id, division_id, season_id)
+            done += 1
+            if scorecard and sink:
+                sink(scorecard)
+            self.log(f"  [{done}/{total}] Match {match_id}... {'✅' if scorecard else '❌'}")
+            return scorecard
         
-        print(f"  ✅ Scraped {len(scorecards)}/{len(match_ids)} scorecards")
+        results = await asyncio.gather(*(fetch_one(match_id) for match_id in match_ids))
+        scorecards = [scorecard for scorecard in results if scorecard]
+        
+        self.log(f"  ✅ Scraped {len(scorecards)}/{len(match_ids)} scorecards")
         return scorecards
+    
+    def scrape_division_scorecards(self, division_id, season_id, match_ids, sink=None):
+        """
+        Scrape all scorecards for a division
+        
+        Politeness comes from the fetcher's per-host limit rather than fixed
+        sleeps, so wall-clock time is bounded by the server. Use
+        ascrape_division_scorecards from code that already runs an event loop.
+        
+        Args:
+            division_id: Division ID
+            season_id: Season ID
+            match_ids: List of match IDs to scrape
+            sink: Optional callable given each scorecard as soon as it is parsed
+            
+        Returns:
+            list: List of Scorecard records
+        """
+        return asyncio.run(self.ascrape_division_scorecards(division_id, season_id, match_ids, sink))
+
+
+def parse_scorecard_page(content, match_id, league_id, season_id, parser='html.parser'):
+    """
+    Parse a raw MatchScorecard page
+    
+    A plain function (rather than a method) so it can run in a process pool.
+    
+    Args:
+        content: Page body
+        match_id: Match ID
+        league_id: Division/League ID
+        season_id: Season ID
+        parser: HTML parser backend
+        
+    Returns:
+        Scorecard: Scorecard record, or None if the page has no scorecard
+    """
+    try:
+        # Find all tables
+        tables = find_tables(content, parser, ScorecardScraper.parse_target)
+        if len(tables) < 3:
+            print(f"  ⚠️  Insufficient tables for match {match_id}")
+            return None
+        
+        # Parse match info (usually in first table or headers)
+        match_info = ScorecardScraper._parse_match_info(tables)
+        
+        # Parse innings data
+        # Table 2 = Team 1 batting
+        # Table 3 = Team 1 bowling
+        # Table 4 = Team 2 batting (if exists)
+        # Table 5 = Team 2 bowling (if exists)
+        
+        team1_batting = ScorecardScraper._parse_batting_table(tables[1]) if len(tables) > 1 else []
+        team1_bowling = ScorecardScraper._parse_bowling_table(tables[2]) if len(tables) > 2 else []
+        team2_batting = ScorecardScraper._parse_batting_table(tables[3]) if len(tables) > 3 else []
+        team2_bowling = ScorecardScraper._parse_bowling_table(tables[4]) if len(tables) > 4 else []
+        
+        return Scorecard(
+            match_id, league_id, season_id, match_info,
+            Innings(team1_batting, team1_bowling),
+            Innings(team2_batting, team2_bowling)
+        )
+        
+    except Exception as e:
+        print(f"  ❌ Error scraping match {match_id}: {str(e)}")
+        return None
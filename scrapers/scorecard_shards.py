@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Scorecard Shards - One small file per match plus a per-division manifest
+
+The app shows one scorecard at a time but downloads the whole
+scorecards_div_X_season_Y.json for it. Next to that file, each scorecard is
+also written on its own, minified, keyed by match ID (match IDs are unique
+across divisions):
+
+    data/scorecards/66/27751.json
+    data/scorecards/66/manifest_div_8.json
+
+The manifest maps each match ID to its file (relative to the data
+directory), size in bytes and SHA-256 of the bytes:
+
+    {"division_id": 8, "season_id": 66,
+     "matches": {"27751": {"file": "scorecards/66/27751.json", "size": 2874, "sha256": "9f2c..."}}}
+
+A client fetches the manifest, then only the scorecard it needs, and can skip
+any match whose hash it already has. Shards whose hash matches the previous
+manifest are not rewritten. Shards of matches that left the division are
+removed.
+
+    python3 -m scrapers.scorecard_shards [data_dir]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from .career_aggregator import scorecard_files
+from .publisher import dumps_compact
+from .records import scorecards_to_json
+
+
+SHARD_DIR = 'scorecards'
+
+
+def shard_path(data_dir, season_id, match_id):
+    """data_dir/scorecards/<season>/<match_id>.json"""
+    return os.path.join(data_dir, SHARD_DIR, str(season_id), f"{match_id}.json")
+
+
+def manifest_path(data_dir, division_id, season_id):
+    """data_dir/scorecards/<season>/manifest_div_<division>.json"""
+    return os.path.join(data_dir, SHARD_DIR, str(season_id), f"manifest_div_{division_id}.json")
+
+
+def load_manifest(path):
+    """Previous manifest's matches, or {} if missing/unreadable"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get('matches', {})
+    except (ValueError, AttributeError):
+        return {}
+
+
+def _atomic_write(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def write_shards(data_dir, division_id, season_id, scorecards):
+    """
+    Write one file per scorecard and the division's manifest
+
+    Args:
+        scorecards: Scorecard records or their dict form
+
+    Returns:
+        dict: Counts of shards written/unchanged/removed, total shard bytes, manifest path
+    """
+    path = manifest_path(data_dir, division_id, season_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    previous = load_manifest(path)
+
+    matches = {}
+    written = unchanged = size = 0
+    for scorecard in scorecards_to_json(scorecards):
+        match_id = str(scorecard['match_id'])
+        payload = dumps_compact(scorecard)
+        digest = hashlib.sha256(payload).hexdigest()
+        target = shard_path(data_dir, season_id, match_id)
+        if previous.get(match_id, {}).get('sha256') == digest and os.path.exists(target):
+            unchanged += 1
+        else:
+            _atomic_write(target, payload)
+            written += 1
+        size += len(payload)
+        matches[match_id] = {
+            'file': os.path.relpath(target, data_dir).replace(os.sep, '/'),
+            'size': len(payload),
+            'sha256': digest
+        }
+
+    removed = 0
+    for match_id in previous:
+        stale = shard_path(data_dir, season_id, match_id)
+        if match_id not in matches and os.path.exists(stale):
+            os.remove(stale)
+            removed += 1
+
+    manifest = {'division_id': division_id, 'season_id': season_id, 'matches': matches}
+    if written or removed or set(previous) != set(matches) or not os.path.exists(path):
+        _atomic_write(path, dumps_compact(manifest))
+    return {'written': written, 'unchanged': unchanged, 'removed': removed, 'bytes': size, 'manifest': path}
+
+
+def shard_summary(report):
+    """One-line report of a write_shards call"""
+    count = report['written'] + report['unchanged']
+    return (f"{count} scorecard shards ({report['written']} written, {report['unchanged']} unchanged, "
+            f"{report['removed']} removed, avg {report['bytes'] / max(count, 1) / 1024:.1f} KB) "
+            f"+ {report['manifest']}")
+
+
+def shard_dir(data_dir='data'):
+    """Shard every scorecards_div_X_season_Y.json in data_dir"""
+    reports = []
+    for path, division_id, season_id in scorecard_files(data_dir):
+        with open(path, 'r') as f:
+            report = write_shards(data_dir, division_id, season_id, json.load(f))
+        print(f"✅ {os.path.basename(path)}: {shard_summary(report)}")
+        reports.append(report)
+    return reports
+
+
+def main():
+    shard_dir(sys.argv[1] if len(sys.argv) > 1 else 'data')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+SQLite Store - Local analytical database with the azure/schema.sql tables
+
+Bulk-loads the scraper's data/*.json files into SQLite so leaderboards,
+player histories and head-to-head records are indexed queries, not scans
+over every JSON file. The tables, indexes and views are read from
+azure/schema.sql and translated to SQLite. PostgreSQL-only parts (sample
+INSERT, plpgsql trigger functions) are skipped, and the upserts set
+last_updated instead of the triggers.
+
+Each file is loaded in one transaction with batched executemany upserts on
+the schema's natural keys, so loading a file again updates rows in place.
+Rows come from scrapers/schema_rows.py, the same rows the PostgreSQL ingest
+loads. Players are team-scoped, so a player's history across teams and
+seasons joins on name.
+
+    python3 -m scrapers.sqlite_store [data_dir] [db_path]
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from .records import load_scorecards
+from .schema_rows import SCHEMA_PATH, COLUMNS, conflict_clause, data_files, division_rows, scorecard_rows
+
+# Indexes the query layer needs on top of schema.sql
+EXTRA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_teams_name ON teams(name)",
+    "CREATE INDEX IF NOT EXISTS idx_scorecards_team ON scorecards(team_id)",
+)
+
+
+def sqlite_schema(path=SCHEMA_PATH):
+    """
+    schema.sql's CREATE TABLE / INDEX / VIEW statements, translated for SQLite
+
+    Returns:
+        list: SQL statements (all IF NOT EXISTS, so they can run on every open)
+    """
+    with open(path, 'r') as f:
+        sql = f.read()
+    sql = re.sub(r'--[^\n]*', '', sql)
+    sql = re.sub(r'\$\$.*?\$\$', '', sql, flags=re.DOTALL)  # plpgsql function bodies
+    statements = []
+    for statement in sql.split(';'):
+        statement = statement.strip()
+        if not statement.startswith(('CREATE TABLE', 'CREATE INDEX', 'CREATE VIEW')):
+            continue
+        statement = statement.replace('SERIAL PRIMARY KEY', 'INTEGER PRIMARY KEY').replace('JSONB', 'TEXT')
+        statement = re.sub(r'([\w.]+)::DECIMAL', r'CAST(\1 AS REAL)', statement)
+        statement = re.sub(r'^CREATE (TABLE|INDEX|VIEW) ', r'CREATE \1 IF NOT EXISTS ', statement)
+        statements.append(statement)
+    return statements
+
+
+class SQLiteStore:
+    """
+    SQLite database with the azure/schema.sql tables, plus the bulk loader and query layer
+
+    Args:
+        path: Database file (':memory:' for a throwaway store)
+    """
+
+    def __init__(self, path='data/arcl.db'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        # Bulk loads: WAL + NORMAL sync commits each file without a full fsync per statement
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Enforce the schema's foreign keys, as PostgreSQL does
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.conn:
+            for statement in sqlite_schema() + list(EXTRA_INDEXES):
+                self.conn.execute(statement)
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------------------------------------------------------- loading
+
+    def load_dir(self, data_dir='data'):
+        """
+        Load every division file, then every scorecard file, in data_dir
+
+        Returns:
+            dict: Rows upserted per table
+        """
+        totals = {}
+        files = data_files(data_dir)
+        print(f"\n🗄️  Loading {len(files)} files into {self.path}...")
+        start = time.perf_counter()
+        for kind, path, division_id, season_id in files:
+            file_start = time.perf_counter()
+            if kind == 'scorecards':
+                counts = self.load_scorecard_file(path, division_id, season_id)
+            else:
+                counts = self.load_division_file(path)
+            for table, rows in counts.items():
+                totals[table] = totals.get(table, 0) + rows
+            print(f"  ✓ {os.path.basename(path)}: {sum(counts.values())} rows "
+                  f"({(time.perf_counter() - file_start) * 1000:.0f} ms)")
+        print(f"✅ Loaded {sum(totals.values())} rows in {time.perf_counter() - start:.2f}s")
+        return totals
+
+    def load_division_file(self, path):
+        """
+        Upsert one div_X_season_Y.json: division, teams, players, batting/bowling stats, matches
+
+        Returns:
+            dict: Rows upserted per table
+        """
+        with open(path, 'r') as f:
+            rows = division_rows(json.load(f))
+        with self.conn:
+            for table in ('divisions', 'teams', 'players', 'batting_stats', 'bowling_stats', 'matches'):
+                self._upsert(table, rows[table])
+        return {table: len(table_rows) for table, table_rows in rows.items()}
+
+    def load_scorecard_file(self, path, division_id, season_id):
+        """
+        Upsert one scorecards_div_X_season_Y.json: per-innings scorecards plus batting/bowling detail rows
+
+        Detail rows have no natural key, so each loaded innings' rows are
+        replaced. Fifties/hundreds and four/five-wicket hauls on the season
+        stats are then recounted from the detail rows.
+
+        Returns:
+            dict: Rows upserted per table
+        """
+        rows = scorecard_rows(load_scorecards(path), division_id, season_id)
+        with self.conn:
+            self._upsert('divisions', rows['divisions'], stub=True)
+            self._upsert('teams', rows['teams'], stub=True)
+            self._upsert('matches', rows['matches'], stub=True)
+            self._upsert('players', rows['players'])
+            self._upsert('scorecards', rows['scorecards'])
+            ids = self._scorecard_ids({row[0] for row in rows['scorecards']})
+            loaded = [(ids[row[:3]],) for row in rows['scorecards']]
+            self.conn.executemany("DELETE FROM innings_details WHERE scorecard_id = ?", loaded)
+            self.conn.executemany("DELETE FROM bowling_details WHERE scorecard_id = ?", loaded)
+            for table in ('innings_details', 'bowling_details'):
+                columns = ('scorecard_id',) + COLUMNS[table][3:]
+                self.conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [(ids[row[:3]],) + row[3:] for row in rows[table]])
+            self._recount_milestones(season_id, [row[0] for row in rows['players']])
+        return {table: len(rows[table]) for table in ('players', 'scorecards', 'innings_details', 'bowling_details')}
+
+    def _upsert(self, table, rows, stub=False):
+        columns = COLUMNS[table]
+        self.conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"{conflict_clause(table, stub)}", rows)
+
+    def _scorecard_ids(self, match_ids):
+        """(match_id, team_id, innings) -> scorecards.id for the given matches"""
+        ids = {}
+        match_ids = list(match_ids)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(match_ids), 500):
+            chunk = match_ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT id, match_id, team_id, innings FROM scorecards "
+                f"WHERE match_id IN ({','.join('?' * len(chunk))})", chunk)
+            for row in rows:
+                ids[(row['match_id'], row['team_id'], row['innings'])] = row['id']
+        return ids
+
+    def _recount_milestones(self, season_id, player_ids):
+        """Fifties/hundreds and four/five-wicket hauls for players in the loaded file"""
+        params = [(player_id, season_id) for player_id in player_ids]
+        self.conn.executemany("""
+            UPDATE batting_stats SET
+                fifties = (SELECT COUNT(*) FROM innings_details d
+                           WHERE d.player_id = batting_stats.player_id AND d.runs >= 50 AND d.runs < 100),
+                hundreds = (SELECT COUNT(*) FROM innings_details d
+                            WHERE d.player_id = batting_stats.player_id AND d.runs >= 100)
+            WHERE player_id = ? AND season_id = ?
+        """, params)
+        self.conn.executemany("""
+            UPDATE bowling_stats SET
+                four_wickets = (SELECT COUNT(*) FROM bowling_details d
+                                WHERE d.player_id = bowling_stats.player_id AND d.wickets = 4),
+                five_wickets = (SELECT COUNT(*) FROM bowling_details d
+                                WHERE d.player_id = bowling_stats.player_id AND d.wickets >= 5)
+            WHERE player_id = ? AND season_id = ?
+        """, params)
+
+    # ---------------------------------------------------------------- queries
+
+    def _rows(self, sql, params=()):
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def leaderboard(self, kind='batting', season_id=None, division_id=None, limit=10):
+        """
+        Top batsmen by runs or bowlers by wickets
+
+        Args:
+            kind: 'batting' or 'bowling'
+            season_id: Restrict to one season (optional)
+            division_id: Restrict to one division (optional)
+            limit: Rows to return
+
+        Returns:
+            list: Row dicts with player, team, division and season
+        """
+        if kind == 'batting':
+            columns = "s.runs, s.innings, s.average, s.strike_rate, s.fours, s.sixes, s.fifties, s.hundreds"
+            table, order = 'batting_stats', 's.runs DESC'
+        else:
+            columns = ("s.wickets, s.overs, s.runs_conceded, s.economy, s.average, s.strike_rate, "
+                       "s.four_wickets, s.five_wickets")
+            table, order = 'bowling_stats', 's.wickets DESC, s.economy ASC'
+        where, params = [], []
+        if season_id is not None:
+            where.append("s.season_id = ?")
+            params.append(season_id)
+        if division_id is not None:
+            where.append("t.division_id = ?")
+            params.append(division_id)
+        return self._rows(f"""
+            SELECT p.player_id, p.name, t.name AS team, t.division_id, s.season_id, {columns}
+            FROM {table} s
+            JOIN players p ON p.player_id = s.player_id
+            LEFT JOIN teams t ON t.team_id = p.team_id
+            {'WHERE ' + ' AND '.join(where) if where else ''}
+            ORDER BY {order}, p.name
+            LIMIT ?
+        """, params + [limit])
+
+    def player_history(self, name):
+        """
+        A player's season-by-season batting and bowling, across every team they played for
+
+        Returns:
+            dict: {'batting': [...], 'bowling': [...]} oldest season first
+        """
+        batting = self._rows("""
+            SELECT s.season_id, t.division_id, t.name AS team, s.innings, s.runs, s.average, s.strike_rate,
+                   s.fours, s.sixes, s.fifties, s.hundreds
+            FROM players p
+            JOIN batting_stats s ON s.player_id = p.player_id
+            LEFT JOIN teams t ON t.team_id = p.team_id
+            WHERE p.name = ?
+            ORDER BY s.season_id, t.division_id
+        """, (name,))
+        bowling = self._rows("""
+            SELECT s.season_id, t.division_id, t.name AS team, s.overs, s.wickets, s.runs_conceded, s.economy,
+                   s.average, s.four_wickets, s.five_wickets
+            FROM players p
+            JOIN bowling_stats s ON s.player_id = p.player_id
+            LEFT JOIN teams t ON t.team_id = p.team_id
+            WHERE p.name = ?
+            ORDER BY s.season_id, t.division_id
+        """, (name,))
+        return {'batting': batting, 'bowling': bowling}
+
+    def head_to_head(self, team1, team2):
+        """
+        Every match between two teams (by name, across seasons) and the win count
+
+        Returns:
+            dict: {'played', 'team1_wins', 'team2_wins', 'matches': [...]}
+        """
+        ids = {team: [row['team_id'] for row in self.conn.execute("SELECT team_id FROM teams WHERE name = ?",
+                                                                  (team,))]
+               for team in (team1, team2)}
+        ids1, ids2 = ids[team1], ids[team2]
+        if not ids1 or not ids2:
+            return {'played': 0, 'team1_wins': 0, 'team2_wins': 0, 'matches': []}
+        marks1, marks2 = ','.join('?' * len(ids1)), ','.join('?' * len(ids2))
+        matches = self._rows(f"""
+            SELECT m.match_id, m.division_id, m.season_id, m.date, m.ground, m.team1_name, m.team2_name, m.status,
+                   m.winner_id,
+                   CASE WHEN m.winner_id = m.team1_id THEN m.team1_name
+                        WHEN m.winner_id = m.team2_id THEN m.team2_name END AS winner,
+                   (SELECT total_runs FROM scorecards c WHERE c.match_id = m.match_id AND c.innings = 1) AS innings1_runs,
+                   (SELECT total_runs FROM scorecards c WHERE c.match_id = m.match_id AND c.innings = 2) AS innings2_runs
+            FROM matches m
+            WHERE (m.team1_id IN ({marks1}) AND m.team2_id IN ({marks2}))
+               OR (m.team1_id IN ({marks2}) AND m.team2_id IN ({marks1}))
+            ORDER BY m.date, m.match_id
+        """, ids1 + ids2 + ids2 + ids1)
+        return {
+            'played': sum(1 for m in matches if m['status'] == 'completed'),
+            'team1_wins': sum(1 for m in matches if m['winner_id'] in ids1),
+            'team2_wins': sum(1 for m in matches if m['winner_id'] in ids2),
+            'matches': matches
+        }
+
+    def query_plan(self, sql, params=()):
+        """EXPLAIN QUERY PLAN details, e.g. to check a query uses an index"""
+        return [row['detail'] for row in self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def main():
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    db_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_dir, 'arcl.db')
+    store = SQLiteStore(db_path)
+    store.load_dir(data_dir)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,14 @@ Standings Scraper - Get league standings/rankings
 
 import hashlib
 from .base_scraper import BaseScraper
+from .parsers import ParseTarget
 
 
 class StandingsScraper(BaseScraper):
     """Scraper for league standings"""
     
+    parse_target = ParseTarget(table_id='GridViewOverall', max_tables=1)
+    
     @staticmethod
     def generate_team_id(team_name, division_id, season_id):
         """Generate deterministic team ID from team name + division + season"""
@@ -22,14 +25,10 @@ class StandingsScraper(BaseScraper):
     def scrape(self, division_id, season_id):
         """Scrape league standings from DivHome page"""
         url = f"{self.base_url}/Pages/UI/DivHome.aspx?teams_stats_type_id=1&season_id={season_id}&league_id={division_id}"
-        print(f"  🏆 Scraping standings...")
-        
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+        self.log(f"  🏆 Scraping standings...")
         
         # Find the Overall Standings table
-        table_data = self.extract_table_data(soup, 'GridViewOverall')
+        table_data = self.fetch_table_data(url)
         standings = []
         
         for row in table_data:
@@ -49,5 +48,5 @@ class StandingsScraper(BaseScraper):
                 except Exception as e:
                     continue
         
-        print(f"     ✓ Found {len(standings)} teams in standings")
+        self.log(f"     ✓ Found {len(standings)} teams in standings")
         return standings
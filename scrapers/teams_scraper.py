@@ -4,15 +4,19 @@ Teams Scraper - Get all teams in a division
 """
 
 from .base_scraper import BaseScraper
+from .parsers import ParseTarget
 
 
 class TeamsScraper(BaseScraper):
     """Scraper for team information"""
     
+    # Only the team links
+    parse_target = ParseTarget(tags='a')
+    
     def scrape(self, division_id, season_id):
         """Scrape team list for a division"""
         url = f"{self.base_url}/Pages/UI/LeagueTeams.aspx?league_id={division_id}&season_id={season_id}"
-        print(f"  📋 Scraping teams...")
+        self.log(f"  📋 Scraping teams...")
         
         soup = self.fetch_page(url)
         if not soup:
@@ -30,5 +34,5 @@ class TeamsScraper(BaseScraper):
                     teams.append(team_name)
                     seen.add(team_name)
         
-        print(f"     ✓ Found {len(teams)} teams")
+        self.log(f"     ✓ Found {len(teams)} teams")
         return teams
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Transport - One pooled, keep-alive HTTP session shared by every scraper
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli  # noqa: F401 - urllib3 decodes br responses when available
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+
+class Transport:
+    """
+    Shared requests.Session with a tuned connection pool.
+
+    All scrapers (and the helper scripts) send through one Transport so the
+    TCP/TLS handshake to arcl.org is paid once per pooled connection instead
+    of once per scraper.
+    """
+
+    def __init__(self, pool_connections=4, pool_maxsize=16, keep_alive=True, timeout=10):
+        """
+        Args:
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Connections kept alive per host (match fetcher concurrency)
+            keep_alive: Reuse connections between requests
+            timeout: Default request timeout in seconds
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive' if keep_alive else 'close'
+        })
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes = 0
+
+    def get(self, url, headers=None, **kwargs):
+        """GET through the shared pool (kwargs go to requests.Session.get)"""
+        kwargs.setdefault('timeout', self.timeout)
+        response = self.session.get(url, headers=headers, **kwargs)
+        with self._lock:
+            self._requests += 1
+            self._bytes += len(response.content)
+        return response
+
+    def stats(self):
+        """Requests sent vs connections opened across the live host pools"""
+        connections = 0
+        pooled_requests = 0
+        for key in self.adapter.poolmanager.pools.keys():
+            pool = self.adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                pooled_requests += pool.num_requests
+        return {
+            'requests': self._requests,
+            'connections_opened': connections,
+            'connections_reused': max(pooled_requests - connections, 0),
+            'bytes_received': self._bytes
+        }
+
+    def summary(self):
+        """One-line report of connection reuse"""
+        s = self.stats()
+        return (f"{s['requests']} requests over {s['connections_opened']} connections "
+                f"({s['connections_reused']} reused), {s['bytes_received'] / 1024:.0f} KB received")
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport():
+    """The process-wide transport used by scrapers that are not given one"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = Transport()
+        return _default_transport
+
+
+def set_default_transport(transport):
+    """Replace the process-wide transport"""
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
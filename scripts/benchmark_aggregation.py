@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Aggregation Benchmark - Row-at-a-time vs. columnar player aggregation
+
+Runs aggregate_players_from_scorecards and aggregate_players_columnar on every
+data/scorecards_div_*_season_*.json file, checks the outputs are identical,
+and times both. Then repeats on a synthetic input 100x the size of all files
+combined (each copy with its own team names, so both rows and players scale).
+
+    python3 -m scripts.benchmark_aggregation [data_dir] [scale]
+"""
+
+import contextlib
+import glob
+import io
+import os
+import re
+import sys
+import time
+
+# Lets `python3 scripts/benchmark_aggregation.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.player_aggregator import aggregate_players_from_scorecards
+from scrapers.columnar_aggregator import aggregate_players_columnar, HAS_NUMPY
+from scrapers.records import Scorecard, load_scorecards
+
+
+def timed(func, scorecards, division_id, season_id, repeat):
+    """(best seconds, output) over `repeat` runs, with the aggregators' prints silenced"""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            output = func(scorecards, [], division_id, season_id)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def synthetic(scorecards, scale):
+    """`scale` copies of the scorecards, each copy's teams renamed so players don't merge"""
+    copies = []
+    for i in range(scale):
+        for scorecard in scorecards:
+            match_info = dict(scorecard.match_info, team1=f"{scorecard.team1} #{i}", team2=f"{scorecard.team2} #{i}")
+            copies.append(Scorecard(f"{scorecard.match_id}-{i}", scorecard.league_id, scorecard.season_id,
+                                    match_info, scorecard.team1_innings, scorecard.team2_innings))
+    return copies
+
+
+def count_rows(scorecards):
+    return sum(len(innings.batting) + len(innings.bowling) for s in scorecards
+               for innings in (s.team1_innings, s.team2_innings))
+
+
+def report(label, rows, scorecards, division_id, season_id, repeat):
+    python_time, expected = timed(aggregate_players_from_scorecards, scorecards, division_id, season_id, repeat)
+    columnar_time, actual = timed(aggregate_players_columnar, scorecards, division_id, season_id, repeat)
+    same = expected == actual
+    print(f"{label:<34} {rows:>8} {python_time * 1000:>10.1f} {columnar_time * 1000:>10.1f} "
+          f"{python_time / columnar_time:>7.1f}x {'ok' if same else 'DIFF':>7}")
+    return same
+
+
+def run(data_dir='data', scale=100):
+    if not HAS_NUMPY:
+        print("⚠️  NumPy is not installed - the columnar engine falls back to the row aggregator (pip install numpy)")
+    paths = sorted(glob.glob(os.path.join(data_dir, 'scorecards_div_*_season_*.json')))
+    if not paths:
+        print(f"❌ No scorecard files in {data_dir}")
+        return 1
+
+    print(f"{'input':<34} {'rows':>8} {'python ms':>10} {'numpy ms':>10} {'speedup':>8} {'parity':>7}")
+    mismatches = 0
+    everything = []
+    for path in paths:
+        division_id, season_id = map(int, re.findall(r'\d+', os.path.basename(path)))
+        scorecards = load_scorecards(path)
+        everything += scorecards
+        rows = count_rows(scorecards)
+        mismatches += not report(os.path.basename(path), rows, scorecards, division_id, season_id, repeat=5)
+
+    big = synthetic(everything, scale)
+    rows = count_rows(big)
+    mismatches += not report(f"all files x{scale} (synthetic)", rows, big, 0, 0, repeat=1)
+    return mismatches
+
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    scale = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    sys.exit(1 if run(data_dir, scale) else 0)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Career Benchmark - Serial vs. process-pool career aggregation
+
+Builds a synthetic archive of `seasons` seasons by copying every
+data/scorecards_div_*_season_*.json file under new season IDs. Then it runs
+aggregate_careers serially and with a process pool, checks that both give
+identical totals, and reports time and the reducer's peak memory. Also checks
+that one season's per-division totals match aggregate_players_from_scorecards.
+
+    python3 -m scripts.benchmark_careers [data_dir] [seasons]
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Lets `python3 scripts/benchmark_careers.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.career_aggregator import aggregate_careers, scorecard_files
+from scrapers.player_aggregator import aggregate_players_from_scorecards
+from scrapers.records import load_scorecards, overs_to_balls
+
+
+def build_archive(data_dir, seasons, archive_dir):
+    """Copy each scorecard file once per synthetic season"""
+    files = scorecard_files(data_dir)
+    for season_id in range(1, seasons + 1):
+        for path, division_id, _ in files:
+            shutil.copy(path, os.path.join(archive_dir, f"scorecards_div_{division_id}_season_{season_id}.json"))
+    return len(files) * seasons
+
+
+def timed(data_dir, workers):
+    """(seconds, reducer peak bytes, totals) for one aggregate_careers run"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        start = time.perf_counter()
+        stats = aggregate_careers(data_dir, workers=workers)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        totals = stats.to_dict()
+    totals.pop('last_updated')
+    return elapsed, peak, totals
+
+
+def _numbers(row, fields):
+    """Stat fields as ints ('3.5' overs as 23 balls)"""
+    return [overs_to_balls(row[field]) if field == 'overs' else int(row[field]) for field in fields]
+
+
+def division_parity(data_dir):
+    """One season's by-division batting/bowling totals vs. the per-division aggregator"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        totals = aggregate_careers(data_dir, workers=1).to_dict()
+    mismatches = 0
+    for path, division_id, season_id in scorecard_files(data_dir):
+        with contextlib.redirect_stdout(io.StringIO()):
+            batsmen, bowlers = aggregate_players_from_scorecards(load_scorecards(path), [], division_id, season_id)
+        for rows, career_rows, fields in (
+                (batsmen, totals['batting_by_division'], ('innings', 'runs', 'fours', 'sixes')),
+                (bowlers, totals['bowling_by_division'], ('innings', 'overs', 'runs_given', 'wickets'))):
+            # Per-division rows are keyed by (name, team); careers key by name
+            expected = {}
+            for row in rows:
+                current = expected.setdefault(row['name'], [0] * len(fields))
+                for i, value in enumerate(_numbers(row, fields)):
+                    current[i] += value
+            actual = {row['name']: _numbers(row, fields) for row in career_rows if row['division_id'] == division_id}
+            mismatches += expected != actual
+    return mismatches
+
+
+def run(data_dir='data', seasons=24):
+    mismatches = division_parity(data_dir)
+    print(f"{'✅' if not mismatches else '❌'} Per-division totals match aggregate_players_from_scorecards")
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        files = build_archive(data_dir, seasons, archive_dir)
+        size = sum(os.path.getsize(os.path.join(archive_dir, f)) for f in os.listdir(archive_dir))
+        print(f"📦 Synthetic archive: {seasons} seasons, {files} files, {size / 1e6:.0f} MB\n")
+        print(f"{'workers':<10} {'seconds':>8} {'reducer peak MB':>16}")
+        serial_time, serial_peak, expected = timed(archive_dir, 1)
+        print(f"{1:<10} {serial_time:>8.2f} {serial_peak / 1e6:>16.1f}")
+        workers = max(2, os.cpu_count() or 1)
+        pool_time, pool_peak, actual = timed(archive_dir, workers)
+        print(f"{workers:<10} {pool_time:>8.2f} {pool_peak / 1e6:>16.1f}")
+    same = expected == actual
+    print(f"\n{'✅' if same else '❌'} Pool output {'identical to' if same else 'DIFFERS from'} serial "
+          f"({serial_time / pool_time:.1f}x)")
+    return 0 if same and not mismatches else 1
+
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    seasons = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    sys.exit(run(data_dir, seasons))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Division I/O Benchmark - One atomic write per division vs. the old write/read/rewrite
+
+Before, a division with scorecards cost three reads and two writes of its
+file: the previous run's file was read up front, the pages were written, the
+scorecard stage read that file back and rewrote it, and the division stage
+reloaded it. Now the document stays in memory and is written once through a
+temp file and a rename. This replays both patterns on every data/div_*.json
+file in a temp directory and checks that they leave identical bytes.
+
+    python3 -m scripts.benchmark_division_io [data_dir] [repeat]
+"""
+
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Lets `python3 scripts/benchmark_division_io.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.arcl_scraper import ARCLDataScraper
+from scrapers.player_index import PlayerIndex
+
+
+def old_pattern(path, data):
+    """Read previous, write pages, read + rewrite with scorecard players, reload"""
+    with open(path, 'r') as f:
+        json.load(f)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    with open(path, 'r') as f:
+        division_data = json.load(f)
+    division_data['batsmen'] = data['batsmen']
+    division_data['bowlers'] = data['bowlers']
+    with open(path, 'w') as f:
+        json.dump(division_data, f, indent=2)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def best_of(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(data_dir='data', repeat=5):
+    documents = {}
+    for path in sorted(glob.glob(os.path.join(data_dir, 'div_*_season_*.json'))):
+        with open(path, 'r') as f:
+            documents[os.path.basename(path)] = json.load(f)
+    if not documents:
+        print(f"❌ No division files in {data_dir}")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = ARCLDataScraper(output_dir=tmp, player_index=PlayerIndex(os.path.join(tmp, 'player_index.json')))
+        old_dir = os.path.join(tmp, 'old')
+        new_dir = os.path.join(tmp, 'new')
+        os.makedirs(old_dir)
+        os.makedirs(new_dir)
+        for name, data in documents.items():
+            with open(os.path.join(old_dir, name), 'w') as f:
+                json.dump(data, f, indent=2)
+
+        old_time = best_of(lambda: [old_pattern(os.path.join(old_dir, name), data)
+                                    for name, data in documents.items()], repeat)
+        new_time = best_of(lambda: [scraper._write_json(os.path.join(new_dir, name), data)
+                                    for name, data in documents.items()], repeat)
+
+        same = True
+        size = 0
+        for name in documents:
+            with open(os.path.join(old_dir, name), 'rb') as f:
+                old_bytes = f.read()
+            with open(os.path.join(new_dir, name), 'rb') as f:
+                new_bytes = f.read()
+            same &= old_bytes == new_bytes
+            size += len(new_bytes)
+        leftovers = [name for name in os.listdir(new_dir) if name.endswith('.tmp')]
+
+    print(f"💾 {len(documents)} division files, {size / 1024:.0f} KB (best of {repeat})")
+    print(f"   write/read/rewrite/reload: {old_time * 1000:>8.1f} ms  (3 reads + 2 writes per file)")
+    print(f"   one atomic write:          {new_time * 1000:>8.1f} ms  (1 write per file)")
+    print(f"   saved {(old_time - new_time) * 1000:.1f} ms ({old_time / new_time:.1f}x less file I/O time)")
+    print(f"{'✅' if same else '❌'} Output {'identical' if same else 'DIFFERS'}")
+    print(f"{'✅' if not leftovers else '❌'} No temp files left behind")
+    return 0 if same and not leftovers else 1
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(run(args[0] if args else 'data', int(args[1]) if len(args) > 1 else 5))
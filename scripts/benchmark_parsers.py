@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Parser Backend Benchmark - Parity check and parse throughput per backend
+
+Replays the pages saved in a cassette through every installed parser backend,
+checks that extract_table_data and the scorecard parsers give exactly the same
+output as html.parser, and reports pages/sec and MB/sec per backend.
+
+    python3 -m scripts.benchmark_parsers cassettes/div_f.json.gz
+"""
+
+import os
+import sys
+import time
+
+# Lets `python3 scripts/benchmark_parsers.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import ScorecardScraper, BatsmenScraper, BowlersScraper, StandingsScraper
+from scrapers.cassette import Cassette
+from scrapers.parsers import available_backends, find_tables
+
+
+# URL substring -> parse target the scrapers extract from that page
+TABLE_PAGES = {
+    'MaxRuns.aspx': BatsmenScraper.parse_target,
+    'MaxWickets.aspx': BowlersScraper.parse_target,
+    'DivHome.aspx': StandingsScraper.parse_target,
+}
+
+
+def parse_page(url, body, backend, scorecard_scraper):
+    """Run the same extraction the scrapers do for this page type"""
+    if 'MatchScorecard.aspx' in url:
+        return scorecard_scraper.parse_scorecard(body, '0', 0, 0)
+    for pattern, target in TABLE_PAGES.items():
+        if pattern in url:
+            tables = find_tables(body, backend, target)
+            return tables[0].data() if tables else []
+    return [table.data() for table in find_tables(body, backend)]
+
+
+def run(cassette_path, repeat=3):
+    pages = Cassette(cassette_path, mode='replay').pages
+    total_bytes = sum(len(body) for body in pages.values())
+    backends = available_backends()
+    print(f"📼 {len(pages)} pages ({total_bytes / 1024 / 1024:.1f} MB), backends: {', '.join(backends)}\n")
+
+    scrapers = {backend: ScorecardScraper(parser=backend) for backend in backends}
+    reference = {url: parse_page(url, body, 'html.parser', scrapers['html.parser']) for url, body in pages.items()}
+
+    mismatches = 0
+    print(f"{'backend':<12} {'parity':>8} {'pages/s':>10} {'MB/s':>8} {'speedup':>8}")
+    baseline = None
+    for backend in backends:
+        scraper = scrapers[backend]
+        bad = [url for url, body in pages.items() if parse_page(url, body, backend, scraper) != reference[url]]
+        mismatches += len(bad)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for url, body in pages.items():
+                parse_page(url, body, backend, scraper)
+        elapsed = (time.perf_counter() - start) / repeat
+        baseline = baseline or elapsed
+
+        parity = 'ok' if not bad else f'{len(bad)} diff'
+        print(f"{backend:<12} {parity:>8} {len(pages) / elapsed:>10.1f} "
+              f"{total_bytes / 1024 / 1024 / elapsed:>8.2f} {baseline / elapsed:>7.1f}x")
+        for url in bad[:5]:
+            print(f"   ✗ {url}")
+
+    return mismatches
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(1 if run(sys.argv[1]) else 0)
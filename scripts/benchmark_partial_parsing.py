@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Partial Parsing Benchmark - Full page vs. targeted parse on saved pages
+
+For each page type in a cassette, parses every page with each installed
+backend twice: the whole document, and only the scraper's ParseTarget
+(pre-sliced GridView tables, or strained links). Reports parse time, peak
+memory and checks that both give the scraper identical data.
+
+    python3 -m scripts.benchmark_partial_parsing cassettes/div_f.json.gz
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Lets `python3 scripts/benchmark_partial_parsing.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import (TeamsScraper, BatsmenScraper, BowlersScraper, StandingsScraper,
+                      ScheduleScraper, ScorecardScraper)
+from scrapers.cassette import Cassette
+from scrapers.parsers import available_backends, find_tables, make_soup
+
+
+# URL substring -> (label, scraper class whose parse_target applies)
+PAGE_TYPES = [
+    ('LeagueTeams.aspx', 'teams', TeamsScraper),
+    ('MaxRuns.aspx', 'batsmen', BatsmenScraper),
+    ('MaxWickets.aspx', 'bowlers', BowlersScraper),
+    ('DivHome.aspx', 'standings', StandingsScraper),
+    ('LeagueSchedule.aspx', 'schedule', ScheduleScraper),
+    ('MatchScorecard.aspx', 'scorecards', ScorecardScraper),
+]
+
+
+def extract(body, backend, scraper_cls, partial):
+    """What the scraper reads from the page, parsed fully or partially"""
+    target = scraper_cls.parse_target
+    if target.tags:
+        soup = make_soup(body, backend, target, partial=partial)
+        return [(a.get('href'), a.get_text(strip=True)) for a in soup.find_all(target.tags, href=True)]
+    return [table.rows for table in find_tables(body, backend, target, partial=partial)]
+
+
+def measure(bodies, backend, scraper_cls, partial, repeat):
+    """(seconds per page, peak bytes for one page) for a parse mode"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            extract(body, backend, scraper_cls, partial)
+    per_page = (time.perf_counter() - start) / (repeat * len(bodies))
+
+    tracemalloc.start()
+    extract(bodies[0], backend, scraper_cls, partial)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_page, peak
+
+
+def run(cassette_path, repeat=3):
+    pages = Cassette(cassette_path, mode='replay').pages
+    mismatches = 0
+
+    print(f"{'page':<11} {'backend':<12} {'full ms':>8} {'part ms':>8} {'speedup':>8} "
+          f"{'full KB':>8} {'part KB':>8} {'parity':>7}")
+    for pattern, label, scraper_cls in PAGE_TYPES:
+        bodies = [body for url, body in pages.items() if pattern in url]
+        if not bodies:
+            continue
+        for backend in available_backends():
+            same = all(extract(b, backend, scraper_cls, False) == extract(b, backend, scraper_cls, True)
+                       for b in bodies)
+            mismatches += 0 if same else 1
+            full_time, full_peak = measure(bodies, backend, scraper_cls, False, repeat)
+            part_time, part_peak = measure(bodies, backend, scraper_cls, True, repeat)
+            print(f"{label:<11} {backend:<12} {full_time * 1000:>8.2f} {part_time * 1000:>8.2f} "
+                  f"{full_time / part_time:>7.1f}x {full_peak / 1024:>8.0f} {part_peak / 1024:>8.0f} "
+                  f"{'ok' if same else 'DIFF':>7}")
+
+    return mismatches
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(1 if run(sys.argv[1]) else 0)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Records Benchmark - Memory and round-trip cost of Scorecard records vs. dicts
+
+Loads a full season of scorecards (every data/scorecards_div_*_season_*.json
+file) and measures, with tracemalloc, how much memory stays allocated holding
+them as parsed JSON dicts vs. as __slots__ Scorecard records. Also checks that
+records round-trip the files exactly (apart from bowling economy, which is
+recomputed from legal balls) and times both directions.
+
+    python3 -m scripts.benchmark_records [data_dir]
+"""
+
+import gc
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Lets `python3 scripts/benchmark_records.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.records import Scorecard, scorecards_to_json
+
+
+def retained(load):
+    """(bytes still allocated after load(), loaded value)"""
+    gc.collect()
+    tracemalloc.start()
+    value = load()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, value
+
+
+def load_dicts(paths):
+    scorecards = []
+    for path in paths:
+        with open(path, 'r') as f:
+            scorecards += json.load(f)
+    return scorecards
+
+
+def load_records(paths):
+    return [Scorecard.from_dict(data) for data in load_dicts(paths)]
+
+
+def without_economy(scorecards):
+    """Scorecard dicts minus the derived bowling economy"""
+    return [[{k: v for k, v in row.items() if k != 'economy'}
+             for innings in ('team1_innings', 'team2_innings') for kind in ('batting', 'bowling')
+             for row in scorecard[innings][kind]] + [scorecard['match_info'], scorecard['match_id']]
+            for scorecard in scorecards]
+
+
+def run(data_dir='data'):
+    paths = sorted(glob.glob(os.path.join(data_dir, 'scorecards_div_*_season_*.json')))
+    if not paths:
+        print(f"❌ No scorecard files in {data_dir}")
+        return 1
+
+    dict_bytes, dicts = retained(lambda: load_dicts(paths))
+    record_bytes, records = retained(lambda: load_records(paths))
+    rows = sum(len(innings.batting) + len(innings.bowling)
+               for scorecard in records for innings in (scorecard.team1_innings, scorecard.team2_innings))
+
+    start = time.perf_counter()
+    converted = [Scorecard.from_dict(data) for data in dicts]
+    from_dict_time = time.perf_counter() - start
+    start = time.perf_counter()
+    round_trip = scorecards_to_json(converted)
+    to_dict_time = time.perf_counter() - start
+    same = without_economy(round_trip) == without_economy(dicts)
+
+    print(f"📦 {len(paths)} files, {len(records)} scorecards, {rows} batting/bowling rows\n")
+    print(f"{'held as':<12} {'MB':>8} {'bytes/row':>10}")
+    print(f"{'dicts':<12} {dict_bytes / 1e6:>8.2f} {dict_bytes / rows:>10.0f}")
+    print(f"{'records':<12} {record_bytes / 1e6:>8.2f} {record_bytes / rows:>10.0f}")
+    print(f"\n💾 Records use {record_bytes / dict_bytes:.0%} of the dict memory")
+    print(f"⏱️  from_dict {from_dict_time * 1000:.1f} ms, to_dict {to_dict_time * 1000:.1f} ms "
+          f"({len(records) / (from_dict_time + to_dict_time):.0f} scorecards/s round trip)")
+    print(f"{'✅' if same else '❌'} Round trip {'identical' if same else 'DIFFERS'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1] if len(sys.argv) > 1 else 'data'))
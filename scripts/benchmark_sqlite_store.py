@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+SQLite Store Benchmark - Bulk load time and indexed queries vs. JSON scans
+
+Loads every data/*.json file into a throwaway SQLiteStore twice. The second
+load must leave the row counts unchanged, because the loader upserts. Then it
+times a season leaderboard, a player history and a head-to-head query
+against the same answers computed by scanning the JSON files. It checks that
+the answers match and prints each query's plan.
+
+    python3 -m scripts.benchmark_sqlite_store [data_dir]
+"""
+
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Lets `python3 scripts/benchmark_sqlite_store.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.sqlite_store import SQLiteStore
+
+TABLES = ('divisions', 'teams', 'players', 'batting_stats', 'bowling_stats', 'matches', 'scorecards',
+          'innings_details', 'bowling_details')
+
+
+def row_counts(store):
+    return {table: store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in TABLES}
+
+
+def best_of(func, repeat=20):
+    """(best seconds, result) over repeat calls"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def division_files(data_dir):
+    return sorted(glob.glob(os.path.join(data_dir, 'div_*_season_*.json')))
+
+
+def scan_leaderboard(data_dir, season_id, limit):
+    """Top run scorers by reading every division file"""
+    rows = []
+    for path in division_files(data_dir):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data['season_id'] == season_id:
+            rows += [(int(row['runs']), row['name']) for row in data['batsmen']]
+    return [name for _, name in sorted(rows, key=lambda r: (-r[0], r[1]))[:limit]]
+
+
+def scan_player_history(data_dir, name):
+    """(season, team, runs) for every batsmen row with this name"""
+    rows = []
+    for path in division_files(data_dir):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        rows += [(data['season_id'], row['team'], int(row['runs'])) for row in data['batsmen'] if row['name'] == name]
+    return sorted(rows)
+
+
+def scan_head_to_head(data_dir, team1, team2):
+    """Match IDs between two teams by reading every schedule"""
+    match_ids = []
+    for path in division_files(data_dir):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        match_ids += [str(m['match_id']) for m in data['schedule'] if {m['team1'], m['team2']} == {team1, team2}]
+    return sorted(match_ids)
+
+
+def run(data_dir='data'):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(os.path.join(tmp, 'arcl.db'))
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            store.load_dir(data_dir)
+            load_time = time.perf_counter() - start
+            counts = row_counts(store)
+            start = time.perf_counter()
+            store.load_dir(data_dir)
+            reload_time = time.perf_counter() - start
+        idempotent = row_counts(store) == counts
+        print(f"🗄️  {sum(counts.values())} rows: load {load_time:.2f}s, reload {reload_time:.2f}s")
+        print(f"{'✅' if idempotent else '❌'} Reload {'kept' if idempotent else 'CHANGED'} the row counts\n")
+
+        top = store.leaderboard('batting', limit=1)
+        if not top:
+            print("❌ No batting stats loaded")
+            return 1
+        season_id, name = top[0]['season_id'], top[0]['name']
+        match = store.conn.execute("SELECT team1_name, team2_name FROM matches LIMIT 1").fetchone()
+        team1, team2 = match['team1_name'], match['team2_name']
+
+        checks = [
+            ('leaderboard',
+             lambda: [row['name'] for row in store.leaderboard('batting', season_id, limit=10)],
+             lambda: scan_leaderboard(data_dir, season_id, 10),
+             ("SELECT * FROM batting_stats s JOIN players p ON p.player_id = s.player_id "
+              "WHERE s.season_id = ? ORDER BY s.runs DESC LIMIT 10", (season_id,))),
+            ('player history',
+             lambda: sorted((row['season_id'], row['team'], row['runs'])
+                            for row in store.player_history(name)['batting']),
+             lambda: scan_player_history(data_dir, name),
+             ("SELECT * FROM players p JOIN batting_stats s ON s.player_id = p.player_id WHERE p.name = ?", (name,))),
+            ('head to head',
+             lambda: sorted(m['match_id'] for m in store.head_to_head(team1, team2)['matches']),
+             lambda: scan_head_to_head(data_dir, team1, team2),
+             ("SELECT * FROM matches WHERE team1_id = ? AND team2_id = ?", ('', ''))),
+        ]
+        failures = 0
+        print(f"{'query':<16} {'sqlite ms':>10} {'json scan ms':>13} {'speedup':>8}  parity")
+        for label, query, scan, _ in checks:
+            query_time, actual = best_of(query)
+            scan_time, expected = best_of(scan, repeat=3)
+            same = actual == expected
+            failures += not same
+            print(f"{label:<16} {query_time * 1000:>10.2f} {scan_time * 1000:>13.1f} "
+                  f"{scan_time / query_time:>7.0f}x  {'ok' if same else 'DIFFERS'}")
+        print()
+        for label, _, _, (sql, params) in checks:
+            print(f"🔍 {label}: {'; '.join(store.query_plan(sql, params))}")
+        store.close()
+    return 0 if idempotent and not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1] if len(sys.argv) > 1 else 'data'))
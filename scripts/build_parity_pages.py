@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Parity Pages - Rebuild the parser parity fixtures from the committed Div F data
+
+Writes scripts/fixtures/pages/ (MaxRuns, MaxWickets, DivHome and the
+MatchScorecard pages for matches 27120 and 27127) from data/div_8_season_66.json
+and data/scorecards_div_8_season_66.json, in the markup the ARCL site serves:
+ASP.NET GridViews with a __VIEWSTATE blob, a pager row holding a nested
+table, &nbsp; cells, player links, non-ASCII names and '<table' inside a
+script.
+
+Every player gets one player_id and every team one team_id across all pages,
+keyed by (team, name). Summary rows (Overs, Rate, Byes, Total, ...) are plain
+text with no player link, as on the site.
+
+    python3 scripts/build_parity_pages.py [data_dir]
+"""
+
+import html
+import json
+import os
+import sys
+
+# Lets `python3 scripts/build_parity_pages.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.player_aggregator import INVALID_BATTING_NAMES, INVALID_BOWLING_NAMES, is_player_name
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+DIVISION_ID = 8
+SEASON_ID = 66
+MATCH_IDS = ('27120', '27127')
+QUERY = f"league_id={DIVISION_ID}&amp;season_id={SEASON_ID}"
+
+escape = html.escape
+
+
+def page(title, body):
+    """Wrap page content in the site's layout: scripts, viewstate form and menu"""
+    return f'''<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+<meta http-equiv="Content-Type" content="text/html; charset=utf-8" />
+<title>{title}</title>
+<script type="text/javascript">
+//<![CDATA[
+function __doPostBack(eventTarget, eventArgument) {{ if (theForm.onsubmit == null || theForm.onsubmit() != false) {{ theForm.submit(); }} }}
+var layout = "<table><tr><td>not a real table</td></tr></table>";
+//]]>
+</script>
+</head>
+<body>
+<form name="aspnetForm" method="post" action="./{title}.aspx?{QUERY}" id="aspnetForm">
+<div>
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="/wEPDwUKMTY1NDU2MTA1MmRkFm8sY2hhbmdlZA==" />
+</div>
+<ul class="menu">
+<li><a href="DivHome.aspx?league_id=3&amp;season_id=66">Div A</a></li>
+<li><a href="DivHome.aspx?league_id=8&amp;season_id=66">Div F</a></li>
+</ul>
+<div id="content">
+{body}
+</div>
+</form>
+</body>
+</html>
+'''
+
+
+def grid(grid_id, headers, rows, pager=False):
+    """A GridView table, optionally with a pager row holding a nested table"""
+    out = ['<table class="table" cellspacing="0" rules="all" border="1" '
+           f'id="ctl00_ContentPlaceHolder1_{grid_id}" style="border-collapse:collapse;">']
+    out.append('\t<tr>\n' + ''.join(f'\t\t<th scope="col">{header}</th>\n' for header in headers) + '\t</tr>')
+    for row in rows:
+        out.append('<tr>\n' + ''.join(f'\t\t<td>{cell}</td>\n' for cell in row) + '\t</tr>')
+    if pager:
+        out.append(f'<tr class="pager">\n\t\t<td colspan="{len(headers)}"><table>\n\t\t\t<tr>\n'
+                   '\t\t\t\t<td><span>1</span></td><td>'
+                   f'<a href="javascript:__doPostBack(&#39;ctl00$ContentPlaceHolder1${grid_id}&#39;,&#39;Page$2&#39;)">2</a></td>\n'
+                   '\t\t\t</tr>\n\t\t</table></td>\n\t</tr>')
+    out.append('</table>')
+    return '\n'.join(out)
+
+
+class Ids:
+    """Stable site IDs: one per team name and one per (team, player name)"""
+
+    def __init__(self):
+        self.teams = {}
+        self.players = {}
+
+    def team(self, team):
+        return self.teams.setdefault(team, 1400 + len(self.teams))
+
+    def player(self, team, name):
+        return self.players.setdefault((self.team(team), name), 30000 + len(self.players))
+
+    def link(self, team, name):
+        return (f'<a href="PlayerStats.aspx?team_id={self.team(team)}&amp;player_id={self.player(team, name)}'
+                f'&amp;{QUERY}">{escape(name)}</a>')
+
+
+def scorecard_page(card, ids):
+    info = card['match_info']
+    body = ('<table class="match-info">\n'
+            f'<tr><td><b>Match:</b></td>\n<td>{escape(info["team1"])} vs {escape(info["team2"])}</td></tr>\n'
+            f'<tr><td><b>Date:</b></td>\n<td>{info["date"]}</td></tr>\n'
+            f'<tr><td><b>Ground:</b></td>\n<td>{escape(info["ground"])}</td></tr>\n'
+            f'<tr><td><b>Result:</b></td>\n<td>{escape(info["result"])}</td></tr>\n'
+            f'<tr><td><b>Man of the match:</b></td>\n<td>{escape(info["man_of_match"])}</td></tr>\n</table>\n')
+    # Each team's innings: it bats, the other side bowls
+    sides = [('team1_innings', info['team1'], info['team2']), ('team2_innings', info['team2'], info['team1'])]
+    for number, (innings, batting_team, bowling_team) in enumerate(sides, 1):
+        batting = card[innings]['batting']
+        bowling = card[innings]['bowling']
+        body += grid(f'gvBatting{number}', ['Batter', 'How_out', 'Fielder', 'Bowler', 'Sixs', 'Fours', 'Runs', 'Balls'],
+                     [[ids.link(batting_team, b['name']) if is_player_name(b['name'], INVALID_BATTING_NAMES)
+                       else escape(b['name']),
+                       escape(b['how_out']), '&nbsp;', escape(b['bowler']), b['sixes'], b['fours'], b['runs'], b['balls']]
+                      for b in batting]) + '\n'
+        body += grid(f'gvBowling{number}', ['Bowler', 'Overs', 'Maiden', 'No_Balls', 'Wide', 'Runs', 'Wicket'],
+                     [[ids.link(bowling_team, b['name']) if is_player_name(b['name'], INVALID_BOWLING_NAMES)
+                       else escape(b['name']),
+                       b['overs'], b['maidens'], b['no_balls'], b['wides'], b['runs'], b['wickets']]
+                      for b in bowling]) + '\n'
+    body += grid('gvFOW', ['Fall of wickets'], [['1-12 (3.2), 2-40 (7.5)']])
+    return page('MatchScorecard', body)
+
+
+def build(data_dir='data'):
+    """Page name -> HTML for every fixture page"""
+    with open(os.path.join(data_dir, f'div_{DIVISION_ID}_season_{SEASON_ID}.json'), 'r') as f:
+        division = json.load(f)
+    with open(os.path.join(data_dir, f'scorecards_div_{DIVISION_ID}_season_{SEASON_ID}.json'), 'r') as f:
+        cards = {str(card['match_id']): card for card in json.load(f)}
+
+    ids = Ids()
+    pages = {}
+    batsmen = [dict(b) for b in division['batsmen'][:12]]
+    # A non-ASCII name with an apostrophe, to check entity and charset handling
+    batsmen[3]['name'] = "José D'Souza"
+    pages['MaxRuns'] = page('MaxRuns', '<h2>Top Batsmen</h2>\n' + grid(
+        'GridView1', ['Rank', 'Name', 'Team', 'Innings', 'Runs', 'Strike Rate'],
+        [[b['rank'], ids.link(b['team'], b['name']), escape(b['team']), b['innings'], b['runs'],
+          f"<span>{b['strike_rate']}</span>"] for b in batsmen], pager=True))
+
+    bowlers = [b for b in division['bowlers'] if is_player_name(b['name'], INVALID_BOWLING_NAMES)][:12]
+    pages['MaxWickets'] = page('MaxWickets', '<h2>Top Bowlers</h2>\n' + grid(
+        'GridView1', ['Rank', 'Name', 'Team', 'Innings', 'Overs', 'Maidens', 'Runs Given', 'Wickets', 'Average'],
+        [[b['rank'], ids.link(b['team'], b['name']), escape(b['team']), b['innings'], b['overs'], b['maidens'],
+          b['runs_given'], b['wickets'], b['average'] or '&nbsp;'] for b in bowlers], pager=True))
+
+    standings = division['standings'][:8]
+    pages['DivHome'] = page('DivHome',
+        '<table width="100%"><tr><td valign="top">\n' +
+        grid('GridView1', ['Team', 'Captain'], [[escape(s['team']), '&nbsp;'] for s in standings[:3]]) +
+        '\n</td><td valign="top">\n' +
+        grid('GridViewOverall', ['Team', 'Rank', 'Matches', 'Won', 'Lost', 'Tie', 'No Result', 'Run Rate', 'Points'],
+             [[f'<a href="TeamHome.aspx?team_id={ids.team(s["team"])}&amp;{QUERY}">{escape(s["team"])}</a>',
+               s['rank'], s['matches'], s['wins'], s['losses'], '0', '0', '4.37', s['points']] for s in standings]) +
+        '\n</td></tr></table>')
+
+    for match_id in MATCH_IDS:
+        pages[f'MatchScorecard_{match_id}'] = scorecard_page(cards[match_id], ids)
+    return pages
+
+
+def main():
+    pages = build(sys.argv[1] if len(sys.argv) > 1 else 'data')
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    for name, text in pages.items():
+        path = os.path.join(PAGES_DIR, f'{name}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"✅ {path}: {len(text.encode()) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
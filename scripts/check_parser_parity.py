@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parser Parity Check - Every backend must read the fixture pages identically
+
+Runs the pages in scripts/fixtures/pages/ (MaxRuns, MaxWickets, DivHome and
+two MatchScorecard pages, rebuilt from the committed Div F data by
+scripts/build_parity_pages.py) through every installed parser backend. For
+each page it compares the tables the scrapers extract (find_tables(...).data()
+and their links) and, for scorecards, the parse_scorecard output, with
+html.parser as the reference. Each backend's partial parse is also compared
+with the baseline: the whole page parsed by html.parser, then
+extract_table_data's rows for the scraper's table_id, or the first
+soup.find_all('table') tables for scorecards. It exits non-zero if anything
+differs or a page yields nothing. No network or cassette is needed.
+
+    python3 -m scripts.check_parser_parity [pages_dir]
+"""
+
+import glob
+import os
+import sys
+from bs4 import BeautifulSoup
+
+# Lets `python3 scripts/check_parser_parity.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import BatsmenScraper, BowlersScraper, StandingsScraper, ScorecardScraper
+from scrapers.parsers import available_backends, find_tables
+from scrapers.scorecard_scraper import parse_scorecard_page
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+# Fixture file prefix -> parse target of the scraper that reads that page
+PAGE_TARGETS = {
+    'MaxRuns': BatsmenScraper.parse_target,
+    'MaxWickets': BowlersScraper.parse_target,
+    'DivHome': StandingsScraper.parse_target,
+    'MatchScorecard': ScorecardScraper.parse_target,
+}
+
+
+def extract(name, body, backend):
+    """Everything the scrapers read from one page, as plain data"""
+    kind, _, match_id = name.partition('_')
+    tables = find_tables(body, backend, PAGE_TARGETS[kind])
+    result = {'tables': [(table.data(), table.data_links()) for table in tables]}
+    if kind == 'MatchScorecard':
+        scorecard = parse_scorecard_page(body, match_id, 8, 66, backend)
+        result['scorecard'] = scorecard.to_dict() if scorecard else None
+    return result
+
+
+def baseline(name, body):
+    """Tables and links as the scrapers read them before partial parsing: the whole page, html.parser"""
+    target = PAGE_TARGETS[name.partition('_')[0]]
+    soup = BeautifulSoup(body, 'html.parser')
+    if target.table_id:
+        # extract_table_data(soup, table_id)
+        table = soup.find('table', {'id': lambda x: x and target.table_id in x})
+        tables = [table] if table else []
+    else:
+        tables = soup.find_all('table')[:target.max_tables]
+
+    result = []
+    for table in tables:
+        rows = [row.find_all(['td', 'th']) for row in table.find_all('tr')[1:]]
+        rows = [cols for cols in rows if cols]
+        links = [[(col.find('a', href=True) or {}).get('href') for col in cols] for cols in rows]
+        result.append(([[col.get_text(strip=True) for col in cols] for cols in rows],
+                       links if target.links else [[None] * len(cols) for cols in rows]))
+    return result
+
+
+def is_empty(result):
+    return not any(rows for rows, _ in result['tables']) or result.get('scorecard', True) is None
+
+
+def run(pages_dir=PAGES_DIR):
+    paths = sorted(glob.glob(os.path.join(pages_dir, '*.html')))
+    if not paths:
+        print(f"❌ No fixture pages in {pages_dir}")
+        return 1
+    backends = available_backends()
+    print(f"📄 {len(paths)} fixture pages, backends: {', '.join(backends)}\n")
+
+    failures = 0
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        with open(path, 'rb') as f:
+            body = f.read()
+        results = {backend: extract(name, body, backend) for backend in backends}
+        reference = results['html.parser']
+        if is_empty(reference):
+            failures += 1
+            print(f"❌ {name}: html.parser found nothing")
+            continue
+        full_page = baseline(name, body)
+        differing = [backend for backend in backends[1:] if results[backend] != reference]
+        partial = [backend for backend in backends if results[backend]['tables'] != full_page]
+        failures += len(differing) + len(partial)
+        rows = sum(len(rows) for rows, _ in reference['tables'])
+        print(f"{'✅' if not differing and not partial else '❌'} {name}: {len(reference['tables'])} tables, {rows} rows"
+              f"{', differs on ' + ', '.join(differing) if differing else ''}"
+              f"{', partial parse != full page on ' + ', '.join(partial) if partial else ''}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1] if len(sys.argv) > 1 else PAGES_DIR))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Postgres Ingest Check - Run the COPY ingest against a local PostgreSQL
+
+Loads data_dir twice into a scratch schema (arcl_ingest_check, dropped
+afterwards unless --keep) and checks:
+
+- every file's job completed and is recorded in scrape_jobs
+- row counts per table match the SQLite store loaded from the same files
+- the second run inserts nothing new: upserts update, detail rows are replaced
+
+    DATABASE_URL=postgresql://localhost/postgres python3 -m scripts.check_postgres_ingest [data_dir] [--keep]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Lets `python3 scripts/check_postgres_ingest.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.postgres_ingest import HAS_PSYCOPG, PostgresIngest, DETAIL_TABLES
+from scrapers.sqlite_store import SQLiteStore
+
+SCHEMA = 'arcl_ingest_check'
+
+TABLES = ('divisions', 'teams', 'players', 'batting_stats', 'bowling_stats', 'matches', 'scorecards',
+          'innings_details', 'bowling_details')
+
+
+def table_counts(execute):
+    return {table: execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in TABLES}
+
+
+def run(data_dir='data', keep=False):
+    if not HAS_PSYCOPG or not os.environ.get('DATABASE_URL'):
+        print('⏭️  Needs psycopg 3 and DATABASE_URL pointing at a local PostgreSQL')
+        return 2
+
+    ingest = PostgresIngest(schema=SCHEMA, create_schema=False)
+    ingest.conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    ingest.close()
+
+    runs = []
+    for _ in range(2):
+        ingest = PostgresIngest(schema=SCHEMA)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            jobs = ingest.ingest_dir(data_dir)
+        runs.append((time.perf_counter() - start, jobs))
+        counts = table_counts(ingest.conn.execute)
+        recorded = ingest.conn.execute(
+            "SELECT COUNT(*) FILTER (WHERE status = 'completed'), COUNT(*) FROM scrape_jobs").fetchone()
+        if len(runs) == 1:
+            first_counts = counts
+        ingest.close()
+
+    sqlite = SQLiteStore(':memory:')
+    with contextlib.redirect_stdout(io.StringIO()):
+        sqlite.load_dir(data_dir)
+    expected = table_counts(sqlite.conn.execute)
+    sqlite.close()
+
+    failures = 0
+    for label, ok in (
+            ("All files completed", all(job['status'] == 'completed' for _, jobs in runs for job in jobs)),
+            ("scrape_jobs has every file of both runs",
+             recorded == (2 * len(runs[0][1]), 2 * len(runs[0][1]))),
+            ("Row counts match the SQLite store", counts == expected),
+            ("Second run left row counts unchanged", counts == first_counts),
+            ("Second run inserted no upserted rows",
+             all(merged['inserted'] == 0 for job in runs[1][1]
+                 for table, merged in job['tables'].items() if table not in DETAIL_TABLES))):
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {label}")
+
+    print(f"\n{'table':<18} {'rows':>8}")
+    for table, rows in counts.items():
+        print(f"{table:<18} {rows:>8}{'' if rows == expected[table] else f'  (sqlite {expected[table]})'}")
+    for label, (seconds, jobs) in zip(('first', 'second'), runs):
+        staged = sum(job['staged'] for job in jobs)
+        copy = sum(job['seconds'].get('copy', 0) for job in jobs)
+        merge = sum(job['seconds'].get('merge', 0) for job in jobs)
+        print(f"\n🐘 {label} run: {staged} rows in {seconds:.2f}s (COPY {copy:.2f}s, merge {merge:.2f}s, "
+              f"{staged / seconds:.0f} rows/s)")
+
+    if not keep:
+        ingest = PostgresIngest(schema=SCHEMA, create_schema=False)
+        ingest.conn.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+        ingest.close()
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    sys.exit(run(args[0] if args else 'data', keep='--keep' in sys.argv))
@@ -7,11 +7,16 @@ Helps analyze opponent teams to identify:
 - Dangerous bowlers to be careful against
 """
 
-import requests
+import os
+import sys
+
+# Lets `python3 scripts/opponent_analyzer.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from bs4 import BeautifulSoup
+from scrapers.transport import get_default_transport
 import json
 from typing import Dict, List
-import sys
 
 class OpponentAnalyzer:
     """Analyze opponent teams from ARCL website"""
@@ -26,10 +31,7 @@ class OpponentAnalyzer:
         """
         self.division_id = division_id
         self.season_id = season_id
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.transport = get_default_transport()
     
     def get_division_teams(self) -> List[str]:
         """Get all teams in the division"""
@@ -39,7 +41,7 @@ class OpponentAnalyzer:
         params = {"league_id": self.division_id, "season_id": self.season_id}
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.transport.get(url, params=params)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -71,7 +73,7 @@ class OpponentAnalyzer:
         params = {"league_id": self.division_id, "season_id": self.season_id}
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.transport.get(url, params=params)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -115,7 +117,7 @@ class OpponentAnalyzer:
         params = {"league_id": self.division_id, "season_id": self.season_id}
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.transport.get(url, params=params)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
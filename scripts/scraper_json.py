@@ -4,16 +4,21 @@ ARCL Data Scraper for GitHub Actions
 Scrapes division data and outputs JSON files
 """
 
-import requests
+import os
+import sys
+
+# Lets `python3 scripts/scraper_json.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from bs4 import BeautifulSoup
+from scrapers.transport import get_default_transport
 import json
-import os
 from datetime import datetime
 
 class ARCLScraper:
     def __init__(self):
         self.base_url = "https://arcl.org"
-        self.session = requests.Session()
+        self.transport = get_default_transport()
     
     def scrape_division(self, division_id, season_id, division_name):
         """Scrape all data for a division and save to JSON"""
@@ -48,7 +53,7 @@ class ARCLScraper:
         url = f"{self.base_url}/Pages/UI/LeagueTeams.aspx?league_id={division_id}&season_id={season_id}"
         
         try:
-            response = self.session.get(url)
+            response = self.transport.get(url)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             teams = []
@@ -71,7 +76,7 @@ class ARCLScraper:
         url = f"{self.base_url}/Pages/UI/MaxRuns.aspx?league_id={division_id}&season_id={season_id}"
         
         try:
-            response = self.session.get(url)
+            response = self.transport.get(url)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             batsmen = []
@@ -106,7 +111,7 @@ class ARCLScraper:
         url = f"{self.base_url}/Pages/UI/MaxWickets.aspx?league_id={division_id}&season_id={season_id}"
         
         try:
-            response = self.session.get(url)
+            response = self.transport.get(url)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             bowlers = []
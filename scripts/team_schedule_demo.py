@@ -4,6 +4,12 @@ Team Schedule Demo - Show how to use the schedule scraper for team-specific insi
 """
 
 import json
+import os
+import sys
+
+# Lets `python3 scripts/team_schedule_demo.py` find the scrapers package in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from scrapers import ScheduleScraper
 
 